@@ -1,11 +1,91 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, url_for
 from backend.Grafico import calcular_region_factible
-from backend.Doblefase import two_phase_method_fixed
+from backend.Doblefase import (two_phase_method_fixed, two_phase_method_batch, resolve_from_basis,
+                               parametric_method, TRACE_MODES, PARAMETRIC_TARGETS)
+from backend.Revisado import revised_simplex_method
+from backend.Pricing import PRICING_RULES
+from backend.FormaEstandar import (construir_forma_estandar, forma_simplex_dual, codificar_base, decodificar_base,
+                                   leer_cotas, desplazar_inferiores, invertir_filas, datos_originales,
+                                   solucion_desde_x)
+from backend.Ejecutor import SolveExecutor, ExecutorError, ExecutorBusy, SolveTimeout, WorkerCrashed
+from backend.Trabajos import JobManager
+from backend.Cache import ResultCache, clave_problema
+from backend.Presolve import presolve_restricciones, postsolve, conteo_forma
+from backend.Escalado import requiere_escalado, escalar_restricciones, desescalar_solucion, desescalar_sensibilidad
+from backend.Imagen import renderizar_region, FORMATOS_IMAGEN
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import scipy.sparse as sp
+import logging
 import os
 
+# Nivel de log configurable (DEBUG muestra tableaus e iteraciones del solver)
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__, template_folder='frontend', static_folder='frontend')
 
+# Por encima de este tamaño de tableau (celdas) la traza por defecto es 'summary'
+TRAZA_FULL_MAX_CELDAS = 10000
+
+# Pool de procesos para los solvers (SOLVER_WORKERS, SOLVER_MAX_QUEUE, SOLVER_TIMEOUT...).
+# Con gunicorn, SOLVER_WORKERS por defecto se reparte entre los workers web (ver gunicorn.conf.py)
+executor = SolveExecutor.from_env()
+
+# Caché de respuestas de /resolver (RESULT_CACHE_ENTRIES, RESULT_CACHE_MB, RESULT_CACHE_PATH...)
+cache = ResultCache.from_env()
+
+# Solo se guardan respuestas deterministas: 200 y los 400 de validación,
+# infactibilidad o no acotamiento. No se guardan los 500/503/504 del pool ni
+# los 400 de una excepción del solver (estado ESTADO_ERROR_CALCULO), que
+# puede ser transitoria (p.ej. MemoryError en el worker)
+CACHE_STATUS = (200, 400)
+ESTADO_ERROR_CALCULO = "Error en cálculo"
+
+# Errores del pool (no del problema): se propagan hasta respuesta_ejecutor
+ERRORES_EJECUTOR = (ExecutorError, WorkerCrashed)
+
+# Caché LRU de imágenes de /resolver/plot (PLOT_CACHE_ENTRIES, PLOT_CACHE_MB, PLOT_CACHE_PATH...)
+plot_cache = ResultCache.from_env("PLOT_CACHE")
+
+
+def respuesta_ejecutor(e, tipo):
+    """Respuesta (payload, status, headers) para los errores del pool de solvers."""
+    if isinstance(e, WorkerCrashed):
+        return {
+            "error": str(e),
+            "tipo": tipo,
+            "estado": "Error del servidor"
+        }, 500, {}
+    if isinstance(e, ExecutorBusy):
+        return {
+            "error": str(e),
+            "tipo": tipo,
+            "estado": "Servidor ocupado"
+        }, 503, {"Retry-After": "1"}
+    return {
+        "error": str(e),
+        "tipo": tipo,
+        "estado": "Tiempo agotado"
+    }, 504, {}
+
+
+def es_cacheable(payload, status):
+    """True si la respuesta de /resolver depende solo del problema (ver CACHE_STATUS)."""
+    return status in CACHE_STATUS and payload.get("estado") != ESTADO_ERROR_CALCULO
+
+
+@app.errorhandler(ExecutorBusy)
+@app.errorhandler(SolveTimeout)
+@app.errorhandler(WorkerCrashed)
+def solver_no_disponible(e):
+    data = request.get_json(silent=True) or {}
+    return respuesta_ejecutor(e, data.get('tipo', 'max'))
+
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -13,12 +93,211 @@ def index():
 @app.route('/resolver', methods=['POST'])
 def resolver():
     data = request.json
-    
+    if not cache.enabled:
+        return resolver_problema(data)
+
+    clave = clave_problema(data)
+    entrada = cache.get(clave)
+    if entrada is not None:
+        cuerpo, status = entrada
+        return app.response_class(cuerpo, status=status, mimetype="application/json",
+                                  headers={"X-Cache": "HIT"})
+
+    respuesta = resolver_problema(data)
+    payload, status = respuesta if isinstance(respuesta, tuple) else (respuesta, 200)
+    resp = jsonify(payload)
+    resp.status_code = status
+    if es_cacheable(payload, status):
+        cache.put(clave, resp.get_data(), status)
+    resp.headers["X-Cache"] = "MISS"
+    return resp
+
+
+@app.route('/resolver/reoptimizar', methods=['POST'])
+def reoptimizar():
+    """
+    Re-resuelve un problema Doble Fase con la "base" que devolvió /resolver.
+    Si solo cambiaron los costos se omite la Fase 1; si solo cambió el LD se
+    usa el simplex dual. Si cambiaron las restricciones se resuelve desde cero.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not data.get('base'):
+        return {"error": "Se requiere la 'base' devuelta por /resolver"}, 400
+    if data.get('metodo', 'doblefase') != 'doblefase':
+        return {"error": "La re-resolución solo está disponible para el método doblefase"}, 400
+    return resolver_problema(dict(data, metodo='doblefase'))
+
+
+@app.route('/resolver/parametrico', methods=['POST'])
+def resolver_parametrico():
+    """
+    Análisis paramétrico de un problema Doble Fase: con "parametrico":
+    {"objetivo": "costos" | "ld", "direccion": [...], "desde": t0, "hasta": t1}
+    recorre c + t*d (o b + t*d) en [t0, t1] y retorna los tramos de base
+    óptima, los puntos de quiebre y el valor óptimo lineal por tramos.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get('parametrico'), dict):
+        return {"error": "Se requiere 'parametrico' con objetivo, direccion, desde y hasta"}, 400
+    tipo = data.get('tipo', 'max')
+    mode = 0 if tipo == 'min' else 1
+    parametro = data['parametrico']
+    objetivo = parametro.get('objetivo', 'costos')
+    if objetivo not in PARAMETRIC_TARGETS:
+        return {"error": f"Objetivo '{objetivo}' no reconocido (usar {', '.join(PARAMETRIC_TARGETS)})", "tipo": tipo}, 400
+    try:
+        n = int(data.get('variables', 2))
+        restricciones_data = data.get('restricciones', [])
+        m = len(restricciones_data)
+        b = np.array([float(r['c']) for r in restricciones_data], dtype=float)
+        t0 = float(parametro.get('desde', 0.0))
+        t1 = float(parametro.get('hasta', 1.0))
+        direccion = np.asarray(parametro.get('direccion', []), dtype=float)
+        largo = n if objetivo == 'costos' else m
+        if direccion.shape != (largo,):
+            return {"error": f"La dirección debe tener {largo} valores", "tipo": tipo}, 400
+        if t1 < t0:
+            return {"error": "El intervalo debe cumplir desde <= hasta", "tipo": tipo}, 400
+
+        # Las filas con LD negativo en t0 se multiplican por -1 (<= pasa a >=)
+        # para que la base inicial de la Fase 1 sea factible
+        invertidas = (b + t0 * direccion if objetivo == 'ld' else b) < 0
+        forma = construir_forma_estandar(invertir_filas(restricciones_data, n, invertidas),
+                                         data.get('coeficientes', []), n, mode=mode)
+    except (TypeError, ValueError, KeyError) as e:
+        return {"error": f"Datos no válidos: {e}", "tipo": tipo}, 400
+
+    # Dirección sobre todas las columnas (costos) o las filas ya orientadas (LD) y problema en t0
+    if objetivo == 'costos':
+        d = np.zeros(forma["total_vars"])
+        d[:n] = direccion
+        c0, b0 = forma["c_final"] + t0 * d, forma["b"]
+    else:
+        d = np.where(invertidas, -direccion, direccion)
+        c0, b0 = forma["c_final"], forma["b"] + t0 * d
+
+    try:
+        solution, _, _, info = executor.run(
+            two_phase_method_fixed, forma["A"], b0, c0, forma["var_names"],
+            forma["basic_vars_init"], forma["basic_costs_init"], forma["artificial_indices"],
+            mode=mode, trace='none', return_info=True, timeout=data.get('tiempo_limite')
+        )
+        if solution is None:
+            return {
+                "error": f"El problema es infactible o no acotado en t = {t0:g}",
+                "tipo": tipo,
+                "estado": "Infactible"
+            }, 400
+        tramos, limite = executor.run(
+            parametric_method, forma["A"], forma["b"], forma["c_final"], forma["var_names"], info["basis"],
+            forma["artificial_indices"], d, t0, t1, objetivo=objetivo, mode=mode,
+            timeout=data.get('tiempo_limite')
+        )
+    except ERRORES_EJECUTOR:
+        raise
+    except Exception as e:
+        logger.exception("Error en análisis paramétrico: %s", e)
+        return {
+            "error": str(e),
+            "detalles": getattr(e, "detalles", None),
+            "tipo": tipo,
+            "estado": ESTADO_ERROR_CALCULO
+        }, 400
+
+    for tramo in tramos:
+        tramo["x_desde"] = tramo["x_desde"][:n]
+        tramo["x_hasta"] = tramo["x_hasta"][:n]
+    return {
+        "tipo": tipo,
+        "estado": "Óptimo encontrado",
+        "parametrico": {"objetivo": objetivo, "direccion": direccion.tolist(), "desde": t0, "hasta": t1},
+        "tramos": tramos,
+        "puntos_quiebre": [tramo["hasta"] for tramo in tramos[:-1]],
+        "limite": limite,
+        "problema_info": {
+            "variables_originales": n,
+            "restricciones": m,
+            "mode": mode,
+            "cambios_base": sum(1 for tramo in tramos if tramo["entra"] is not None)
+        }
+    }
+
+
+@app.route('/resolver/cache', methods=['GET'])
+def estado_cache():
+    return cache.stats()
+
+
+@app.route('/resolver/plot', methods=['POST'])
+def resolver_plot():
+    """
+    Imagen del método gráfico renderizada en el servidor: mismo formato que
+    /resolver (metodo grafico) más "formato": "png" (por defecto) | "svg".
+    Las imágenes se guardan en una caché LRU por hash del problema.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return {"error": "Se requiere un problema en formato JSON"}, 400
+    tipo = data.get('tipo', 'max')
+    if data.get('metodo', 'grafico') != 'grafico':
+        return {"error": "La imagen solo está disponible para el método gráfico", "tipo": tipo}, 400
+    formato = str(data.get('formato', 'png')).lower()
+    if formato not in FORMATOS_IMAGEN:
+        return {
+            "error": f"Formato no válido: {formato} (opciones: {', '.join(FORMATOS_IMAGEN)})",
+            "tipo": tipo
+        }, 400
+
+    data = dict(data, metodo='grafico', formato=formato)
+    clave = clave_problema(data)
+    entrada = plot_cache.get(clave) if plot_cache.enabled else None
+    if entrada is not None:
+        return app.response_class(entrada[0], mimetype=FORMATOS_IMAGEN[formato], headers={"X-Cache": "HIT"})
+
+    respuesta = resolver_problema(data)
+    if isinstance(respuesta, tuple):
+        return respuesta
+    try:
+        imagen = executor.run(renderizar_region, respuesta, formato, timeout=data.get('tiempo_limite'))
+    except ERRORES_EJECUTOR:
+        raise
+    except Exception as e:
+        # La región ya se calculó: una falla aquí es del render, no del problema
+        logger.exception("Error al generar la imagen: %s", e)
+        return {
+            "error": str(e),
+            "detalles": getattr(e, "detalles", None),
+            "tipo": tipo,
+            "estado": "Error al generar la imagen"
+        }, 500
+    if plot_cache.enabled:
+        plot_cache.put(clave, imagen, 200)
+    return app.response_class(imagen, mimetype=FORMATOS_IMAGEN[formato], headers={"X-Cache": "MISS"})
+
+
+def resolver_problema(data, progress=None, pool=None):
+    """
+    Resuelve un problema con el formato de /resolver y retorna la respuesta
+    como la devolvería la vista: un dict o una tupla (dict, status).
+    progress: callback opcional de avance para los métodos simplex.
+    pool: SolveExecutor a usar (por defecto el de /resolver).
+    """
+    pool = pool or executor
     metodo = data.get('metodo', 'grafico')
     contador_variables = int(data.get('variables', 2))
     coeficientes = data.get('coeficientes', [])
     tipo = data.get('tipo', 'max')
     restricciones_data = data.get('restricciones', [])
+    traza = data.get('traza')  # none | summary | full | delta
+    tiempo_limite = data.get('tiempo_limite')  # segundos, acotado por SOLVER_MAX_TIMEOUT
+    base_previa = data.get('base')  # identificador de base de una resolución anterior (doblefase)
+    algoritmo = data.get('algoritmo', 'auto')  # doblefase: auto | doblefase | dual
+    sensibilidad = bool(data.get('sensibilidad', True))  # doblefase: precios sombra y rangos
+    pricing = data.get('pricing', 'dantzig')  # doblefase: regla de pivote (ver PRICING_RULES)
+    harris = bool(data.get('harris', False))  # doblefase: test del cociente de Harris
+    usar_presolve = bool(data.get('presolve', False))  # doblefase: reducir el problema antes del simplex
+    escalado = data.get('escalado')  # doblefase: auto | true | false (escalado de filas y columnas)
+    cotas = data.get('cotas')  # doblefase: [[l, u], ...] por variable (simplex con variables acotadas)
     
     # Convertir tipo a modo para doble fase
     mode = 0 if tipo == 'min' else 1  # 0=minimización, 1=maximización
@@ -26,10 +305,10 @@ def resolver():
     if metodo == 'grafico':
         # Método Gráfico - solo funciona con 2 variables
         if contador_variables != 2:
-            return jsonify({
+            return {
                 "error": "El método gráfico solo funciona con 2 variables",
                 "tipo": tipo
-            }), 400
+            }, 400
         
         p = float(coeficientes[0]) if len(coeficientes) > 0 else 0.1
         q = float(coeficientes[1]) if len(coeficientes) > 1 else 0.08
@@ -39,10 +318,10 @@ def resolver():
         for restriccion in restricciones_data:
             coefs = restriccion['coeficientes']
             if len(coefs) != 2:
-                return jsonify({
+                return {
                     "error": "El método gráfico requiere exactamente 2 variables por restricción",
                     "tipo": tipo
-                }), 400
+                }, 400
             a = float(coefs[0])
             b = float(coefs[1])
             c = float(restriccion['c'])
@@ -61,290 +340,696 @@ def resolver():
         
         # Calcular usando el método gráfico
         try:
-            resultado = calcular_region_factible(restricciones, (p, q, tipo))
+            resultado = pool.run(calcular_region_factible, restricciones, (p, q, tipo),
+                                  timeout=tiempo_limite)
             resultado["tipo"] = tipo
-            return jsonify(resultado)
+            return resultado
+        except ERRORES_EJECUTOR:
+            raise
         except Exception as e:
-            return jsonify({
+            return {
                 "error": str(e),
-                "tipo": tipo
-            }), 400
+                "tipo": tipo,
+                "estado": ESTADO_ERROR_CALCULO
+            }, 400
     
     elif metodo == 'doblefase':
         # Método Doble Fase - CORREGIDO
         try:
             m = len(restricciones_data)  # Número de restricciones
             n = contador_variables  # Número de variables originales
-            
-            print(f"\n=== CONSTRUYENDO PROBLEMA DOBLE FASE ===")
-            print(f"Variables originales: {n}")
-            print(f"Restricciones: {m}")
-            print(f"Tipo: {tipo} (mode={mode})")
-            
-            # ==============================================
-            # 1. CONTAR VARIABLES ADICIONALES CORRECTAMENTE
-            # ==============================================
-            slack_count = 0      # Variables de holgura (≤)
-            excess_count = 0     # Variables de exceso (≥)
-            artificial_count = 0 # Variables artificiales (≥ y =)
-            
-            for i, restriccion in enumerate(restricciones_data):
-                signo = restriccion['signo']
-                print(f"R{i+1}: signo={signo}")
-                
-                if signo == 'leq':
-                    slack_count += 1
-                elif signo == 'geq':
-                    excess_count += 1
-                    artificial_count += 1
-                elif signo == 'eq':
-                    artificial_count += 1
-            
-            total_vars = n + slack_count + excess_count + artificial_count
-            print(f"Variables totales: {total_vars} (x:{n}, s:{slack_count}, e:{excess_count}, A:{artificial_count})")
-            
+
+            logger.debug("Doble fase: %d variables, %d restricciones, tipo=%s (mode=%d)", n, m, tipo, mode)
+
+            restricciones_solver, coeficientes_solver, n_solver = restricciones_data, coeficientes, n
+
             # ==============================================
-            # 2. CONSTRUIR MATRIZ A CORRECTAMENTE
+            # 0. COTAS POR VARIABLE (opcional)
             # ==============================================
-            A = np.zeros((m, total_vars), dtype=float)
-            b = np.zeros(m, dtype=float)
-            
-            # Índices para cada tipo de variable
-            slack_idx = n
-            excess_idx = n + slack_count
-            art_idx = n + slack_count + excess_count
-            
-            # Para rastrear qué variable es básica en cada fila
-            basic_var_indices = []
-            artificial_indices = []
-            
-            # Contadores para cada tipo
-            s_used = 0
-            e_used = 0
-            a_used = 0
-            
-            for i, restriccion in enumerate(restricciones_data):
-                coefs = restriccion['coeficientes']
-                c_val = float(restriccion['c'])
-                signo = restriccion['signo']
-                
-                print(f"\nProcesando restricción {i+1}: {signo}")
-                
-                # Variables originales
-                for j in range(n):
-                    if j < len(coefs):
-                        A[i, j] = float(coefs[j])
-                    else:
-                        A[i, j] = 0.0
-                
-                # Variables adicionales según el tipo
-                if signo == 'leq':
-                    # ≤ → Agrega HOLGURA (+1)
-                    col_idx = slack_idx + s_used
-                    A[i, col_idx] = 1.0
-                    basic_var_indices.append(col_idx)  # La holgura es básica
-                    s_used += 1
-                    print(f"  + Holgura s{s_used} en columna {col_idx}")
-                    
-                elif signo == 'geq':
-                    # ≥ → Agrega EXCESO (-1) y ARTIFICIAL (+1)
-                    # Exceso
-                    e_col = excess_idx + e_used
-                    A[i, e_col] = -1.0
-                    e_used += 1
-                    
-                    # Artificial
-                    a_col = art_idx + a_used
-                    A[i, a_col] = 1.0
-                    artificial_indices.append(a_col)
-                    basic_var_indices.append(a_col)  # La artificial es básica
-                    a_used += 1
-                    print(f"  - Exceso e{e_used} en columna {e_col}")
-                    print(f"  + Artificial A{a_used} en columna {a_col}")
-                    
-                elif signo == 'eq':
-                    # = → Solo ARTIFICIAL (+1)
-                    a_col = art_idx + a_used
-                    A[i, a_col] = 1.0
-                    artificial_indices.append(a_col)
-                    basic_var_indices.append(a_col)  # La artificial es básica
-                    a_used += 1
-                    print(f"  + Artificial A{a_used} en columna {a_col}")
-                
-                b[i] = c_val
-            
+            # x = l + x' con 0 <= x' <= u - l; las cotas superiores no agregan
+            # filas, las maneja el simplex con variables acotadas. Sin base
+            # reutilizable ni sensibilidad (asumen no básicas en 0)
+            inferiores = superiores = None
+            if cotas is not None:
+                try:
+                    inferiores, superiores = leer_cotas(cotas, n)
+                except (TypeError, ValueError) as e:
+                    return {
+                        "error": f"Cotas no válidas: {e}",
+                        "tipo": tipo
+                    }, 400
+                restricciones_solver = desplazar_inferiores(restricciones_data, n, inferiores)
+                superiores = superiores - inferiores
+                if inferiores.any() or np.isfinite(superiores).any():
+                    sensibilidad = False
+
             # ==============================================
-            # 3. NOMBRES DE VARIABLES
+            # 0a. PRESOLVE (opcional)
             # ==============================================
-            var_names = []
-            
-            # Variables originales
-            for j in range(n):
-                var_names.append(f"x{j+1}")
-            
-            # Variables de holgura
-            for j in range(slack_count):
-                var_names.append(f"s{j+1}")
-            
-            # Variables de exceso
-            for j in range(excess_count):
-                var_names.append(f"e{j+1}")
-            
-            # Variables artificiales
-            for j in range(artificial_count):
-                var_names.append(f"A{j+1}")
-            
-            print(f"\nNombres de variables: {var_names}")
-            print(f"Índices artificiales: {artificial_indices}")
-            
+            # Las tablas y la base corresponden al problema reducido; la
+            # sensibilidad solo se reporta si el presolve no cambió nada
+            pre = None
+            if usar_presolve:
+                pre = presolve_restricciones(restricciones_solver, coeficientes, n, mode=mode, superiores=superiores)
+                if pre["estado"]:
+                    return {
+                        "error": "Problema infactible o no acotado",
+                        "tipo": tipo,
+                        "estado": pre["estado"],
+                        "presolve": pre["stats"],
+                        "tablas": []
+                    }, 400
+                if pre["reducido"]:
+                    restricciones_solver = pre["restricciones"]
+                    coeficientes_solver = pre["coeficientes"]
+                    n_solver = len(pre["columnas"])
+                    if superiores is not None:
+                        superiores = pre["superiores"]
+                    sensibilidad = False
+                    if n_solver == 0 or not restricciones_solver:
+                        # Todo se resolvió en el presolve
+                        x, Z, solution = postsolve(pre, np.zeros(n_solver))
+                        if inferiores is not None:
+                            Z, solution = solucion_desde_x(*datos_originales(restricciones_data, coeficientes, n),
+                                                           x + inferiores)
+                        return formatear_doblefase(solution, Z, [], conteo_forma([r['signo'] for r in restricciones_data], n),
+                                                   n, m, mode, tipo, traza or 'none',
+                                                   info_extra={"algoritmo": "presolve", "presolve": pre["stats"]})
+
+            # Las columnas conservadas mantienen el nombre de la variable original
+            nombres_x = [f"x{j+1}" for j in pre["columnas"]] if n_solver != n else None
+
             # ==============================================
-            # 4. VECTOR DE COSTOS PARA FASE 2
+            # 0b. ESCALADO (media geométrica + equilibrado)
             # ==============================================
-            c_final = np.zeros(total_vars, dtype=float)
-            
-            # Costos de variables originales
-            for j in range(n):
-                if j < len(coeficientes):
-                    c_final[j] = float(coeficientes[j])
-                else:
-                    c_final[j] = 0.0
-            
-            # El resto (holguras, excesos, artificiales) tienen costo 0 en Fase 2
-            for j in range(n, total_vars):
-                c_final[j] = 0.0
-            
-            print(f"Vector de costos (Fase 2): {c_final}")
-            
+            # Con "auto" solo si los coeficientes abarcan varios órdenes de
+            # magnitud. Las tablas quedarían en unidades escaladas (la solución
+            # y Z no), así que por defecto solo se escala con traza 'none';
+            # problema_info.escalado indica cuándo se aplicó
+            if escalado is None:
+                escalado = 'auto' if traza == 'none' else False
+            if escalado not in ('auto', True, False):
+                return {
+                    "error": "Escalado debe ser 'auto', true o false",
+                    "tipo": tipo
+                }, 400
+            esc = None
+            if escalado is True or (escalado == 'auto' and requiere_escalado(restricciones_solver, n_solver)):
+                esc = escalar_restricciones(restricciones_solver, coeficientes_solver, n_solver, nombres=nombres_x)
+                restricciones_solver, coeficientes_solver = esc["restricciones"], esc["coeficientes"]
+                if superiores is not None:
+                    superiores = superiores / esc["S"]
+
             # ==============================================
-            # 5. VARIABLES BÁSICAS INICIALES Y COSTOS
+            # 1. FORMA ESTÁNDAR (holguras, excesos y artificiales)
             # ==============================================
-            basic_vars_init = []
-            basic_costs_init = []
-            
-            for i, basic_idx in enumerate(basic_var_indices):
-                if i < len(var_names):
-                    var_name = var_names[basic_idx]
-                    basic_vars_init.append(var_name)
-                    
-                    # Determinar costo
-                    if var_name.startswith('A'):  # Es artificial
-                        # PARA MAXIMIZACIÓN: costo = -1
-                        # PARA MINIMIZACIÓN: costo = +1
-                        costo = -1.0 if mode == 1 else 1.0
-                        basic_costs_init.append(costo)
-                        print(f"Variable básica {i+1}: {var_name} (artificial) con costo {costo}")
-                    else:  # Holgura (no artificial)
-                        basic_costs_init.append(0.0)
-                        print(f"Variable básica {i+1}: {var_name} (holgura) con costo 0")
-                else:
-                    basic_vars_init.append(f"R{i+1}")
-                    basic_costs_init.append(0.0)
-            
-            print(f"Variables básicas iniciales: {basic_vars_init}")
-            print(f"Costos básicos iniciales: {basic_costs_init}")
-            
+            forma = construir_forma_estandar(restricciones_solver, coeficientes_solver, n_solver, mode=mode)
+            if nombres_x is not None:
+                forma["var_names"][:n_solver] = nombres_x
+            upper = None
+            if superiores is not None and np.isfinite(superiores).any():
+                upper = np.full(forma["total_vars"], np.inf)
+                upper[:n_solver] = superiores
+            slack_count = forma["slack_count"]
+            excess_count = forma["excess_count"]
+            artificial_count = forma["artificial_count"]
+            total_vars = forma["total_vars"]
+            logger.debug("Variables totales: %d (x:%d, s:%d, e:%d, A:%d)",
+                         total_vars, n_solver, slack_count, excess_count, artificial_count)
+
+            if traza is None:
+                traza = 'full' if m * total_vars <= TRAZA_FULL_MAX_CELDAS else 'summary'
+            elif traza not in TRACE_MODES:
+                return {
+                    "error": f"Traza '{traza}' no reconocida (usar {', '.join(TRACE_MODES)})",
+                    "tipo": tipo
+                }, 400
+            if pricing not in PRICING_RULES:
+                return {
+                    "error": f"Pricing '{pricing}' no reconocido (usar {', '.join(PRICING_RULES)})",
+                    "tipo": tipo
+                }, 400
+
             # ==============================================
-            # 6. MOSTRAR MATRIZ COMPLETA PARA DEBUG
+            # 2. BASE INICIAL (arranque en caliente o simplex dual)
             # ==============================================
-            print(f"\n=== MATRIZ COMPLETA A ===")
-            print(f"Forma: {A.shape}")
-            for i in range(m):
-                row_str = f"R{i+1}: "
-                for j in range(total_vars):
-                    row_str += f"{A[i,j]:7.2f} "
-                row_str += f" = {b[i]:7.2f}"
-                print(row_str)
-            
+            reoptimizado = None
+            info_extra = None
+            forma_salida = forma
+            if base_previa is not None:
+                basis = decodificar_base(base_previa, forma["A"])
+                if basis is not None and upper is None:
+                    reoptimizado = pool.run(
+                        resolve_from_basis,
+                        forma["A"],
+                        forma["b"],
+                        forma["c_final"],
+                        forma["var_names"],
+                        basis,
+                        forma["artificial_indices"],
+                        mode=mode,
+                        trace=traza,
+                        identity_cols=forma["basic_idx"] if sensibilidad else None,
+                        pricing=pricing,
+                        harris=harris,
+                        timeout=tiempo_limite,
+                        progress=progress
+                    )
+                info_extra = {"arranque": "frio", "iteraciones_reoptimizacion": None}
+
+            # Simplex dual desde la base de holguras: sin artificiales ni Fase 1
+            # (p.ej. minimización con restricciones >= y costos no negativos)
+            elif algoritmo in ('auto', 'dual') and forma["artificial_count"] > 0:
+                dual = forma_simplex_dual(forma, mode=mode) if upper is None else None
+                if dual is not None:
+                    reoptimizado = pool.run(
+                        resolve_from_basis,
+                        dual["A"],
+                        dual["b"],
+                        dual["c_final"],
+                        dual["var_names"],
+                        dual["basic_idx"],
+                        dual["artificial_indices"],
+                        mode=mode,
+                        trace=traza,
+                        titulo="Base de holguras (simplex dual)",
+                        identity_cols=dual["basic_idx"] if sensibilidad else None,
+                        row_signs=dual["orientacion"],
+                        pricing=pricing,
+                        harris=harris,
+                        timeout=tiempo_limite,
+                        progress=progress
+                    )
+                if reoptimizado is not None:
+                    forma_salida = dual
+                elif algoritmo == 'dual':
+                    return {
+                        "error": "El simplex dual requiere restricciones <= / >=, una base de holguras dual factible "
+                                 "y variables sin cota superior",
+                        "tipo": tipo
+                    }, 400
+
+            elif algoritmo not in ('auto', 'doblefase', 'dual'):
+                return {
+                    "error": f"Algoritmo '{algoritmo}' no reconocido (usar auto, doblefase o dual)",
+                    "tipo": tipo
+                }, 400
+
             # ==============================================
-            # 7. LLAMAR AL MÉTODO DOBLE FASE
+            # 3. LLAMAR AL MÉTODO DOBLE FASE
             # ==============================================
-            print(f"\n=== LLAMANDO two_phase_method_fixed ===")
-            solution, Z, all_tables = two_phase_method_fixed(
-                A.tolist(), 
-                b.tolist(), 
-                c_final.tolist(), 
-                var_names, 
-                basic_vars_init, 
-                basic_costs_init, 
-                artificial_indices, 
-                mode=mode
-            )
+            if reoptimizado is not None:
+                solution, Z, all_tables, info = reoptimizado
+                if base_previa is not None:
+                    info_extra = {"arranque": info["metodo"], "iteraciones_reoptimizacion": info["iteraciones"]}
+                else:
+                    info_extra = {"algoritmo": f"simplex {info['metodo']}", "iteraciones": info["iteraciones"]}
+            else:
+                solution, Z, all_tables, info = pool.run(
+                    two_phase_method_fixed,
+                    forma["A"],
+                    forma["b"],
+                    forma["c_final"],
+                    forma["var_names"],
+                    forma["basic_vars_init"],
+                    forma["basic_costs_init"],
+                    forma["artificial_indices"],
+                    mode=mode,
+                    trace=traza,
+                    return_info=True,
+                    sensitivity=sensibilidad,
+                    pricing=pricing,
+                    harris=harris,
+                    upper=upper,
+                    timeout=tiempo_limite,
+                    progress=progress
+                )
+                info_extra = dict(info_extra or {}, algoritmo="doble fase")
+
+            # Iteraciones y estadísticas del pricing para comparar reglas
+            info_extra.update({k: info[k] for k in ("pricing", "harris", "iteraciones_fase1", "iteraciones_fase2",
+                                                    "pivotes_degenerados", "activaciones_bland", "saltos_cota")
+                               if k in info})
             
             if solution is None:
-                return jsonify({
+                return {
                     "error": "Problema infactible o no acotado",
                     "tipo": tipo,
                     "estado": "Infactible",
                     "tablas": all_tables if 'all_tables' in locals() else []
-                }), 400
+                }, 400
             
             # ==============================================
-            # 8. FORMATEAR SOLUCIÓN
+            # 4. DESESCALAR, POSTSOLVE Y FORMATEAR SOLUCIÓN
             # ==============================================
-            solucion_formateada = []
-            for j in range(n):
-                var_name = f"x{j+1}"
-                valor = solution.get(var_name, 0.0)
-                solucion_formateada.append({
-                    "variable": var_name,
-                    "valor": float(valor)
-                })
-            
-            # También mostrar valores de holgura/exceso si son diferentes de 0
-            for j in range(slack_count):
-                var_name = f"s{j+1}"
-                valor = solution.get(var_name, 0.0)
-                if abs(valor) > 1e-6:
-                    solucion_formateada.append({
-                        "variable": var_name,
-                        "valor": float(valor)
-                    })
+            sensibilidad_info = info.get("sensibilidad")
+            if esc is not None:
+                info_extra["escalado"] = esc["stats"]
+                solution = desescalar_solucion(esc, solution)
+                if sensibilidad_info is not None:
+                    sensibilidad_info = desescalar_sensibilidad(esc, sensibilidad_info)
+            x = None
+            if pre is not None:
+                info_extra["presolve"] = pre["stats"]
+                if pre["reducido"]:
+                    x_reducido = [solution.get(f"x{j+1}", 0.0) for j in pre["columnas"]]
+                    x, Z, solution = postsolve(pre, x_reducido)
+                    forma_salida = conteo_forma([r['signo'] for r in restricciones_data], n)
+            if inferiores is not None:
+                # Deshacer x = l + x' y recalcular holguras sobre las restricciones originales
+                if x is None:
+                    x = np.array([solution.get(f"x{j+1}", 0.0) for j in range(n)])
+                Z, solution = solucion_desde_x(*datos_originales(restricciones_data, coeficientes, n), x + inferiores)
+                forma_salida = conteo_forma([r['signo'] for r in restricciones_data], n)
+                info_extra["variables_acotadas"] = int(np.isfinite(upper[:n_solver]).sum()) if upper is not None else 0
+            return formatear_doblefase(solution, Z, all_tables, forma_salida, n, m, mode, tipo, traza,
+                                       basis=info["basis"] if upper is None else None, info_extra=info_extra,
+                                       forma_base=forma, sensibilidad=sensibilidad_info)
             
-            for j in range(excess_count):
-                var_name = f"e{j+1}"
-                valor = solution.get(var_name, 0.0)
-                if abs(valor) > 1e-6:
-                    solucion_formateada.append({
-                        "variable": var_name,
-                        "valor": float(valor)
-                    })
+        except ERRORES_EJECUTOR:
+            raise
+        except Exception as e:
+            import traceback
+            error_details = getattr(e, "detalles", None) or traceback.format_exc()
+            logger.exception("Error en doblefase: %s", e)
             
-            return jsonify({
+            return {
+                "error": str(e),
+                "detalles": error_details,
+                "tipo": tipo,
+                "estado": ESTADO_ERROR_CALCULO
+            }, 400
+    
+    elif metodo == 'revisado':
+        # Simplex revisado con A disperso y base LU (modelos grandes)
+        try:
+            m = len(restricciones_data)
+            n = contador_variables
+
+            # A en formato COO: solo se recorren los coeficientes no nulos
+            filas, columnas, valores = [], [], []
+            b = np.zeros(m, dtype=float)
+            senses = []
+            for i, restriccion in enumerate(restricciones_data):
+                for j, valor in enumerate(restriccion['coeficientes'][:n]):
+                    valor = float(valor)
+                    if valor != 0.0:
+                        filas.append(i)
+                        columnas.append(j)
+                        valores.append(valor)
+                b[i] = float(restriccion['c'])
+                senses.append(restriccion['signo'])
+            A = sp.csr_matrix((valores, (filas, columnas)), shape=(m, n))
+
+            c = np.zeros(n, dtype=float)
+            for j, valor in enumerate(coeficientes[:n]):
+                c[j] = float(valor)
+
+            solution, Z, info = pool.run(revised_simplex_method, A, b, senses, c, mode=mode,
+                                          timeout=tiempo_limite, progress=progress)
+
+            slack_count = senses.count('leq')
+            excess_count = senses.count('geq')
+            problema_info = {
+                "variables_originales": n,
+                "variables_holgura": slack_count,
+                "variables_exceso": excess_count,
+                "variables_artificiales": info["artificiales"],
+                "total_variables": n + slack_count + excess_count,
+                "restricciones": m,
+                "mode": mode,
+                "nnz": info["nnz"],
+                "iteraciones_fase1": info["iteraciones_fase1"],
+                "iteraciones_fase2": info["iteraciones_fase2"]
+            }
+
+            if solution is None:
+                return {
+                    "error": "Problema infactible o no acotado",
+                    "tipo": tipo,
+                    "estado": info["estado"],
+                    "tablas": [],
+                    "problema_info": problema_info
+                }, 400
+
+            solucion_formateada = [
+                {"variable": f"x{j+1}", "valor": float(solution.get(f"x{j+1}", 0.0))}
+                for j in range(n)
+            ]
+            for prefijo, cantidad in (("s", slack_count), ("e", excess_count)):
+                for j in range(cantidad):
+                    valor = solution.get(f"{prefijo}{j+1}", 0.0)
+                    if abs(valor) > 1e-6:
+                        solucion_formateada.append({
+                            "variable": f"{prefijo}{j+1}",
+                            "valor": float(valor)
+                        })
+
+            return {
                 "valor_optimo": float(Z),
                 "tipo": tipo,
-                "estado": "Óptimo encontrado",
+                "estado": info["estado"],
                 "solucion": solucion_formateada,
                 "variables": [solution.get(f"x{j+1}", 0.0) for j in range(n)],
-                "tablas": all_tables,
-                "problema_info": {
-                    "variables_originales": n,
-                    "variables_holgura": slack_count,
-                    "variables_exceso": excess_count,
-                    "variables_artificiales": artificial_count,
-                    "total_variables": total_vars,
-                    "restricciones": m,
-                    "mode": mode
-                }
-            })
-            
+                "tablas": [],
+                "problema_info": problema_info
+            }
+
+        except ERRORES_EJECUTOR:
+            raise
         except Exception as e:
             import traceback
-            error_details = traceback.format_exc()
-            print(f"ERROR en doblefase: {str(e)}")
-            print(f"Detalles: {error_details}")
-            
-            return jsonify({
+            error_details = getattr(e, "detalles", None) or traceback.format_exc()
+            logger.exception("Error en revisado: %s", e)
+
+            return {
                 "error": str(e),
                 "detalles": error_details,
                 "tipo": tipo,
-                "estado": "Error en cálculo"
-            }), 400
-    
+                "estado": ESTADO_ERROR_CALCULO
+            }, 400
+
     else:
-        return jsonify({
+        return {
             "error": f"Método '{metodo}' no reconocido",
             "tipo": tipo
-        }), 400
+        }, 400
+
+def formatear_doblefase(solution, Z, all_tables, forma, n, m, mode, tipo, traza, basis=None, info_extra=None,
+                        forma_base=None, sensibilidad=None):
+    """
+    Respuesta de /resolver para una solución óptima de Doble Fase. Con basis
+    incluye el identificador "base" para re-resolver en caliente, ligado a
+    la forma estándar completa (forma_base, por defecto forma), y con
+    sensibilidad los precios sombra y rangos.
+    """
+    solucion_formateada = []
+    for j in range(n):
+        var_name = f"x{j+1}"
+        valor = solution.get(var_name, 0.0)
+        solucion_formateada.append({
+            "variable": var_name,
+            "valor": float(valor)
+        })
+    
+    # También mostrar valores de holgura/exceso si son diferentes de 0
+    for j in range(forma["slack_count"]):
+        var_name = f"s{j+1}"
+        valor = solution.get(var_name, 0.0)
+        if abs(valor) > 1e-6:
+            solucion_formateada.append({
+                "variable": var_name,
+                "valor": float(valor)
+            })
+    
+    for j in range(forma["excess_count"]):
+        var_name = f"e{j+1}"
+        valor = solution.get(var_name, 0.0)
+        if abs(valor) > 1e-6:
+            solucion_formateada.append({
+                "variable": var_name,
+                "valor": float(valor)
+            })
+    
+    respuesta = {
+        "valor_optimo": float(Z),
+        "tipo": tipo,
+        "estado": "Óptimo encontrado",
+        "solucion": solucion_formateada,
+        "variables": [solution.get(f"x{j+1}", 0.0) for j in range(n)],
+        "tablas": all_tables,
+        "problema_info": {
+            "variables_originales": n,
+            "variables_holgura": forma["slack_count"],
+            "variables_exceso": forma["excess_count"],
+            "variables_artificiales": forma["artificial_count"],
+            "total_variables": forma["total_vars"],
+            "restricciones": m,
+            "mode": mode,
+            "traza": traza
+        }
+    }
+    if basis is not None:
+        respuesta["base"] = codificar_base(basis, (forma_base or forma)["A"])
+    if sensibilidad is not None:
+        respuesta["sensibilidad"] = sensibilidad
+    if info_extra:
+        respuesta["problema_info"].update(info_extra)
+    return respuesta
+
+
+# ==============================================
+# Resolución en lote
+# ==============================================
+# Máximo de problemas por petición a /resolver/batch
+LOTE_MAX_PROBLEMAS = int(os.environ.get("BATCH_MAX_PROBLEMS", 1000))
+
+
+def _como_respuesta(data, pool=None):
+    """resolver_problema normalizado a (payload, status); los errores quedan en el ítem."""
+    tipo = data.get('tipo', 'max')
+    try:
+        respuesta = resolver_problema(data, pool=pool)
+    except ERRORES_EJECUTOR as e:
+        respuesta = respuesta_ejecutor(e, tipo)[:2]
+    except Exception as e:
+        logger.exception("Error en problema del lote")
+        respuesta = ({"error": str(e), "tipo": tipo, "estado": ESTADO_ERROR_CALCULO}, 400)
+    return respuesta if isinstance(respuesta, tuple) else (respuesta, 200)
+
+
+def _clave_apilable(data):
+    """
+    Problemas Doble Fase sin traza con el mismo número de variables, los
+    mismos signos y el mismo tipo tienen idéntica estructura de columnas y
+    se pueden resolver apilados. Solo se apilan los que piden
+    "sensibilidad": false y no traen "base", así la respuesta apilada es la
+    misma que la de /resolver. Retorna la clave del grupo o None.
+    """
+    if data.get('metodo', 'grafico') != 'doblefase' or data.get('traza') != 'none':
+        return None
+    if data.get('sensibilidad', True) or data.get('base') is not None:
+        return None
+    if data.get('pricing', 'dantzig') != 'dantzig' or data.get('harris') \
+            or data.get('algoritmo', 'auto') not in ('auto', 'doblefase') or data.get('presolve') \
+            or data.get('cotas') is not None or data.get('escalado', 'auto') not in ('auto', True, False):
+        return None
+    try:
+        n = int(data.get('variables', 2))
+        signos = tuple(r['signo'] for r in data.get('restricciones', []))
+    except (TypeError, ValueError, KeyError):
+        return None
+    if not signos or any(s not in ('leq', 'geq', 'eq') for s in signos):
+        return None
+    return n, signos, data.get('tipo', 'max')
+
+
+def _resolver_apilados(problemas, tiempo_limite=None):
+    """Resuelve con two_phase_method_batch problemas de un mismo grupo. Retorna [(payload, status)]."""
+    tipo = problemas[0].get('tipo', 'max')
+    mode = 0 if tipo == 'min' else 1
+    n = int(problemas[0].get('variables', 2))
+    m = len(problemas[0]['restricciones'])
+    try:
+        # Escalado por problema (no cambia la estructura de columnas)
+        escalas = [escalar_restricciones(p['restricciones'], p.get('coeficientes', []), n)
+                   if p.get('escalado', 'auto') is True
+                   or (p.get('escalado', 'auto') == 'auto' and requiere_escalado(p['restricciones'], n)) else None
+                   for p in problemas]
+        formas = [construir_forma_estandar(*((e["restricciones"], e["coeficientes"]) if e else
+                                             (p['restricciones'], p.get('coeficientes', []))), n, mode=mode)
+                  for p, e in zip(problemas, escalas)]
+    except Exception:
+        # Datos inválidos en algún problema: resolverlos uno a uno para reportar cada error
+        return [_como_respuesta(p) for p in problemas]
+
+    # Con algoritmo "auto" /resolver usa el simplex dual si la base de
+    # holguras es dual factible: esos problemas se resuelven uno a uno
+    respuestas = [None] * len(problemas)
+    apilados = []
+    for k, (p, forma) in enumerate(zip(problemas, formas)):
+        if p.get('algoritmo', 'auto') == 'auto' and forma["artificial_count"] > 0 \
+                and forma_simplex_dual(forma, mode=mode) is not None:
+            respuestas[k] = _como_respuesta(p)
+        else:
+            apilados.append(k)
+    if not apilados:
+        return respuestas
+
+    base = formas[apilados[0]]
+    try:
+        X, Z, estados, bases, info = executor.run(
+            two_phase_method_batch,
+            np.stack([formas[k]["A"] for k in apilados]),
+            np.stack([formas[k]["b"] for k in apilados]),
+            np.stack([formas[k]["c_final"] for k in apilados]),
+            base["basic_idx"],
+            base["basic_costs_init"],
+            base["artificial_indices"],
+            mode=mode,
+            return_info=True,
+            timeout=tiempo_limite
+        )
+    except ERRORES_EJECUTOR as e:
+        for k in apilados:
+            respuestas[k] = respuesta_ejecutor(e, tipo)[:2]
+        return respuestas
+    except Exception as e:
+        logger.exception("Error en lote apilado: %s", e)
+        error = {"error": str(e), "detalles": getattr(e, "detalles", None), "tipo": tipo,
+                 "estado": ESTADO_ERROR_CALCULO}
+        for k in apilados:
+            respuestas[k] = (error, 400)
+        return respuestas
+
+    artificiales = set(base["artificial_indices"].tolist())
+    for fila, (k, estado) in enumerate(zip(apilados, estados)):
+        if estado == "optimal":
+            solution = {name: X[fila, j] for j, name in enumerate(base["var_names"]) if j not in artificiales}
+            # Mismas claves de problema_info que resolver_problema con pricing Dantzig
+            info_extra = {"algoritmo": "doble fase", "pricing": "dantzig", "harris": False, "saltos_cota": 0}
+            info_extra.update({clave: valores[fila] for clave, valores in info.items()})
+            if escalas[k] is not None:
+                info_extra["escalado"] = escalas[k]["stats"]
+                solution = desescalar_solucion(escalas[k], solution)
+            respuestas[k] = (formatear_doblefase(solution, Z[fila], [], formas[k], n, m, mode, tipo, 'none',
+                                                 basis=bases[fila], info_extra=info_extra), 200)
+        elif estado.startswith("max_iter"):
+            respuestas[k] = ({
+                "error": f"Máximo iteraciones en Fase {estado[-1]} alcanzado.",
+                "tipo": tipo,
+                "estado": ESTADO_ERROR_CALCULO
+            }, 400)
+        else:
+            respuestas[k] = ({
+                "error": "Problema infactible o no acotado",
+                "tipo": tipo,
+                "estado": "Infactible",
+                "tablas": []
+            }, 400)
+    return respuestas
+
+
+@app.route('/resolver/batch', methods=['POST'])
+def resolver_lote():
+    """
+    Resuelve una lista de problemas con el formato de /resolver (en
+    "problemas" o como arreglo JSON). Los resultados vuelven en el mismo
+    orden, cada uno con su status; un problema con error no afecta al resto.
+    En lote la traza por defecto es 'none'. Los problemas Doble Fase de igual
+    forma con "sensibilidad": false se apilan y pivotean juntos (ver
+    _clave_apilable); el resto se reparte entre los workers.
+    """
+    data = request.get_json(silent=True)
+    problemas = data.get('problemas') if isinstance(data, dict) else data
+    if not isinstance(problemas, list):
+        return {"error": "Se esperaba una lista de problemas en 'problemas'"}, 400
+    if len(problemas) > LOTE_MAX_PROBLEMAS:
+        return {"error": f"Máximo {LOTE_MAX_PROBLEMAS} problemas por lote"}, 400
+    tiempo_limite = data.get('tiempo_limite') if isinstance(data, dict) else None
+
+    resultados = [None] * len(problemas)
+    grupos = {}
+    tareas = []  # (índices, función sin argumentos que retorna [(payload, status)])
+    for i, problema in enumerate(problemas):
+        if not isinstance(problema, dict):
+            resultados[i] = ({"error": "Cada problema debe ser un objeto JSON"}, 400)
+            continue
+        problema = dict(problema)
+        problema.setdefault('traza', 'none')
+        if tiempo_limite is not None:
+            problema.setdefault('tiempo_limite', tiempo_limite)
+        clave = _clave_apilable(problema)
+        if clave is None:
+            tareas.append(([i], lambda p=problema: [_como_respuesta(p)]))
+        else:
+            grupos.setdefault(clave, []).append((i, problema))
+
+    # Cada grupo se parte en tantos trozos como workers para usar todos los núcleos
+    workers = max(1, executor.workers)
+    apilados = 0
+    for miembros in grupos.values():
+        if len(miembros) == 1:
+            i, problema = miembros[0]
+            tareas.append(([i], lambda p=problema: [_como_respuesta(p)]))
+            continue
+        apilados += len(miembros)
+        for trozo in np.array_split(np.arange(len(miembros)), min(workers, len(miembros) // 2)):
+            indices = [miembros[t][0] for t in trozo]
+            lote = [miembros[t][1] for t in trozo]
+            tareas.append((indices, lambda l=lote: _resolver_apilados(l, tiempo_limite)))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lote") as hilos:
+        futuros = [(indices, hilos.submit(fn)) for indices, fn in tareas]
+        for indices, futuro in futuros:
+            for i, respuesta in zip(indices, futuro.result()):
+                resultados[i] = respuesta
+
+    return {
+        "resultados": [{"status": status, "respuesta": payload} for payload, status in resultados],
+        "resumen": {
+            "problemas": len(resultados),
+            "apilados": apilados,
+            "errores": sum(1 for _, status in resultados if status != 200)
+        }
+    }
+
+
+# ==============================================
+# API de trabajos asíncronos
+# ==============================================
+# Pool propio con tiempo límite largo (JOBS_WORKERS, JOBS_TIMEOUT...)
+jobs_executor = SolveExecutor.from_env("JOBS", workers=1, max_queue=32, timeout=600.0)
+
+
+def _resolver_trabajo(data, progress):
+    try:
+        respuesta = resolver_problema(data, progress=progress, pool=jobs_executor)
+    except ERRORES_EJECUTOR as e:
+        respuesta = respuesta_ejecutor(e, data.get('tipo', 'max'))[:2]
+    return respuesta if isinstance(respuesta, tuple) else (respuesta, 200)
+
+
+# Estado de los trabajos en SQLite (JOBS_PATH): todos los workers de gunicorn
+# deben ver el mismo archivo para que GET /jobs/<id> funcione en cualquiera
+jobs = JobManager(
+    _resolver_trabajo,
+    workers=int(os.environ.get("JOBS_THREADS", 2)),
+    ttl=float(os.environ.get("JOBS_TTL", 600)),
+    max_pendientes=int(os.environ.get("JOBS_MAX_PENDING", 32)),
+    path=os.environ.get("JOBS_PATH") or None
+)
+
+
+@app.route('/jobs', methods=['POST'])
+def crear_trabajo():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return {"error": "Se esperaba un problema en formato JSON"}, 400
+    job = jobs.submit(data)
+    if job is None:
+        return {"error": "Demasiados trabajos pendientes", "estado": "Servidor ocupado"}, 503, {"Retry-After": "5"}
+    url = url_for('estado_trabajo', job_id=job.id)
+    return job.to_dict(), 202, {"Location": url}
+
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def estado_trabajo(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return {"error": f"Trabajo '{job_id}' no encontrado o expirado"}, 404
+    return job.to_dict()
+
+
+@app.route('/jobs/<job_id>/result', methods=['GET'])
+def resultado_trabajo(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return {"error": f"Trabajo '{job_id}' no encontrado o expirado"}, 404
+    if job.respuesta is None:
+        return job.to_dict(), 202
+    return job.respuesta
+
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))  # Render usa PORT
@@ -0,0 +1,177 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------
+# Clave canónica del problema
+# -------------------------
+# Campos que no cambian la respuesta
+CAMPOS_IGNORADOS = ("tiempo_limite",)
+
+
+def _normalizar(valor):
+    # Enteros y reales iguales (3 y 3.0) dan la misma clave; las claves se ordenan al serializar
+    if isinstance(valor, bool) or valor is None or isinstance(valor, str):
+        return valor
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    if isinstance(valor, dict):
+        return {str(k): _normalizar(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_normalizar(v) for v in valor]
+    return str(valor)
+
+
+def clave_problema(data):
+    """Hash SHA-256 del problema normalizado (metodo, tipo, coeficientes, restricciones, opciones)."""
+    datos = {k: v for k, v in data.items() if k not in CAMPOS_IGNORADOS}
+    canonico = json.dumps(_normalizar(datos), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonico.encode("utf-8")).hexdigest()
+
+
+# -------------------------
+# Caché LRU en memoria + disco opcional
+# -------------------------
+class ResultCache:
+    """
+    Caché de respuestas ya serializadas (bytes del cuerpo JSON + status),
+    así una respuesta desde caché es idéntica byte a byte a la original.
+
+    - max_entries / max_bytes: límites de la capa en memoria (LRU)
+    - path: archivo SQLite opcional que sobrevive reinicios; las entradas
+      leídas desde disco se promueven a memoria
+    - max_disk_entries: entradas en disco (se borran las menos usadas)
+    """
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024, path=None, max_disk_entries=100000):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+        self._items = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+        self._pid = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls, prefix="RESULT_CACHE"):
+        """Configura la caché desde {prefix}_ENTRIES, _MB, _PATH y _DISK_ENTRIES."""
+        return cls(
+            max_entries=int(os.environ.get(f"{prefix}_ENTRIES", 1024)),
+            max_bytes=int(float(os.environ.get(f"{prefix}_MB", 64)) * 1024 * 1024),
+            path=os.environ.get(f"{prefix}_PATH") or None,
+            max_disk_entries=int(os.environ.get(f"{prefix}_DISK_ENTRIES", 100000))
+        )
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0 or self.path is not None
+
+    def _conexion(self):
+        # Llamar con el lock tomado. Una conexión por proceso (workers de gunicorn)
+        if self.path is None:
+            return None
+        if self._pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS resultados ("
+                "clave TEXT PRIMARY KEY, status INTEGER, cuerpo BLOB, usado REAL)"
+            )
+            self._db.commit()
+            self._pid = os.getpid()
+        return self._db
+
+    def _guardar_memoria(self, clave, entrada):
+        if self.max_entries <= 0 or len(entrada[0]) > self.max_bytes:
+            return
+        anterior = self._items.pop(clave, None)
+        if anterior is not None:
+            self._bytes -= len(anterior[0])
+        self._items[clave] = entrada
+        self._bytes += len(entrada[0])
+        while len(self._items) > self.max_entries or self._bytes > self.max_bytes:
+            _, (cuerpo, _) = self._items.popitem(last=False)
+            self._bytes -= len(cuerpo)
+            self.evictions += 1
+
+    def get(self, clave):
+        """Retorna (cuerpo, status) o None."""
+        with self._lock:
+            entrada = self._items.get(clave)
+            if entrada is not None:
+                self._items.move_to_end(clave)
+                self.hits += 1
+                return entrada
+            db = self._conexion()
+            if db is not None:
+                try:
+                    fila = db.execute("SELECT cuerpo, status FROM resultados WHERE clave = ?", (clave,)).fetchone()
+                    if fila is not None:
+                        db.execute("UPDATE resultados SET usado = ? WHERE clave = ?", (time.time(), clave))
+                        db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("Caché en disco no disponible: %s", e)
+                    fila = None
+                if fila is not None:
+                    entrada = (bytes(fila[0]), fila[1])
+                    self._guardar_memoria(clave, entrada)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return entrada
+            self.misses += 1
+            return None
+
+    def put(self, clave, cuerpo, status):
+        with self._lock:
+            self._guardar_memoria(clave, (cuerpo, status))
+            db = self._conexion()
+            if db is None:
+                return
+            try:
+                db.execute("INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?)",
+                           (clave, status, sqlite3.Binary(cuerpo), time.time()))
+                exceso = db.execute("SELECT COUNT(*) FROM resultados").fetchone()[0] - self.max_disk_entries
+                if exceso > 0:
+                    db.execute("DELETE FROM resultados WHERE clave IN "
+                               "(SELECT clave FROM resultados ORDER BY usado LIMIT ?)", (exceso,))
+                db.commit()
+            except sqlite3.Error as e:
+                logger.warning("No se pudo guardar en la caché en disco: %s", e)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+            db = self._conexion()
+            if db is not None:
+                db.execute("DELETE FROM resultados")
+                db.commit()
+
+    def stats(self):
+        with self._lock:
+            consultas = self.hits + self.misses
+            return {
+                "entradas": len(self._items),
+                "bytes": self._bytes,
+                "max_entradas": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "hits_disco": self.disk_hits,
+                "misses": self.misses,
+                "expulsiones": self.evictions,
+                "tasa_aciertos": self.hits / consultas if consultas else 0.0,
+                "disco": self.path
+            }
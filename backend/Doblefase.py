@@ -1,43 +1,54 @@
+import logging
+import time
+
 import numpy as np
 
+from backend.Pricing import Pricer, ratio_test
+
+logger = logging.getLogger(__name__)
+
 # -------------------------
-# Utilidades de impresión
+# Utilidades de registro (logging)
 # -------------------------
-def print_tableau_simple(tableau, basic_vars, var_names, title=""):
-    rows, cols = tableau.shape
-    print("\n" + "="*70)
-    print(title)
-    print("="*70)
-    header = ["BV"] + var_names + ["bi"]
-    print(" | ".join(f"{h:>8}" for h in header))
-    print("-" * 70)
-    for i in range(rows):
-        row = tableau[i]
-        print(f"{basic_vars[i]:>8} | " + " | ".join(f"{val:>8.3f}" for val in row))
-    print("-" * 70)
+def log_tableau(tableau, basic_vars, var_names, title="", cols=None):
+    """
+    Escribe el tableau en el log a nivel DEBUG. Si DEBUG está desactivado
+    no se formatea nada (ni se copian columnas).
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if cols is not None:
+        tableau = tableau[:, cols]
+    lines = ["=" * 70, title, "=" * 70]
+    header = ["BV"] + list(var_names) + ["bi"]
+    lines.append(" | ".join(f"{h:>8}" for h in header))
+    lines.append("-" * 70)
+    for i in range(tableau.shape[0]):
+        lines.append(f"{basic_vars[i]:>8} | " + " | ".join(f"{val:>8.3f}" for val in tableau[i]))
+    lines.append("-" * 70)
+    logger.debug("\n%s", "\n".join(lines))
+
+
+def log_zjc(zjc):
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("   Zj-Cj | %s", " | ".join(f"{val:>8.3f}" for val in zjc))
 
 def tableau_to_dict(tableau, basic_vars, var_names, zjc=None, phase=1, iteration=0):
     """
     Convierte un tableau a un diccionario para enviar al frontend
     """
-    rows, cols = tableau.shape
-    
     # Crear encabezados
     headers = ["VB"] + var_names + ["LD"]
-    
+
     # Crear filas
     data = []
-    for i in range(rows):
-        row_data = [basic_vars[i] if i < len(basic_vars) else f"R{i+1}"]
-        row_data.extend([float(val) for val in tableau[i]])
-        data.append(row_data)
-    
+    for i, valores in enumerate(np.asarray(tableau, dtype=float).tolist()):
+        data.append([basic_vars[i] if i < len(basic_vars) else f"R{i+1}"] + valores)
+
     # Agregar fila Zj-Cj si está disponible
     if zjc is not None:
-        zj_row = ["Zj-Cj"]
-        zj_row.extend([float(val) for val in zjc])
-        data.append(zj_row)
-    
+        data.append(["Zj-Cj"] + np.asarray(zjc, dtype=float).tolist())
+
     return {
         "phase": phase,
         "iteration": iteration,
@@ -48,28 +59,127 @@ def tableau_to_dict(tableau, basic_vars, var_names, zjc=None, phase=1, iteration
     }
 
 
+# -------------------------
+# Registro de tablas (traza)
+# -------------------------
+TRACE_MODES = ("none", "summary", "full", "delta")
+
+
+class TraceRecorder:
+    """
+    Guarda las tablas del proceso según el modo de traza:
+      none    -> no guarda nada
+      summary -> fase, iteración, título, pivote y valor objetivo
+      full    -> además el tableau completo (formato de tableau_to_dict)
+      delta   -> summary + fila y columna pivote antes de pivotear; la tabla
+                 inicial lleva el tableau completo para reconstruir el resto.
+                 Con variables acotadas, cada complementación por cota se
+                 agrega a "saltos" ({col, cota}, en orden, después del pivote
+                 del registro si lo hay): LD -= cota * columna y columna *= -1
+    Los tableaus solo se convierten a listas en el modo que los necesita.
+    """
+    def __init__(self, mode="full"):
+        if mode not in TRACE_MODES:
+            raise ValueError(f"Modo de traza '{mode}' no reconocido (usar {', '.join(TRACE_MODES)}).")
+        self.mode = mode
+        self.tables = []
+
+    def table(self, rows, obj, basic_vars, var_names, phase, iteration, title,
+              cols=None, iteracion=False, tableau_completo=None, **extra):
+        if self.mode == "none":
+            return None
+        if self.mode == "full":
+            if cols is not None:
+                rows = rows[:, cols]
+                obj = obj[cols]
+            record = tableau_to_dict(rows, basic_vars, var_names, obj, phase=phase, iteration=iteration)
+            record["title"] = title
+            if iteracion:
+                record["zj_cj"] = obj.tolist()
+        else:
+            record = {
+                "phase": phase,
+                "iteration": iteration,
+                "title": title,
+                "objective": float(obj[-1])
+            }
+            if self.mode == "delta" and tableau_completo is not None:
+                record["tableau"] = tableau_completo.tolist()
+                record["variables"] = list(var_names)
+                record["basic_vars"] = list(basic_vars)
+                if cols is not None:
+                    record["columnas"] = cols.tolist()
+        if iteracion:
+            record["pivot_info"] = None
+        record.update(extra)
+        self.tables.append(record)
+        return record
+
+    def delta(self, tableau, row, col):
+        # Fila y columna pivote (antes del pivote) sobre el tableau completo
+        if self.mode != "delta":
+            return None
+        return {
+            "row": int(row),
+            "col": int(col),
+            "fila": tableau[row].tolist(),
+            "columna": tableau[:, col].tolist()
+        }
+
+    def set_pivot(self, record, tableau, row, col, col_full, entra, sale):
+        if record is None:
+            return
+        record["pivot_info"] = {
+            "row": int(row),
+            "col": int(col),
+            "entra": entra,
+            "sale": sale
+        }
+        d = self.delta(tableau, row, col_full)
+        if d is not None:
+            record["delta"] = d
+
+    def salto(self, record, col, cota):
+        # Complementación x_j = u_j - x_j' (columna del tableau completo)
+        if self.mode != "delta" or record is None:
+            return
+        record.setdefault("saltos", []).append({"col": int(col), "cota": float(cota)})
+
+
 # -------------------------
 # Construir tableau inicial
 # -------------------------
-def build_initial_tableau(A, b):
+def build_initial_tableau(A, b, obj_rows=0):
+    """
+    Tableau [A | b]. Con obj_rows > 0 se reservan filas extra al final para
+    las filas objetivo (Zj-Cj), que el pivoteo mantiene actualizadas.
+    """
     A = np.asarray(A, dtype=float)
     b = np.asarray(b, dtype=float)
     m, n = A.shape
-    tableau = np.zeros((m, n + 1), dtype=float)
-    tableau[:, :-1] = A
-    tableau[:, -1] = b
+    tableau = np.zeros((m + obj_rows, n + 1), dtype=float)
+    tableau[:m, :-1] = A
+    tableau[:m, -1] = b
     return tableau
 
 
+# -------------------------
+# Tolerancias relativas
+# -------------------------
+TOL_FACTIBILIDAD = 1e-8   # W de Fase 1 y artificiales básicas
+TOL_PIVOTE = 1e-12        # mejora de Zj-Cj y pivotes para sacar artificiales
+
+
+def tol_relativa(valores, tol):
+    """tol escalada por max(1, max|valores|): la misma precisión relativa con datos grandes."""
+    return tol * max(1.0, float(np.abs(valores).max(initial=0.0)))
+
+
 # -------------------------
 # Calcular Zj y Zj-Cj
 # -------------------------
 def compute_zj_zjc(tableau, basic_costs, c):
-    m, n_plus1 = tableau.shape
-    n = n_plus1 - 1
-    zj = np.zeros(n_plus1, dtype=float)
-    for i in range(m):
-        zj += basic_costs[i] * tableau[i]
+    zj = np.asarray(basic_costs, dtype=float) @ tableau
     c_full = np.concatenate([np.asarray(c, dtype=float), [0.0]])
     zjc = zj - c_full
     return zj, zjc
@@ -78,272 +188,926 @@ def compute_zj_zjc(tableau, basic_costs, c):
 # -------------------------
 # Elegir pivote (según tu regla)
 # -------------------------
-def choose_pivot_custom(tableau, zjc, maximize=False, tol=1e-12):
-    n_plus1 = tableau.shape[1]
-    n = n_plus1 - 1
-    zjc_vars = zjc[:-1]
-
-    if not maximize:
-        candidates = [j for j, val in enumerate(zjc_vars) if val > tol]
-        if not candidates:
-            return None, None, 'optimal'
-        pivot_col = max(candidates, key=lambda j: zjc_vars[j])
-    else:
-        candidates = [j for j, val in enumerate(zjc_vars) if val < -tol]
-        if not candidates:
-            return None, None, 'optimal'
-        pivot_col = min(candidates, key=lambda j: zjc_vars[j])
-
-    col_vec = tableau[:, pivot_col]
-    bi = tableau[:, -1]
-    ratios = []
-    for i in range(len(col_vec)):
-        if col_vec[i] > tol:
-            ratios.append((bi[i] / col_vec[i], i))
-    if not ratios:
+def choose_pivot_custom(tableau, zjc, maximize=False, tol=1e-12, harris=False):
+    """
+    Regla de Dantzig: entra la columna de mayor |Zj-Cj| que mejora (la
+    primera en empates) y sale la fila del test del cociente (ratio_test).
+    """
+    d = -zjc[:-1] if maximize else zjc[:-1]
+    mejora = d > tol
+    if not mejora.any():
+        return None, None, 'optimal'
+    pivot_col = int(np.argmax(np.where(mejora, d, -np.inf)))
+    pivot_row, _ = ratio_test(tableau[:, pivot_col], tableau[:, -1], tol, harris=harris)
+    if pivot_row is None:
         return None, None, 'unbounded'
-    pivot_row = min(ratios, key=lambda x: x[0])[1]
     return pivot_row, pivot_col, 'ok'
 
 
 # -------------------------
 # Operación pivote
 # -------------------------
+class PivotEngine:
+    """
+    Pivoteo in-place sobre un tableau preasignado.
+    Cada pivote es una única actualización de rango 1 (columna pivote x fila
+    pivote) y los buffers de trabajo se reutilizan entre iteraciones.
+    """
+    def __init__(self, tableau, tol=1e-12):
+        self.tableau = np.ascontiguousarray(tableau, dtype=float)
+        self.tol = tol
+        self.resize(self.tableau)
+
+    def resize(self, tableau):
+        # Nuevo tableau (p.ej. al pasar a Fase 2): reasignar buffers solo si cambia la forma
+        self.tableau = np.ascontiguousarray(tableau, dtype=float)
+        m, n_plus1 = self.tableau.shape
+        if getattr(self, "_outer", None) is None or self._outer.shape != (m, n_plus1):
+            self._col = np.empty(m, dtype=float)
+            self._row = np.empty(n_plus1, dtype=float)
+            self._outer = np.empty((m, n_plus1), dtype=float)
+        return self.tableau
+
+    def pivot(self, pivot_row, pivot_col):
+        T = self.tableau
+        pivot_val = T[pivot_row, pivot_col]
+        if abs(pivot_val) < self.tol:
+            raise ValueError("Pivote ~ 0, abortando para evitar NaN.")
+        np.divide(T[pivot_row], pivot_val, out=self._row)
+        np.copyto(self._col, T[:, pivot_col])
+        self._col[pivot_row] = 0.0
+        np.multiply.outer(self._col, self._row, out=self._outer)
+        T -= self._outer
+        T[pivot_row] = self._row
+        return T
+
+    def complementar(self, col, cota):
+        # x_j = cota - x_j': la variable no básica pasa de 0 a su cota (o vuelve)
+        T = self.tableau
+        T[:, -1] -= T[:, col] * cota
+        T[:, col] *= -1.0
+        return T
+
+
 def pivot_transform(tableau, pivot_row, pivot_col, tol=1e-12):
-    A = tableau.copy()
-    pivot_val = A[pivot_row, pivot_col]
-    if abs(pivot_val) < tol:
-        raise ValueError("Pivote ~ 0, abortando para evitar NaN.")
-    A[pivot_row, :] = A[pivot_row, :] / pivot_val
-    for i in range(A.shape[0]):
-        if i == pivot_row:
-            continue
-        A[i, :] = A[i, :] - A[i, pivot_col] * A[pivot_row, :]
-    return A
+    """Versión funcional: pivotea una copia del tableau."""
+    return PivotEngine(np.array(tableau, dtype=float), tol=tol).pivot(pivot_row, pivot_col)
 
 
 # -------------------------
 # Método de 2 fases (MODIFICADO para capturar tablas)
 # -------------------------
-def two_phase_method_fixed(A, b, c_final, var_names, basic_vars_init, basic_costs_init, artificial_indices, mode=0):
+def two_phase_method_fixed(A, b, c_final, var_names, basic_vars_init, basic_costs_init, artificial_indices, mode=0, trace="full", callback=None,
+                           return_info=False, sensitivity=False, pricing="dantzig", max_iter=None, harris=False,
+                           upper=None):
     """
     MODIFICADO: Ahora retorna también las tablas del proceso
+
+    El tableau lleva dos filas objetivo extra bajo las restricciones:
+    fila m = Zj-Cj de Fase 2 y fila m+1 = Zj-Cj de Fase 1. Ambas se
+    actualizan con el mismo pivote, así que no se recalculan por iteración
+    y el paso a Fase 2 solo cambia la fila objetivo que se lee.
+
+    trace: modo de registro de tablas (ver TraceRecorder).
+    callback: función opcional llamada tras cada pivote con un diccionario
+    {phase, iteration, entra, sale, objective, elapsed}. Con None no tiene costo.
+    return_info: si es True retorna además un diccionario con la base final
+    ("basis", índices de columna para resolve_from_basis), las iteraciones
+    por fase, la regla de pricing y, con sensitivity=True, el análisis de
+    sensibilidad ("sensibilidad").
+    pricing: regla de elección del pivote (ver Pricer), con anticiclado.
+    harris: test del cociente de Harris en dos pasadas (ver ratio_test).
+    max_iter: pivotes por fase (por defecto max(200, 10 (m + n))).
+    upper: cota superior de cada columna de A (inf = sin cota) para el
+    simplex con variables acotadas. Una no básica en su cota se guarda
+    complementada (x_j = u_j - x_j', columna con signo cambiado), así todas
+    las no básicas siguen valiendo 0 en el tableau.
     """
-    tableau = build_initial_tableau(A, b)
-    m, n_plus1 = tableau.shape
-    n = n_plus1 - 1
+    t_start = time.perf_counter()
 
-    # Lista para almacenar todas las tablas
-    all_tables = []
+    def notify(phase, iteration, entra, sale, objective):
+        callback({
+            "phase": phase,
+            "iteration": iteration,
+            "entra": entra,
+            "sale": sale,
+            "objective": float(objective),
+            "elapsed": time.perf_counter() - t_start
+        })
 
-    basic_vars = basic_vars_init[:]
-    Cb = np.array(basic_costs_init, dtype=float)
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    engine = PivotEngine(build_initial_tableau(A, b, obj_rows=2))
+    tableau = engine.tableau
+    rows = tableau[:m]          # vista: filas de restricciones
+    obj2 = tableau[m]           # vista: Zj-Cj Fase 2
+    obj1 = tableau[m + 1]       # vista: Zj-Cj Fase 1
 
-    # Tabla inicial Fase 1
-    print("\n=== FASE 1 (tabla inicial) ===")
-    print_tableau_simple(tableau, basic_vars, var_names, title="Tableau inicial Fase 1")
-    
-    # Guardar tabla inicial
-    zj, zjc = compute_zj_zjc(tableau, Cb, np.zeros(n))
-    table_dict = tableau_to_dict(tableau, basic_vars, var_names, zjc, phase=1, iteration=0)
-    table_dict["title"] = "Tabla Inicial - Fase 1"
-    all_tables.append(table_dict)
+    # Registro de tablas según el modo de traza
+    recorder = TraceRecorder(trace)
+    all_tables = recorder.tables
+
+    basic_vars = list(basic_vars_init)
+    basis = [var_names.index(v) for v in basic_vars]
+    identity_cols = list(basis)  # columnas identidad del tableau inicial (B^-1 al final)
+    Cb = np.array(basic_costs_init, dtype=float)
 
     # Construir c_phase1 según mode
     c_phase1 = np.zeros(n, dtype=float)
     sign = 1.0 if mode == 0 else -1.0
-    for idx in artificial_indices:
-        if 0 <= idx < n:
-            c_phase1[idx] = sign
-        else:
-            raise IndexError(f"Índice artificial {idx} fuera de rango (n={n}).")
+    artificial_indices = np.asarray(artificial_indices, dtype=int)
+    fuera = artificial_indices[(artificial_indices < 0) | (artificial_indices >= n)]
+    if fuera.size:
+        raise IndexError(f"Índice artificial {int(fuera[0])} fuera de rango (n={n}).")
+    c_phase1[artificial_indices] = sign
+
+    # Variables acotadas: columnas complementadas (no básicas en su cota superior)
+    if upper is not None:
+        upper = np.asarray(upper, dtype=float)
+        if not np.isfinite(upper).any():
+            upper = None
+    complementada = np.zeros(n, dtype=bool)
+
+    def salto_de_cota(j, record):
+        engine.complementar(j, upper[j])
+        complementada[j] = not complementada[j]
+        recorder.salto(record, j, upper[j])
+
+    # Filas objetivo iniciales (única vez que se calculan Zj completos)
+    _, obj1[:] = compute_zj_zjc(rows, Cb, c_phase1)
+    c_final = np.asarray(c_final, dtype=float)
+    obj2[:-1] = -c_final
+    obj2[-1] = 0.0
+
+    # Tabla inicial Fase 1
+    log_tableau(rows, basic_vars, var_names, title="Tableau inicial Fase 1")
+
+    # Guardar tabla inicial (muestra Zj, sin restar los costos de Fase 1)
+    zj_init = obj1.copy()
+    zj_init[:-1] += c_phase1
+    recorder.table(rows, zj_init, basic_vars, var_names, 1, 0, "Tabla Inicial - Fase 1",
+                   tableau_completo=tableau)
 
     # FASE 1
     iter_count = 0
-    max_iter = 200
-    phase1_tables = []
-    
+    if max_iter is None:
+        max_iter = max(200, 10 * (m + n))
+    pricer = Pricer(pricing, harris=harris)
+
     while True:
         iter_count += 1
         if iter_count > max_iter:
             raise RuntimeError("Máximo iteraciones en Fase 1 alcanzado.")
 
-        zj, zjc = compute_zj_zjc(tableau, Cb, c_phase1)
-        
+        zjc = obj1
+
         # Guardar tabla antes del pivote
-        table_dict = tableau_to_dict(tableau, basic_vars, var_names, zjc, phase=1, iteration=iter_count)
-        table_dict["title"] = f"Iteración {iter_count} - Fase 1"
-        table_dict["zj_cj"] = [float(val) for val in zjc]
-        table_dict["pivot_info"] = None
-        all_tables.append(table_dict)
-        phase1_tables.append(table_dict)
-        
-        print("   Zj-Cj | " + " | ".join(f"{val:>8.3f}" for val in zjc))
-        
-        pivot_row, pivot_col, status = choose_pivot_custom(tableau, zjc, maximize=(mode==1))
-        
+        record = recorder.table(rows, zjc, basic_vars, var_names, 1, iter_count,
+                                f"Iteración {iter_count} - Fase 1", iteracion=True)
+
+        log_zjc(zjc)
+
+        pivot_row, pivot_col, status = pricer.choose_pivot(rows, zjc, basis, maximize=(mode==1), upper=upper)
+
         # Actualizar información del pivote en la última tabla
         if pivot_row is not None and pivot_col is not None:
-            all_tables[-1]["pivot_info"] = {
-                "row": int(pivot_row),
-                "col": int(pivot_col),
-                "entra": var_names[pivot_col],
-                "sale": basic_vars[pivot_row] if pivot_row < len(basic_vars) else f"R{pivot_row+1}"
-            }
-        
+            recorder.set_pivot(record, tableau, pivot_row, pivot_col, pivot_col,
+                               var_names[pivot_col], basic_vars[pivot_row])
+
         if status == 'optimal':
-            print("Fase 1: óptimo alcanzado.")
+            logger.debug("Fase 1: óptimo alcanzado.")
             break
         if status == 'unbounded':
-            print("Fase 1: no hay pivote válido.")
-            return None, None, all_tables
+            logger.info("Fase 1: no hay pivote válido.")
+            return (None, None, all_tables, {"basis": None}) if return_info else (None, None, all_tables)
+        if status == 'salto':
+            salto_de_cota(pivot_col, record)
+            continue
 
-        print(f"Pivot (F1): columna = {var_names[pivot_col]}, fila = {pivot_row+1}")
+        logger.debug("Pivot (F1): columna = %s, fila = %d", var_names[pivot_col], pivot_row + 1)
+        sale = basic_vars[pivot_row]
+        sale_idx = basis[pivot_row]
         basic_vars[pivot_row] = var_names[pivot_col]
+        basis[pivot_row] = pivot_col
         Cb[pivot_row] = c_phase1[pivot_col]
 
-        tableau = pivot_transform(tableau, pivot_row, pivot_col)
-        print_tableau_simple(tableau, basic_vars, var_names, title=f"Después de pivote F1 (iter {iter_count})")
+        engine.pivot(pivot_row, pivot_col)
+        if status == 'cota':
+            salto_de_cota(sale_idx, record)
+        if callback is not None:
+            notify(1, iter_count, var_names[pivot_col], sale, obj1[-1])
+        log_tableau(rows, basic_vars, var_names, title=f"Después de pivote F1 (iter {iter_count})")
+
+    iteraciones_fase1 = iter_count - 1
+    W_val = obj1[-1]
+    logger.debug("Valor de W (suma artificiales) = %.6f", W_val)
 
-    zj_final, zjc_final = compute_zj_zjc(tableau, Cb, c_phase1)
-    W_val = zj_final[-1]
-    print(f"Valor de W (suma artificiales) = {W_val:.6f}")
-    
     # Guardar tabla final de Fase 1
-    table_dict = tableau_to_dict(tableau, basic_vars, var_names, zjc_final, phase=1, iteration=iter_count+1)
-    table_dict["title"] = "Tabla Final - Fase 1"
-    table_dict["W_value"] = float(W_val)
-    all_tables.append(table_dict)
-    
-    if abs(W_val) > 1e-8:
-        print("PROBLEMA INFACTIBLE en Fase 1 (W != 0).")
-        return None, None, all_tables
+    recorder.table(rows, obj1, basic_vars, var_names, 1, iter_count+1, "Tabla Final - Fase 1",
+                   W_value=float(W_val))
+
+    if abs(W_val) > tol_relativa(b, TOL_FACTIBILIDAD):
+        logger.info("PROBLEMA INFACTIBLE en Fase 1 (W != 0).")
+        return (None, None, all_tables, {"basis": None}) if return_info else (None, None, all_tables)
 
     # Eliminar artificiales básicas
-    art_set = set(artificial_indices)
+    art_set = set(artificial_indices.tolist())
     for row_idx in range(m):
         if basic_vars[row_idx] in var_names:
             col_idx = var_names.index(basic_vars[row_idx])
             if col_idx in art_set:
                 found = False
+                tol_fila = tol_relativa(rows[row_idx, :-1], TOL_PIVOTE)
                 for j in range(n):
                     if j in art_set:
                         continue
-                    if abs(tableau[row_idx, j]) > 1e-12:
-                        print(f"Eliminando artificial {basic_vars[row_idx]}")
+                    if abs(rows[row_idx, j]) > tol_fila:
+                        logger.debug("Eliminando artificial %s", basic_vars[row_idx])
+                        sale = basic_vars[row_idx]
                         basic_vars[row_idx] = var_names[j]
+                        basis[row_idx] = j
                         Cb[row_idx] = 0.0
-                        tableau = pivot_transform(tableau, row_idx, j)
-                        print_tableau_simple(tableau, basic_vars, var_names, title="Después de pivot para eliminar artificial")
-                        
+                        delta = recorder.delta(tableau, row_idx, j)
+                        engine.pivot(row_idx, j)
+                        if callback is not None:
+                            notify(1.5, 0, var_names[j], sale, obj1[-1])
+                        log_tableau(rows, basic_vars, var_names, title="Después de pivot para eliminar artificial")
+
                         # Guardar tabla después de eliminar artificial
-                        zj_temp, zjc_temp = compute_zj_zjc(tableau, Cb, c_phase1)
-                        table_dict = tableau_to_dict(tableau, basic_vars, var_names, zjc_temp, phase=1.5, iteration=0)
-                        table_dict["title"] = f"Eliminación artificial - Fila {row_idx+1}"
-                        all_tables.append(table_dict)
-                        
+                        record = recorder.table(rows, obj1, basic_vars, var_names, 1.5, 0,
+                                                f"Eliminación artificial - Fila {row_idx+1}")
+                        if delta is not None:
+                            record["delta"] = delta
+
                         found = True
                         break
                 if not found:
-                    print(f"WARNING: no se pudo eliminar la artificial básica {basic_vars[row_idx]}")
+                    logger.warning("No se pudo eliminar la artificial básica %s", basic_vars[row_idx])
 
-    # Preparar Fase 2
+    # Preparar Fase 2: las columnas artificiales siguen en el tableau pero
+    # quedan fuera del pricing y de las tablas que se envían al frontend
     keep_cols = [j for j in range(n) if j not in art_set]
-    new_tableau = np.zeros((m, len(keep_cols) + 1), dtype=float)
-    for i, j in enumerate(keep_cols):
-        new_tableau[:, i] = tableau[:, j]
-    new_tableau[:, -1] = tableau[:, -1]
-
-    new_var_names = [var_names[j] for j in keep_cols]
-    new_c_final = [c_final[j] for j in keep_cols]
+    keep_idx = np.array(keep_cols + [n], dtype=int)
+    # Posición de cada columna del tableau en las tablas de Fase 2 (-1 = artificial)
+    pos_f2 = np.full(n, -1, dtype=int)
+    pos_f2[keep_cols] = np.arange(len(keep_cols))
+    zjc = np.empty(n + 1, dtype=float)
+    var_names_full = var_names
+    var_names = [var_names_full[j] for j in keep_cols]
 
     for i in range(m):
         bv = basic_vars[i]
-        if bv in var_names and var_names.index(bv) in art_set:
+        if bv in var_names_full and var_names_full.index(bv) in art_set:
             basic_vars[i] = "R" + str(i+1)
 
-    Cb2 = np.zeros(m, dtype=float)
-    for i in range(m):
-        bv = basic_vars[i]
-        if bv in new_var_names:
-            idx_new = new_var_names.index(bv)
-            Cb2[i] = new_c_final[idx_new]
-        else:
-            Cb2[i] = 0.0
-
-    print("\n=== PREPARADA FASE 2 ===")
-    print_tableau_simple(new_tableau, basic_vars, new_var_names, title="Tableau inicial Fase 2")
+    log_tableau(rows, basic_vars, var_names, title="Tableau inicial Fase 2", cols=keep_idx)
 
     # Guardar tabla inicial Fase 2
-    zj_init_f2, zjc_init_f2 = compute_zj_zjc(new_tableau, Cb2, new_c_final)
-    table_dict = tableau_to_dict(new_tableau, basic_vars, new_var_names, zjc_init_f2, phase=2, iteration=0)
-    table_dict["title"] = "Tabla Inicial - Fase 2"
-    all_tables.append(table_dict)
+    recorder.table(rows, obj2, basic_vars, var_names, 2, 0, "Tabla Inicial - Fase 2",
+                   cols=keep_idx, tableau_completo=tableau)
 
     # FASE 2
-    tableau = new_tableau
-    var_names = new_var_names
-    c_final = new_c_final
-    Cb = Cb2
-    n = len(var_names)
-
     iter_count = 0
+    tol_costos = tol_relativa(c_final, TOL_PIVOTE)
     while True:
         iter_count += 1
         if iter_count > max_iter:
             raise RuntimeError("Máximo iteraciones en Fase 2 alcanzado.")
 
-        zj, zjc = compute_zj_zjc(tableau, Cb, c_final)
-        
+        # Zj-Cj de Fase 2 con las artificiales fuera del pricing
+        np.copyto(zjc, obj2)
+        zjc[artificial_indices] = 0.0
+
         # Guardar tabla antes del pivote
-        table_dict = tableau_to_dict(tableau, basic_vars, var_names, zjc, phase=2, iteration=iter_count)
-        table_dict["title"] = f"Iteración {iter_count} - Fase 2"
-        table_dict["zj_cj"] = [float(val) for val in zjc]
-        table_dict["pivot_info"] = None
-        all_tables.append(table_dict)
-        
-        print("   Zj-Cj | " + " | ".join(f"{val:>8.3f}" for val in zjc))
-        
-        pivot_row, pivot_col, status = choose_pivot_custom(tableau, zjc, maximize=(mode==1))
-        
+        record = recorder.table(rows, obj2, basic_vars, var_names, 2, iter_count,
+                                f"Iteración {iter_count} - Fase 2", cols=keep_idx, iteracion=True)
+
+        log_zjc(zjc)
+
+        pivot_row, pivot_full, status = pricer.choose_pivot(rows, zjc, basis, maximize=(mode==1), tol=tol_costos,
+                                                            upper=upper)
+        pivot_col = None if pivot_full is None else int(pos_f2[pivot_full])
+
         # Actualizar información del pivote
         if pivot_row is not None and pivot_col is not None:
-            all_tables[-1]["pivot_info"] = {
-                "row": int(pivot_row),
-                "col": int(pivot_col),
-                "entra": var_names[pivot_col],
-                "sale": basic_vars[pivot_row] if pivot_row < len(basic_vars) else f"R{pivot_row+1}"
-            }
-        
+            recorder.set_pivot(record, tableau, pivot_row, pivot_col, pivot_full,
+                               var_names[pivot_col], basic_vars[pivot_row])
+
         if status == 'optimal':
-            print("Fase 2: óptimo alcanzado.")
+            logger.debug("Fase 2: óptimo alcanzado.")
             break
         if status == 'unbounded':
-            print("Fase 2: no hay pivote válido.")
-            return None, None, all_tables
+            logger.info("Fase 2: no hay pivote válido.")
+            return (None, None, all_tables, {"basis": None}) if return_info else (None, None, all_tables)
+        if status == 'salto':
+            salto_de_cota(pivot_full, record)
+            continue
 
-        print(f"Pivot (F2): columna = {var_names[pivot_col]}, fila = {pivot_row+1}")
+        logger.debug("Pivot (F2): columna = %s, fila = %d", var_names[pivot_col], pivot_row + 1)
+        sale = basic_vars[pivot_row]
+        sale_idx = basis[pivot_row]
         basic_vars[pivot_row] = var_names[pivot_col]
-        Cb[pivot_row] = c_final[pivot_col]
+        basis[pivot_row] = int(pivot_full)
 
-        tableau = pivot_transform(tableau, pivot_row, pivot_col)
-        print_tableau_simple(tableau, basic_vars, var_names, title=f"Después de pivote F2 (iter {iter_count})")
+        engine.pivot(pivot_row, pivot_full)
+        if status == 'cota':
+            salto_de_cota(sale_idx, record)
+        if callback is not None:
+            notify(2, iter_count, var_names[pivot_col], sale, obj2[-1])
+        log_tableau(rows, basic_vars, var_names, title=f"Después de pivote F2 (iter {iter_count})", cols=keep_idx)
+
+    iteraciones_fase2 = iter_count - 1
 
     # Solución final
     solution = {name: 0.0 for name in var_names}
     for i in range(m):
         bv = basic_vars[i]
         if bv in var_names:
-            solution[bv] = tableau[i, -1]
+            solution[bv] = rows[i, -1]
+    for j in np.flatnonzero(complementada):
+        if var_names_full[j] in solution:
+            solution[var_names_full[j]] = upper[j] - solution[var_names_full[j]]
+
+    Z_opt = obj2[-1]
 
-    zj_final2, _ = compute_zj_zjc(tableau, Cb, c_final)
-    Z_opt = zj_final2[-1]
-    
     # Guardar tabla final
-    zj_last, zjc_last = compute_zj_zjc(tableau, Cb, c_final)
-    table_dict = tableau_to_dict(tableau, basic_vars, var_names, zjc_last, phase=2, iteration=iter_count+1)
-    table_dict["title"] = "Tabla Final - Solución Óptima"
-    table_dict["Z_value"] = float(Z_opt)
-    all_tables.append(table_dict)
-    
-    return solution, Z_opt, all_tables
\ No newline at end of file
+    recorder.table(rows, obj2, basic_vars, var_names, 2, iter_count+1, "Tabla Final - Solución Óptima",
+                   cols=keep_idx, Z_value=float(Z_opt))
+
+    if return_info:
+        info = {"basis": basis, "iteraciones_fase1": iteraciones_fase1, "iteraciones_fase2": iteraciones_fase2}
+        info.update(pricer.info())
+        if sensitivity and upper is None:
+            info["sensibilidad"] = sensitivity_analysis(rows, obj2, basis, b, c_final, identity_cols,
+                                                        artificial_indices, var_names_full, mode=mode)
+        return solution, Z_opt, all_tables, info
+    return solution, Z_opt, all_tables
+
+
+# -------------------------
+# Análisis de sensibilidad (desde el tableau final)
+# -------------------------
+def _sin_infinito(valor):
+    # JSON no admite Infinity: un rango sin límite se informa como None
+    return float(valor) if np.isfinite(valor) else None
+
+
+def sensitivity_analysis(rows, obj, basis, b, c_final, identity_cols, artificial_indices, var_names,
+                         mode=0, row_signs=None, tol=1e-9):
+    """
+    Precios sombra, costos reducidos y rangos de costos y LD a partir del
+    tableau óptimo, sin re-resolver:
+      rows = B^-1 [A | b], obj = fila Zj-Cj de Fase 2, basis = índices básicos,
+      b = LD con que se construyó el tableau
+      identity_cols: columna que era unitaria en cada fila del tableau
+      inicial, así B^-1 = rows[:, identity_cols]
+      row_signs: +-1 por fila si el solver multiplicó filas por -1 (simplex
+      dual); los resultados se refieren siempre a las restricciones originales
+
+    Los precios sombra son dZ/db_i del problema tal como se planteó (min o
+    max). Los rangos indican cuánto puede subir o bajar cada costo de las
+    variables x o cada LD sin que cambie la base óptima (None = sin límite).
+    """
+    m = rows.shape[0]
+    n = rows.shape[1] - 1
+    signo = 1.0 if mode == 0 else -1.0
+    row_signs = np.ones(m) if row_signs is None else np.asarray(row_signs, dtype=float)
+    identity_cols = np.asarray(identity_cols, dtype=int)
+    c_final = np.asarray(c_final, dtype=float)
+    zjc = obj[:-1]
+
+    es_art = np.zeros(n, dtype=bool)
+    es_art[np.asarray(artificial_indices, dtype=int)] = True
+    fila_basica = np.full(n, -1, dtype=int)
+    fila_basica[basis] = np.arange(m)
+    no_basicas = ~es_art & (fila_basica < 0)
+
+    B_inv = rows[:, identity_cols]
+    x_B = np.maximum(rows[:, -1], 0.0)
+    b_orig = np.asarray(b, dtype=float) * row_signs
+    y = (obj[identity_cols] + c_final[identity_cols]) * row_signs
+
+    restricciones = []
+    validas = ~es_art[basis]
+    for i in range(m):
+        beta = B_inv[:, i] * row_signs[i]
+        baja = validas & (beta < -tol)
+        sube = validas & (beta > tol)
+        aumento = np.min(x_B[baja] / -beta[baja]) if baja.any() else np.inf
+        disminucion = np.min(x_B[sube] / beta[sube]) if sube.any() else np.inf
+        restricciones.append({
+            "restriccion": i + 1,
+            "precio_sombra": float(y[i]),
+            "ld": float(b_orig[i]),
+            "aumento_permitido": _sin_infinito(aumento),
+            "disminucion_permitida": _sin_infinito(disminucion),
+            "rango": [_sin_infinito(b_orig[i] - disminucion), _sin_infinito(b_orig[i] + aumento)]
+        })
+
+    variables = []
+    for j in range(n):
+        if var_names[j][0] != "x":
+            continue
+        r = fila_basica[j]
+        if r < 0:
+            margen = abs(zjc[j])
+            aumento, disminucion = (np.inf, margen) if mode == 0 else (margen, np.inf)
+        else:
+            a = rows[r, :-1]
+            sube = no_basicas & (signo * a > tol)
+            baja = no_basicas & (signo * a < -tol)
+            aumento = np.min(np.abs(zjc[sube] / a[sube])) if sube.any() else np.inf
+            disminucion = np.min(np.abs(zjc[baja] / a[baja])) if baja.any() else np.inf
+        variables.append({
+            "variable": var_names[j],
+            "basica": bool(r >= 0),
+            "valor": float(rows[r, -1]) if r >= 0 else 0.0,
+            "costo": float(c_final[j]),
+            "costo_reducido": 0.0 if r >= 0 else float(-zjc[j]),
+            "aumento_permitido": _sin_infinito(aumento),
+            "disminucion_permitida": _sin_infinito(disminucion),
+            "rango": [_sin_infinito(c_final[j] - disminucion), _sin_infinito(c_final[j] + aumento)]
+        })
+
+    return {"restricciones": restricciones, "variables": variables}
+
+
+# -------------------------
+# Re-resolver desde una base conocida (arranque en caliente)
+# -------------------------
+def choose_pivot_dual(tableau, zjc, maximize=False, tol=1e-12, permitidas=None):
+    """
+    Pivote del simplex dual: sale la fila con el LD más negativo y entra la
+    columna con a_rj < 0 de menor |Zj-Cj / a_rj| (conserva la factibilidad dual).
+    Retorna (fila, columna, estado) con estado 'ok' | 'optimal' | 'infeasible'.
+    """
+    bi = tableau[:, -1]
+    pivot_row = int(np.argmin(bi))
+    if bi[pivot_row] >= -tol:
+        return None, None, 'optimal'
+    fila = tableau[pivot_row, :-1]
+    candidatas = fila < -tol
+    if permitidas is not None:
+        candidatas &= permitidas
+    if not candidatas.any():
+        return None, None, 'infeasible'
+    ratios = np.full(fila.shape, np.inf)
+    ratios[candidatas] = np.abs(zjc[:-1][candidatas] / fila[candidatas])
+    return pivot_row, int(np.argmin(ratios)), 'ok'
+
+
+def resolve_from_basis(A, b, c_final, var_names, basis, artificial_indices, mode=0, trace="full",
+                       callback=None, max_iter=None, tol=1e-9, titulo="Base previa",
+                       identity_cols=None, row_signs=None, pricing="dantzig", harris=False):
+    """
+    Re-resuelve partiendo de la base `basis` (índices de columna, p.ej. la
+    base óptima de una resolución anterior con las mismas restricciones):
+      - si la base sigue siendo primal factible (solo cambiaron los costos)
+        continúa la Fase 2 sin pasar por la Fase 1;
+      - si es dual factible (solo cambió el LD) aplica el simplex dual.
+    También sirve como simplex dual desde la base de holguras (ver
+    forma_simplex_dual); `titulo` nombra la base inicial en las tablas.
+    Con identity_cols (columna unitaria de cada fila en A) info incluye el
+    análisis de sensibilidad; row_signs indica las filas reorientadas.
+    pricing, harris: regla de pivote y test del cociente del simplex primal (ver Pricer).
+
+    Retorna (solution, Z, all_tables, info) como two_phase_method_fixed, con
+    info = {"metodo": "primal" | "dual", "iteraciones", "basis"}; solution es
+    None si el problema es infactible o no acotado. Retorna None si la base
+    no sirve (singular, ni primal ni dual factible, o una artificial queda
+    básica con valor distinto de 0) y hay que resolver desde cero.
+    """
+    t_start = time.perf_counter()
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    basis = [int(j) for j in basis]
+    if len(basis) != m or min(basis, default=0) < 0 or max(basis, default=0) >= n:
+        return None
+
+    # Tableau B^-1 [A | b] con la fila Zj-Cj de Fase 2
+    tableau = build_initial_tableau(A, b, obj_rows=1)
+    try:
+        tableau[:m] = np.linalg.solve(A[:, basis], tableau[:m])
+    except np.linalg.LinAlgError:
+        return None
+    engine = PivotEngine(tableau)
+    rows = tableau[:m]
+    obj = tableau[m]
+    c_final = np.asarray(c_final, dtype=float)
+    obj[:-1] = c_final[basis] @ rows[:, :-1] - c_final
+    obj[-1] = c_final[basis] @ rows[:, -1]
+
+    es_art = np.zeros(n, dtype=bool)
+    es_art[np.asarray(artificial_indices, dtype=int)] = True
+    permitidas = ~es_art
+    maximize = mode == 1
+    keep_cols = np.flatnonzero(permitidas)
+    keep_idx = np.append(keep_cols, n)
+    pos = np.full(n, -1, dtype=int)
+    pos[keep_cols] = np.arange(len(keep_cols))
+    var_names_full = var_names
+    var_names = [var_names_full[j] for j in keep_cols]
+    basic_vars = [f"R{i+1}" if es_art[j] else var_names_full[j] for i, j in enumerate(basis)]
+
+    zjc = obj.copy()
+    zjc[:-1][es_art] = 0.0
+    if rows[:, -1].min(initial=0.0) >= -tol:
+        metodo = "primal"
+    elif (zjc[:-1] >= -tol).all() if maximize else (zjc[:-1] <= tol).all():
+        metodo = "dual"
+    else:
+        return None
+
+    if max_iter is None:
+        max_iter = max(200, 10 * (m + n))
+    pricer = Pricer(pricing, harris=harris)
+
+    recorder = TraceRecorder(trace)
+    all_tables = recorder.tables
+    recorder.table(rows, obj, basic_vars, var_names, 2, 0, f"Tabla Inicial - {titulo}",
+                   cols=keep_idx, tableau_completo=tableau, arranque=metodo)
+
+    iter_count = 0
+    while True:
+        iter_count += 1
+        if iter_count > max_iter:
+            raise RuntimeError(f"Máximo iteraciones alcanzado (simplex {metodo}).")
+
+        np.copyto(zjc, obj)
+        zjc[:-1][es_art] = 0.0
+        record = recorder.table(rows, obj, basic_vars, var_names, 2, iter_count,
+                                f"Iteración {iter_count} - Simplex {metodo}", cols=keep_idx, iteracion=True)
+        log_zjc(zjc)
+
+        if metodo == "primal":
+            pivot_row, pivot_col, status = pricer.choose_pivot(rows, zjc, basis, maximize=maximize)
+        else:
+            pivot_row, pivot_col, status = choose_pivot_dual(rows, zjc, maximize=maximize,
+                                                             permitidas=permitidas)
+        if pivot_row is not None:
+            recorder.set_pivot(record, tableau, pivot_row, pos[pivot_col], pivot_col,
+                               var_names_full[pivot_col], basic_vars[pivot_row])
+
+        if status == 'optimal':
+            break
+        if status in ('unbounded', 'infeasible'):
+            logger.info("Simplex %s: problema %s.", metodo,
+                        "no acotado" if status == 'unbounded' else "infactible")
+            return None, None, all_tables, {"metodo": metodo, "iteraciones": iter_count - 1, "basis": None}
+
+        sale = basic_vars[pivot_row]
+        basic_vars[pivot_row] = var_names_full[pivot_col]
+        basis[pivot_row] = pivot_col
+        engine.pivot(pivot_row, pivot_col)
+        if callback is not None:
+            callback({
+                "phase": 2,
+                "iteration": iter_count,
+                "entra": var_names_full[pivot_col],
+                "sale": sale,
+                "objective": float(obj[-1]),
+                "elapsed": time.perf_counter() - t_start
+            })
+        log_tableau(rows, basic_vars, var_names, title=f"Después de pivote {metodo} (iter {iter_count})", cols=keep_idx)
+
+    # Una artificial básica distinta de 0 indica que el nuevo LD es
+    # inconsistente con una fila redundante: lo decide la Fase 1
+    tol_art = tol_relativa(b, TOL_FACTIBILIDAD)
+    if any(es_art[j] and abs(rows[i, -1]) > tol_art for i, j in enumerate(basis)):
+        return None
+
+    solution = {name: 0.0 for name in var_names}
+    for i, j in enumerate(basis):
+        if not es_art[j]:
+            solution[var_names_full[j]] = rows[i, -1]
+    Z_opt = obj[-1]
+
+    recorder.table(rows, obj, basic_vars, var_names, 2, iter_count+1, "Tabla Final - Solución Óptima",
+                   cols=keep_idx, Z_value=float(Z_opt))
+
+    info = {"metodo": metodo, "iteraciones": iter_count - 1, "basis": basis}
+    if metodo == "primal":
+        info.update(pricer.info())
+    if identity_cols is not None:
+        info["sensibilidad"] = sensitivity_analysis(rows, obj, basis, b, c_final, identity_cols,
+                                                    np.flatnonzero(es_art), var_names_full, mode=mode,
+                                                    row_signs=row_signs, tol=tol)
+    return solution, Z_opt, all_tables, info
+
+
+# -------------------------
+# Programación paramétrica (costos o LD)
+# -------------------------
+PARAMETRIC_TARGETS = ("costos", "ld")
+
+
+def parametric_method(A, b, c_final, var_names, basis, artificial_indices, direccion, t_inicio, t_fin,
+                      objetivo="costos", mode=0, max_iter=200, tol=1e-9):
+    """
+    Recorre t en [t_inicio, t_fin] para c(t) = c + t*d (objetivo="costos")
+    o b(t) = b + t*d (objetivo="ld"), partiendo de `basis`, óptima en
+    t_inicio. El tableau lleva una columna extra con B^-1 d y una fila
+    objetivo extra con los Zj-Cj de d, así que cada cambio de base óptima
+    es un único pivote (primal para costos, dual para el LD).
+
+    Retorna (tramos, limite):
+      tramos: lista de diccionarios {desde, hasta, valor_desde, valor_hasta,
+        pendiente, base, x_desde, x_hasta, entra, sale}; en cada tramo la
+        base es óptima y el valor óptimo es lineal en t
+      limite: None si se llegó a t_fin, o {"t", "estado"} con estado
+        "No acotado" | "Infactible" a partir de ese t
+
+    `basis` debe ser primal factible en t_inicio (LD >= 0 al construir la
+    Fase 1): lanza RuntimeError si algún tramo empieza con x < 0.
+    """
+    if objetivo not in PARAMETRIC_TARGETS:
+        raise ValueError(f"Objetivo paramétrico '{objetivo}' no reconocido (usar {', '.join(PARAMETRIC_TARGETS)}).")
+    if t_fin < t_inicio:
+        raise ValueError("El intervalo del parámetro debe cumplir desde <= hasta.")
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    basis = [int(j) for j in basis]
+    c_final = np.asarray(c_final, dtype=float)
+    direccion = np.asarray(direccion, dtype=float)
+
+    # Tableau [A | b | d_b] con filas objetivo de c y de d_c (una de las dos d es 0)
+    d_c = direccion if objetivo == "costos" else np.zeros(n)
+    d_b = direccion if objetivo == "ld" else np.zeros(m)
+    tableau = np.zeros((m + 2, n + 2), dtype=float)
+    tableau[:m, :n] = A
+    tableau[:m, n] = b
+    tableau[:m, n + 1] = d_b
+    tableau[:m] = np.linalg.solve(A[:, basis], tableau[:m])
+    tableau[m, :n] = -c_final
+    tableau[m + 1, :n] = -d_c
+    tableau[m:] += np.vstack([c_final[basis], d_c[basis]]) @ tableau[:m]
+    engine = PivotEngine(tableau)
+    rows = tableau[:m]
+
+    es_art = np.zeros(n, dtype=bool)
+    es_art[np.asarray(artificial_indices, dtype=int)] = True
+    maximize = mode == 1
+    if objetivo == "ld" and any(es_art[j] and abs(rows[i, n + 1]) > tol for i, j in enumerate(basis)):
+        raise ValueError("La dirección del LD es incompatible con una restricción redundante.")
+
+    def pendiente():
+        # Solo uno de los dos términos es distinto de 0 (d en costos o en el LD)
+        return float(tableau[m, n + 1] + tableau[m + 1, n])
+
+    def valor(t):
+        return float(tableau[m, n] + t * pendiente())
+
+    def x(t):
+        valores = np.zeros(n)
+        valores[basis] = rows[:, n] + t * rows[:, n + 1]
+        valores[es_art] = 0.0
+        return valores
+
+    tramos = []
+    limite = None
+    t = float(t_inicio)
+    tol_x = tol_relativa(np.concatenate([np.asarray(b, dtype=float), d_b]), TOL_FACTIBILIDAD)
+    for _ in range(max_iter):
+        x_t = x(t)
+        if x_t.min(initial=0.0) < -tol_x:
+            j = int(np.argmin(x_t))
+            raise RuntimeError(f"La base no es factible en t = {t:g} ({var_names[j]} = {x_t[j]:g}).")
+        if objetivo == "costos":
+            # Primer t en que un Zj-Cj cambia de signo (artificiales fuera)
+            r0 = tableau[m, :n]
+            rd = np.where(es_art, 0.0, tableau[m + 1, :n])
+            cruza = rd < -tol if maximize else rd > tol
+        else:
+            # Primer t en que una básica se vuelve negativa
+            r0 = rows[:, n]
+            rd = rows[:, n + 1]
+            cruza = rd < -tol
+        cortes = np.full(rd.shape, np.inf)
+        cortes[cruza] = np.maximum(-r0[cruza] / rd[cruza], t)
+        k = int(np.argmin(cortes))
+        t_sig = float(cortes[k])
+        hasta = min(t_sig, float(t_fin))
+
+        if hasta > t or not tramos:
+            tramos.append({
+                "desde": t,
+                "hasta": hasta,
+                "valor_desde": valor(t),
+                "valor_hasta": valor(hasta),
+                "pendiente": pendiente(),
+                "base": [var_names[j] for j in basis],
+                "x_desde": x_t.tolist(),
+                "x_hasta": x(hasta).tolist(),
+                "entra": None,
+                "sale": None
+            })
+        if t_sig >= t_fin:
+            break
+
+        if objetivo == "costos":
+            q = k
+            col = rows[:, q]
+            positivos = col > tol
+            if not positivos.any():
+                limite = {"t": t_sig, "estado": "No acotado"}
+                break
+            ratios = np.where(positivos, rows[:, n] / np.where(positivos, col, 1.0), np.inf)
+            r = int(np.argmin(ratios))
+        else:
+            r = k
+            fila = rows[r, :n]
+            candidatas = (fila < -tol) & ~es_art
+            if not candidatas.any():
+                limite = {"t": t_sig, "estado": "Infactible"}
+                break
+            ratios = np.full(n, np.inf)
+            ratios[candidatas] = np.abs(tableau[m, :n][candidatas] / fila[candidatas])
+            q = int(np.argmin(ratios))
+
+        tramos[-1]["entra"] = var_names[q]
+        tramos[-1]["sale"] = var_names[basis[r]]
+        logger.debug("Paramétrico: t = %g, entra %s, sale %s", t_sig, var_names[q], var_names[basis[r]])
+        engine.pivot(r, q)
+        basis[r] = q
+        t = t_sig
+    else:
+        raise RuntimeError("Máximo de cambios de base alcanzado en el análisis paramétrico.")
+
+    return tramos, limite
+
+
+# -------------------------
+# Doble Fase en lote (problemas de igual forma apilados)
+# -------------------------
+def _batch_pivot(T, p, r, c):
+    # Pivote de rango 1 en los tableaus T[p] con fila r[k] y columna c[k]
+    prow = T[p, r, :] / T[p, r, c][:, None]
+    col = T[p, :, c]
+    col[np.arange(len(p)), r] = 0.0
+    T[p] -= col[:, :, None] * prow[:, None, :]
+    T[p, r, :] = prow
+
+
+def _batch_simplex(T, basis, obj_row, activos, maximize, permitidas, max_iter, tol=TOL_PIVOTE, degenerate_limit=None,
+                   contadores=None):
+    """
+    Itera el simplex sobre todos los tableaus activos a la vez, con la misma
+    regla que choose_pivot_custom (columna de mayor |Zj-Cj| y menor cociente,
+    primer índice en empates). Retorna el estado de cada problema:
+    'optimal' | 'unbounded' | 'max_iter' ('' para los que no estaban activos).
+    tol: un valor común o uno por problema (k,), para mejora y pivotes.
+
+    Anticiclado como en Pricer: tras `degenerate_limit` pivotes degenerados
+    seguidos (por defecto max(10, m)) ese problema pasa a la regla de Bland
+    (menor índice que mejora; en empates del cociente sale la básica de
+    menor índice) hasta su siguiente pivote no degenerado.
+    contadores: arreglos (k,) de _contadores_lote que se actualizan en cada
+    pivote; pasar los mismos en ambas fases conserva el anticiclado entre
+    fases, como el Pricer único de two_phase_method_fixed.
+    """
+    m = basis.shape[1]
+    tol = np.broadcast_to(np.asarray(tol, dtype=float), (T.shape[0],))
+    limite = degenerate_limit or max(10, m)
+    estado = np.where(activos, "optimal", "").astype(object)
+    activos = activos.copy()
+    if contadores is None:
+        contadores = _contadores_lote(T.shape[0])
+    seguidos, bland = contadores["seguidos"], contadores["bland"]
+    iteracion = 0
+    while activos.any():
+        if iteracion >= max_iter:
+            estado[activos] = "max_iter"
+            break
+        iteracion += 1
+
+        p = np.flatnonzero(activos)
+        zjc = np.where(permitidas, T[p, obj_row, :-1], 0.0)
+        d = -zjc if maximize else zjc
+        mejora = d > tol[p][:, None]
+        hay_mejora = mejora.any(axis=1)
+        c = np.where(bland[p], mejora.argmax(axis=1), np.where(mejora, d, -np.inf).argmax(axis=1))
+        activos[p[~hay_mejora]] = False
+        p, c = p[hay_mejora], c[hay_mejora]
+        if not len(p):
+            break
+
+        col = T[p, :m, c]
+        positivos = col > tol[p][:, None]
+        ratios = np.where(positivos, T[p, :m, -1] / np.where(positivos, col, 1.0), np.inf)
+        r = ratios.argmin(axis=1)
+        no_acotado = ~positivos.any(axis=1)
+        estado[p[no_acotado]] = "unbounded"
+        activos[p[no_acotado]] = False
+        p, c, r, ratios = p[~no_acotado], c[~no_acotado], r[~no_acotado], ratios[~no_acotado]
+
+        theta = ratios[np.arange(len(p)), r]
+        if bland[p].any():
+            empates = ratios <= theta[:, None]
+            r_bland = np.where(empates, basis[p], np.iinfo(basis.dtype).max).argmin(axis=1)
+            r = np.where(bland[p], r_bland, r)
+        degenerado = theta <= tol[p]
+        seguidos[p] = np.where(degenerado, seguidos[p] + 1, 0)
+        activar = degenerado & ~bland[p] & (seguidos[p] >= limite)
+        if activar.any():
+            logger.info("Lote: %d problemas con %d pivotes degenerados seguidos, se aplica Bland.",
+                        int(activar.sum()), limite)
+        bland[p] = np.where(degenerado, bland[p] | activar, False)
+        contadores["pivotes"][p] += 1
+        contadores["pivotes_degenerados"][p] += degenerado
+        contadores["activaciones_bland"][p] += activar
+
+        _batch_pivot(T, p, r, c)
+        basis[p, r] = c
+    return estado
+
+
+def _contadores_lote(k):
+    # Pivotes, anticiclado y racha de degenerados de cada problema del lote
+    contadores = {clave: np.zeros(k, dtype=int)
+                  for clave in ("pivotes", "pivotes_degenerados", "activaciones_bland", "seguidos")}
+    contadores["bland"] = np.zeros(k, dtype=bool)
+    return contadores
+
+
+def two_phase_method_batch(A, b, c_final, basic_idx, basic_costs_init, artificial_indices, mode=0, max_iter=None,
+                           return_info=False):
+    """
+    Doble Fase para k problemas con la misma estructura de columnas
+    (mismo número de variables y mismos signos de restricción), apilados en
+    un tableau 3-D de forma (k, m+2, n+1). Cada pivote se aplica a todos los
+    problemas activos con una sola operación NumPy.
+
+    A: (k, m, n), b: (k, m), c_final: (k, n); basic_idx, basic_costs_init y
+    artificial_indices son comunes a todos (salen de construir_forma_estandar).
+
+    Retorna (X, Z, estados, basis): X (k, n) valores de todas las columnas,
+    Z (k,), una lista con 'optimal' | 'infeasible' | 'unbounded' |
+    'max_iter_1' | 'max_iter_2' por problema y la base final (k, m). No
+    registra tablas: equivale a trace='none'.
+
+    return_info: si es True retorna además un diccionario con listas por
+    problema de "iteraciones_fase1", "iteraciones_fase2",
+    "pivotes_degenerados" y "activaciones_bland" (mismos valores que
+    two_phase_method_fixed con pricing Dantzig).
+    """
+    A = np.asarray(A, dtype=float)
+    k, m, n = A.shape
+    if max_iter is None:
+        max_iter = max(200, 10 * (m + n))
+    T = np.zeros((k, m + 2, n + 1), dtype=float)
+    T[:, :m, :-1] = A
+    T[:, :m, -1] = b
+    T[:, m, :-1] = -np.asarray(c_final, dtype=float)
+
+    artificial_indices = np.asarray(artificial_indices, dtype=int)
+    es_art = np.zeros(n, dtype=bool)
+    es_art[artificial_indices] = True
+    c_phase1 = np.zeros(n + 1, dtype=float)
+    c_phase1[artificial_indices] = 1.0 if mode == 0 else -1.0
+    T[:, m + 1] = np.einsum("i,kij->kj", np.asarray(basic_costs_init, dtype=float), T[:, :m]) - c_phase1
+
+    basis = np.tile(np.asarray(basic_idx, dtype=int), (k, 1))
+    maximize = mode == 1
+    todas = np.ones(n, dtype=bool)
+
+    # FASE 1
+    contadores = _contadores_lote(k)
+    estado = _batch_simplex(T, basis, m + 1, np.ones(k, dtype=bool), maximize, todas, max_iter,
+                            contadores=contadores)
+    iteraciones_fase1 = contadores["pivotes"].copy()
+    contadores["pivotes"][:] = 0
+    estado[estado == "max_iter"] = "max_iter_1"
+    estado[estado == "unbounded"] = "infeasible"
+    tol_w = TOL_FACTIBILIDAD * np.maximum(1.0, np.abs(np.asarray(b, dtype=float)).max(axis=1, initial=0.0))
+    factible = (estado == "optimal") & (np.abs(T[:, m + 1, -1]) <= tol_w)
+    estado[(estado == "optimal") & ~factible] = "infeasible"
+
+    # Sacar de la base las artificiales que queden (poco frecuente: problema a problema)
+    for p, i in zip(*np.nonzero(es_art[basis] & factible[:, None])):
+        fila = T[p, i, :-1]
+        candidatas = np.flatnonzero(~es_art & (np.abs(fila) > tol_relativa(fila, TOL_PIVOTE)))
+        if candidatas.size:
+            j = candidatas[0]
+            _batch_pivot(T, np.array([p]), np.array([i]), np.array([j]))
+            basis[p, i] = j
+
+    # FASE 2 (artificiales fuera del pricing), tolerancia relativa a los costos de cada problema
+    tol_costos = np.array([tol_relativa(c, TOL_PIVOTE) for c in np.asarray(c_final, dtype=float)])
+    estado2 = _batch_simplex(T, basis, m, factible, maximize, ~es_art, max_iter, tol=tol_costos,
+                             contadores=contadores)
+    estado = np.where(factible, estado2, estado)
+    estado[estado == "max_iter"] = "max_iter_2"
+
+    X = np.zeros((k, n), dtype=float)
+    filas = np.arange(k)[:, None]
+    X[filas, basis] = T[:, :m, -1]
+    X[:, es_art] = 0.0
+    if return_info:
+        info = {
+            "iteraciones_fase1": iteraciones_fase1.tolist(),
+            "iteraciones_fase2": contadores["pivotes"].tolist(),
+            "pivotes_degenerados": contadores["pivotes_degenerados"].tolist(),
+            "activaciones_bland": contadores["activaciones_bland"].tolist()
+        }
+        return X, T[:, m, -1].copy(), estado.tolist(), basis, info
+    return X, T[:, m, -1].copy(), estado.tolist(), basis
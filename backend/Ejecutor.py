@@ -0,0 +1,257 @@
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------
+# Errores del ejecutor
+# -------------------------
+class ExecutorError(Exception):
+    """Base de los errores propios del ejecutor (no del solver)."""
+
+
+class ExecutorBusy(ExecutorError):
+    """Todos los workers ocupados y la cola llena: el cliente debe reintentar."""
+
+
+class SolveTimeout(ExecutorError):
+    """La resolución superó su tiempo límite y el proceso fue terminado."""
+
+
+class SolveFailed(Exception):
+    """
+    Excepción lanzada por el solver dentro del worker. Conserva el mensaje
+    original y el traceback del proceso hijo en `detalles`.
+    """
+    def __init__(self, mensaje, detalles=None):
+        super().__init__(mensaje)
+        self.detalles = detalles
+
+
+class WorkerCrashed(SolveFailed):
+    """
+    El proceso worker terminó inesperadamente (p.ej. sin memoria) o no se
+    pudo iniciar. No depende del problema: la respuesta no debe cachearse.
+    """
+
+
+# -------------------------
+# Proceso worker
+# -------------------------
+class _ProgressSender:
+    """Callback del solver dentro del worker: reenvía el progreso al padre (como máximo cada `intervalo` s)."""
+    def __init__(self, conn, intervalo=0.05):
+        self.conn = conn
+        self.intervalo = intervalo
+        self._ultimo = 0.0
+        self._fase = None
+
+    def __call__(self, info):
+        ahora = time.monotonic()
+        if info.get("phase") != self._fase or ahora - self._ultimo >= self.intervalo:
+            self._fase = info.get("phase")
+            self._ultimo = ahora
+            self.conn.send(("progress", info))
+
+
+def _worker_main(conn):
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            break
+        if task is None:
+            break
+        fn, args, kwargs, con_progreso = task
+        if con_progreso:
+            kwargs = dict(kwargs, callback=_ProgressSender(conn))
+        try:
+            result = ("ok", fn(*args, **kwargs))
+        except Exception as e:
+            result = ("error", str(e), traceback.format_exc())
+        conn.send(result)
+
+
+class _Worker:
+    def __init__(self, ctx):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker_main, args=(child,), daemon=True)
+        self.proc.start()
+        child.close()
+
+    def kill(self):
+        self.proc.kill()
+        self.proc.join(1)
+        self.conn.close()
+
+    def close(self):
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.proc.join(1)
+        if self.proc.is_alive():
+            self.proc.kill()
+        self.conn.close()
+
+
+# -------------------------
+# Pool acotado con tiempo límite
+# -------------------------
+class SolveExecutor:
+    """
+    Pool acotado de procesos para correr los solvers fuera del hilo de la
+    petición.
+
+    - workers: procesos persistentes (0 = ejecutar en línea, sin límite de tiempo)
+    - max_queue: peticiones que pueden esperar un worker libre; si se supera
+      se lanza ExecutorBusy en lugar de encolar sin límite
+    - timeout: tiempo límite por defecto (segundos, incluye la espera en cola);
+      al vencer, el proceso se termina y se reemplaza por uno nuevo
+
+    Los procesos se crean en el primer uso de cada proceso padre, así que es
+    seguro con preload_app de gunicorn (no se heredan por fork).
+    """
+    def __init__(self, workers=2, max_queue=8, timeout=30.0, max_timeout=None, context="spawn"):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.max_timeout = max_timeout if max_timeout is not None else timeout
+        self._ctx = multiprocessing.get_context(context)
+        self._slots = threading.BoundedSemaphore(max(1, workers + max_queue))
+        self._lock = threading.Lock()
+        self._idle = None
+        self._pid = None
+        self._faltantes = 0
+
+    @classmethod
+    def from_env(cls, prefix="SOLVER", workers=2, max_queue=8, timeout=30.0):
+        """Configura el pool desde {prefix}_WORKERS, _MAX_QUEUE, _TIMEOUT, _MAX_TIMEOUT y _MP_CONTEXT."""
+        timeout = float(os.environ.get(f"{prefix}_TIMEOUT", timeout))
+        return cls(
+            workers=int(os.environ.get(f"{prefix}_WORKERS", workers)),
+            max_queue=int(os.environ.get(f"{prefix}_MAX_QUEUE", max_queue)),
+            timeout=timeout,
+            max_timeout=float(os.environ.get(f"{prefix}_MAX_TIMEOUT", timeout)),
+            context=os.environ.get(f"{prefix}_MP_CONTEXT", "spawn")
+        )
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._idle = queue.Queue()
+            self._faltantes = 0
+            for _ in range(self.workers):
+                self._idle.put(self._nuevo_worker())
+            self._pid = os.getpid()
+
+    def _reemplazar(self, worker):
+        # Termina un worker en estado desconocido y pone uno nuevo en la cola.
+        # Si no se puede crear, el pool queda con un proceso menos hasta _reponer
+        worker.kill()
+        try:
+            self._idle.put(self._nuevo_worker())
+        except WorkerCrashed as e:
+            with self._lock:
+                self._faltantes += 1
+            logger.error("No se pudo reemplazar el worker del solver (%s); quedan %d de %d.",
+                         e, self.workers - self._faltantes, self.workers)
+
+    def _reponer(self):
+        # Reintenta crear los workers que no se pudieron reemplazar
+        with self._lock:
+            while self._faltantes:
+                try:
+                    self._idle.put(self._nuevo_worker())
+                except WorkerCrashed as e:
+                    logger.error("No se pudo reponer el worker del solver: %s", e)
+                    break
+                self._faltantes -= 1
+
+    def _nuevo_worker(self):
+        try:
+            return _Worker(self._ctx)
+        except Exception as e:
+            raise WorkerCrashed(f"No se pudo iniciar el proceso del solver: {e}", traceback.format_exc()) from e
+
+    def resolve_timeout(self, timeout=None):
+        # Tiempo límite pedido por el cliente, acotado por max_timeout
+        if timeout is None:
+            return self.timeout
+        return max(0.0, min(float(timeout), self.max_timeout))
+
+    def run(self, fn, *args, timeout=None, progress=None, **kwargs):
+        """
+        Ejecuta fn(*args, **kwargs) en un worker y retorna su resultado.
+        fn debe ser una función de módulo (se envía por pickle).
+        Con progress, fn recibe callback= y cada aviso del worker se entrega
+        a progress(info) en este proceso.
+        """
+        if self.workers == 0:
+            if progress is not None:
+                kwargs = dict(kwargs, callback=progress)
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                raise SolveFailed(str(e), traceback.format_exc()) from e
+
+        if not self._slots.acquire(blocking=False):
+            raise ExecutorBusy("Servidor ocupado: demasiadas resoluciones en curso.")
+        try:
+            self._ensure_started()
+            if self._faltantes:
+                self._reponer()
+            limite = self.resolve_timeout(timeout)
+            deadline = time.monotonic() + limite
+            try:
+                worker = self._idle.get(timeout=limite)
+            except queue.Empty:
+                raise SolveTimeout(f"Tiempo límite de {limite:g} s agotado esperando un worker.")
+
+            # El worker vuelve a la cola solo tras recibir su resultado; ante
+            # cualquier otra salida (tiempo límite, caída, error en progress)
+            # puede seguir ocupado con esta tarea y se reemplaza
+            completo = False
+            try:
+                worker.conn.send((fn, args, kwargs, progress is not None))
+                while True:
+                    if not worker.conn.poll(max(0.0, deadline - time.monotonic())):
+                        logger.warning("Resolución cancelada por tiempo límite (%g s), reiniciando worker.", limite)
+                        raise SolveTimeout(f"Tiempo límite de {limite:g} s agotado.")
+                    result = worker.conn.recv()
+                    if result[0] != "progress":
+                        break
+                    progress(result[1])
+                completo = True
+            except (EOFError, OSError) as e:
+                logger.error("El proceso del solver terminó inesperadamente, reiniciando worker.")
+                raise WorkerCrashed("El proceso del solver terminó inesperadamente.") from e
+            finally:
+                if completo:
+                    self._idle.put(worker)
+                else:
+                    self._reemplazar(worker)
+        finally:
+            self._slots.release()
+
+        if result[0] == "error":
+            raise SolveFailed(result[1], result[2])
+        return result[1]
+
+    def shutdown(self):
+        with self._lock:
+            if self._idle is None or self._pid != os.getpid():
+                return
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._pid = None
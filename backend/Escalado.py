@@ -0,0 +1,167 @@
+import logging
+
+import numpy as np
+
+from backend.FormaEstandar import coeficientes_a_matriz
+
+logger = logging.getLogger(__name__)
+
+# Con escalado="auto" se escala si max|a| / min|a| (no nulos) supera este valor
+ESCALADO_UMBRAL = 1e4
+
+
+# -------------------------
+# Factores de escala
+# -------------------------
+def rango_coeficientes(A):
+    """max|a| / min|a| sobre los coeficientes no nulos (1 si no hay)."""
+    absA = np.abs(A[A != 0])
+    return float(absA.max() / absA.min()) if absA.size else 1.0
+
+
+def factores_escala(A, pasadas=8, mejora_minima=0.9):
+    """
+    Factores de fila R y de columna S para A' = diag(R) A diag(S):
+    pasadas alternadas de media geométrica (cada fila y luego cada columna
+    se divide por sqrt(max|a| * min|a|)) mientras la razón max/min mejore al
+    menos un 10 %, y al final equilibrado por filas (máximo |a| de cada fila
+    en (0.5, 1]). Los factores son potencias de 2, así el escalado y su
+    inversa son exactos en punto flotante.
+    """
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    nz = A != 0
+    # Trabajo en log2: escalar es sumar r_i + s_j
+    logA = np.log2(np.abs(np.where(nz, A, 1.0)))
+    r = np.zeros(m)
+    s = np.zeros(n)
+    filas_nz = nz.any(axis=1)
+    cols_nz = nz.any(axis=0)
+
+    def extremos(L, eje):
+        return (np.where(nz, L, -np.inf).max(axis=eje), np.where(nz, L, np.inf).min(axis=eje))
+
+    def amplitud():
+        L = logA + r[:, None] + s
+        alto, bajo = extremos(L, None)
+        return alto - bajo if nz.any() else 0.0
+
+    previa = amplitud()
+    for _ in range(pasadas):
+        # Filas y columnas vacías no se escalan (sus extremos son -inf / inf)
+        alto, bajo = extremos(logA + r[:, None] + s, 1)
+        r[filas_nz] -= (alto[filas_nz] + bajo[filas_nz]) / 2
+        alto, bajo = extremos(logA + r[:, None] + s, 0)
+        s[cols_nz] -= (alto[cols_nz] + bajo[cols_nz]) / 2
+        actual = amplitud()
+        # En log2: mejora del 10 % en la razón = resta de log2(1/0.9)
+        if actual > previa + np.log2(mejora_minima):
+            break
+        previa = actual
+
+    r = np.round(r)
+    s = np.round(s)
+    alto, _ = extremos(logA + r[:, None] + s, 1)
+    r[filas_nz] -= np.ceil(alto[filas_nz])
+    return np.exp2(r), np.exp2(s)
+
+
+# -------------------------
+# Escalar / desescalar el problema de /resolver
+# -------------------------
+def requiere_escalado(restricciones_data, n, umbral=ESCALADO_UMBRAL):
+    """True si max|a| / min|a| de las restricciones alcanza `umbral`."""
+    return rango_coeficientes(coeficientes_a_matriz(restricciones_data, n)) >= umbral
+
+
+def escalar_restricciones(restricciones_data, coeficientes, n, nombres=None):
+    """
+    Escala el problema con factores_escala (que solo dependen de A, así el
+    mismo A da el mismo problema escalado y la base sigue sirviendo):
+      A' = R A S,  b' = R b,  c' = S c,  x = S x',  Z' = Z.
+    Retorna un diccionario con las "restricciones" y "coeficientes"
+    escalados (mismo formato de /resolver), los factores R y S y "stats"
+    (rango de coeficientes antes y después). nombres: nombre de cada
+    variable x en la solución (por defecto x1..xn).
+    """
+    A = coeficientes_a_matriz(restricciones_data, n)
+    R, S = factores_escala(A)
+    A_esc = A * R[:, None] * S
+    c = np.zeros(n, dtype=float)
+    k = min(len(coeficientes), n)
+    c[:k] = np.asarray(coeficientes[:k], dtype=float)
+
+    restricciones = [
+        {"coeficientes": fila.tolist(), "signo": r['signo'], "c": float(r['c']) * R[i]}
+        for i, (fila, r) in enumerate(zip(A_esc, restricciones_data))
+    ]
+    stats = {
+        "rango_antes": rango_coeficientes(A),
+        "rango_despues": rango_coeficientes(A_esc)
+    }
+    logger.debug("Escalado: rango de coeficientes %.3g -> %.3g", stats["rango_antes"], stats["rango_despues"])
+    return {
+        "restricciones": restricciones,
+        "coeficientes": (c * S).tolist(),
+        "R": R,
+        "S": S,
+        "S_x": dict(zip(nombres or [f"x{j+1}" for j in range(n)], S.tolist())),
+        "signos": [r['signo'] for r in restricciones_data],
+        "stats": stats
+    }
+
+
+def desescalar_solucion(esc, solution):
+    """
+    solution {nombre: valor} del problema escalado -> problema original:
+    x_j = S_j x'_j; la holgura o exceso de la fila i se divide por R_i.
+    """
+    R, S_x = esc["R"], esc["S_x"]
+    signos = np.asarray(esc["signos"], dtype=object)
+    filas = {"s": np.flatnonzero(signos == 'leq'), "e": np.flatnonzero(signos == 'geq')}
+    original = {}
+    for nombre, valor in solution.items():
+        if nombre in S_x:
+            original[nombre] = valor * S_x[nombre]
+        elif nombre[0] in filas:
+            original[nombre] = valor / R[filas[nombre[0]][int(nombre[1:]) - 1]]
+        else:
+            original[nombre] = valor
+    return original
+
+
+def desescalar_sensibilidad(esc, sens):
+    """
+    Análisis de sensibilidad del problema escalado -> problema original:
+    precio sombra y_i = R_i y'_i y LD / R_i; costos, costos reducidos y
+    sus rangos / S_j, valores * S_j. Los límites None (sin límite) se conservan.
+    """
+    R, S_x = esc["R"], esc["S_x"]
+
+    def div(v, f):
+        return None if v is None else v / f
+
+    restricciones = []
+    for r in sens["restricciones"]:
+        f = R[r["restriccion"] - 1]
+        restricciones.append(dict(
+            r,
+            precio_sombra=r["precio_sombra"] * f,
+            ld=r["ld"] / f,
+            aumento_permitido=div(r["aumento_permitido"], f),
+            disminucion_permitida=div(r["disminucion_permitida"], f),
+            rango=[div(v, f) for v in r["rango"]]
+        ))
+    variables = []
+    for v in sens["variables"]:
+        f = S_x[v["variable"]]
+        variables.append(dict(
+            v,
+            valor=v["valor"] * f,
+            costo=v["costo"] / f,
+            costo_reducido=v["costo_reducido"] / f,
+            aumento_permitido=div(v["aumento_permitido"], f),
+            disminucion_permitida=div(v["disminucion_permitida"], f),
+            rango=[div(c, f) for c in v["rango"]]
+        ))
+    return {"restricciones": restricciones, "variables": variables}
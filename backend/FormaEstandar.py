@@ -0,0 +1,289 @@
+import base64
+import hashlib
+import json
+
+import numpy as np
+
+
+# Signos de restricción aceptados por /resolver
+SIGNOS = ("leq", "geq", "eq")
+
+
+def validar_signos(signos):
+    """Lanza ValueError si algún signo no es 'leq', 'geq' o 'eq'."""
+    for i, signo in enumerate(signos):
+        if signo not in SIGNOS:
+            raise ValueError(f"Signo no válido en la restricción {i + 1}: {signo!r} (usar {', '.join(SIGNOS)})")
+
+
+# -------------------------
+# Matriz de coeficientes originales
+# -------------------------
+def coeficientes_a_matriz(restricciones_data, n):
+    """
+    Convierte los 'coeficientes' de cada restricción a una matriz (m x n).
+    Las filas más cortas se completan con 0 y las más largas se recortan.
+    """
+    m = len(restricciones_data)
+    filas = [r['coeficientes'] for r in restricciones_data]
+    if m and all(len(f) == n for f in filas):
+        return np.array(filas, dtype=float).reshape(m, n)
+    X = np.zeros((m, n), dtype=float)
+    for i, f in enumerate(filas):
+        k = min(len(f), n)
+        X[i, :k] = np.asarray(f[:k], dtype=float)
+    return X
+
+
+# -------------------------
+# Forma estándar para Doble Fase
+# -------------------------
+def construir_forma_estandar(restricciones_data, coeficientes, n, mode=0):
+    """
+    Construye el problema aumentado [x | s | e | A] para two_phase_method_fixed.
+
+    Las columnas de holgura, exceso y artificiales se colocan como bloques
+    identidad (con signo) usando máscaras por tipo de restricción:
+      leq -> holgura +1 (básica)
+      geq -> exceso -1 y artificial +1 (básica)
+      eq  -> artificial +1 (básica)
+
+    Retorna un diccionario con arrays NumPy listos para el solver. Lanza
+    ValueError si algún signo no es leq, geq o eq.
+    """
+    m = len(restricciones_data)
+    validar_signos([r['signo'] for r in restricciones_data])
+    signos = np.array([r['signo'] for r in restricciones_data], dtype=object)
+    es_leq = signos == 'leq'
+    es_geq = signos == 'geq'
+    es_art = es_geq | (signos == 'eq')
+
+    filas_s = np.flatnonzero(es_leq)
+    filas_e = np.flatnonzero(es_geq)
+    filas_a = np.flatnonzero(es_art)
+    n_s, n_e, n_a = len(filas_s), len(filas_e), len(filas_a)
+
+    slack_idx = n
+    excess_idx = n + n_s
+    art_idx = n + n_s + n_e
+    total_vars = art_idx + n_a
+
+    A = np.zeros((m, total_vars), dtype=float)
+    A[:, :n] = coeficientes_a_matriz(restricciones_data, n)
+    A[filas_s, slack_idx + np.arange(n_s)] = 1.0
+    A[filas_e, excess_idx + np.arange(n_e)] = -1.0
+    cols_a = art_idx + np.arange(n_a)
+    A[filas_a, cols_a] = 1.0
+
+    b = np.array([float(r['c']) for r in restricciones_data], dtype=float)
+
+    c_final = np.zeros(total_vars, dtype=float)
+    k = min(len(coeficientes), n)
+    c_final[:k] = np.asarray(coeficientes[:k], dtype=float)
+
+    var_names = ([f"x{j+1}" for j in range(n)] +
+                 [f"s{j+1}" for j in range(n_s)] +
+                 [f"e{j+1}" for j in range(n_e)] +
+                 [f"A{j+1}" for j in range(n_a)])
+
+    # Variable básica inicial de cada fila: holgura (costo 0) o artificial
+    # (costo +1 en minimización, -1 en maximización)
+    basic_idx = np.empty(m, dtype=int)
+    basic_idx[filas_s] = slack_idx + np.arange(n_s)
+    basic_idx[filas_a] = cols_a
+    basic_costs_init = np.where(es_art, -1.0 if mode == 1 else 1.0, 0.0)
+
+    return {
+        "A": A,
+        "b": b,
+        "c_final": c_final,
+        "var_names": var_names,
+        "basic_vars_init": [var_names[j] for j in basic_idx],
+        "basic_idx": basic_idx,
+        "basic_costs_init": basic_costs_init,
+        "artificial_indices": cols_a,
+        "slack_count": n_s,
+        "excess_count": n_e,
+        "artificial_count": n_a,
+        "total_vars": total_vars,
+        "signos": signos.tolist(),
+    }
+
+
+# -------------------------
+# Cotas por variable (simplex con variables acotadas)
+# -------------------------
+def leer_cotas(cotas, n):
+    """
+    Cotas l_j <= x_j <= u_j de /resolver: una lista [l, u] por variable
+    (None = sin cota; por defecto [0, None]). Retorna (inferiores,
+    superiores) con inf donde no hay cota superior. Lanza ValueError si
+    una cota inferior no es finita o si u < l.
+    """
+    inferiores = np.zeros(n, dtype=float)
+    superiores = np.full(n, np.inf)
+    if len(cotas) > n:
+        raise ValueError(f"Se indicaron cotas para {len(cotas)} variables (hay {n}).")
+    for j, cota in enumerate(cotas):
+        l, u = (list(cota) + [None, None])[:2] if cota is not None else (None, None)
+        if l is not None:
+            inferiores[j] = float(l)
+        if u is not None:
+            superiores[j] = float(u)
+    if not np.isfinite(inferiores).all():
+        raise ValueError("Las cotas inferiores deben ser finitas.")
+    mal = np.flatnonzero(superiores < inferiores)
+    if mal.size:
+        raise ValueError(f"Cota superior menor que la inferior en x{mal[0] + 1}.")
+    return inferiores, superiores
+
+
+def desplazar_inferiores(restricciones_data, n, inferiores):
+    """
+    Sustituye x = l + x' (x' >= 0): b -= A l. Las filas que quedan con LD
+    negativo se multiplican por -1 (<= pasa a >= y viceversa), como espera
+    la Fase 1. Retorna las restricciones en el formato de /resolver.
+    """
+    A = coeficientes_a_matriz(restricciones_data, n)
+    b = np.array([float(r['c']) for r in restricciones_data], dtype=float) - A @ inferiores
+    restricciones = []
+    for fila, r, ld in zip(A, restricciones_data, b):
+        signo = r['signo']
+        if ld < 0:
+            fila, ld = -fila, -ld
+            signo = {'leq': 'geq', 'geq': 'leq'}.get(signo, signo)
+        restricciones.append({"coeficientes": fila.tolist(), "signo": signo, "c": float(ld)})
+    return restricciones
+
+
+def invertir_filas(restricciones_data, n, filas):
+    """
+    Multiplica por -1 las restricciones marcadas en `filas` (máscara o
+    índices): coeficientes y LD cambian de signo y <= pasa a >= y viceversa.
+    Sirve para dejar LD >= 0 antes de construir la forma estándar, así la
+    base inicial de la Fase 1 es factible. Retorna las restricciones en el
+    formato de /resolver.
+    """
+    invertir = np.zeros(len(restricciones_data), dtype=bool)
+    invertir[filas] = True
+    A = coeficientes_a_matriz(restricciones_data, n)
+    restricciones = []
+    for fila, r, inv in zip(A, restricciones_data, invertir):
+        signo, ld = r['signo'], float(r['c'])
+        if inv:
+            fila, ld = -fila, -ld
+            signo = {'leq': 'geq', 'geq': 'leq'}.get(signo, signo)
+        restricciones.append({"coeficientes": fila.tolist(), "signo": signo, "c": ld})
+    return restricciones
+
+
+def datos_originales(restricciones_data, coeficientes, n):
+    """(A, b, signos, c) del problema de /resolver; c se completa con 0 hasta n."""
+    A = coeficientes_a_matriz(restricciones_data, n)
+    b = np.array([float(r['c']) for r in restricciones_data], dtype=float)
+    signos = [r['signo'] for r in restricciones_data]
+    validar_signos(signos)
+    c = np.zeros(n, dtype=float)
+    k = min(len(coeficientes), n)
+    c[:k] = np.asarray(coeficientes[:k], dtype=float)
+    return A, b, signos, c
+
+
+def solucion_desde_x(A, b, signos, c, x):
+    """
+    (Z, solution) del problema original a partir de los valores de x:
+    solution {nombre: valor} con x, holguras y excesos de cada restricción
+    (numerados como en construir_forma_estandar).
+    """
+    actividad = A @ x
+    signos = np.asarray(signos, dtype=object)
+    solution = {f"x{j+1}": float(v) for j, v in enumerate(x)}
+    for k, i in enumerate(np.flatnonzero(signos == 'leq')):
+        solution[f"s{k+1}"] = float(b[i] - actividad[i])
+    for k, i in enumerate(np.flatnonzero(signos == 'geq')):
+        solution[f"e{k+1}"] = float(actividad[i] - b[i])
+    return float(c @ x), solution
+
+
+# -------------------------
+# Forma sin artificiales para el simplex dual
+# -------------------------
+def forma_simplex_dual(forma, mode=0, tol=1e-12):
+    """
+    Variante de la forma estándar sin columnas artificiales: cada fila geq
+    se multiplica por -1 para que su exceso quede básico (con LD <= 0), así
+    la base inicial es la de holguras/excesos y no hace falta Fase 1.
+
+    Esa base es dual factible si los costos tienen el signo adecuado
+    (c >= 0 al minimizar, c <= 0 al maximizar). Retorna None si no lo es o
+    si hay filas eq (necesitan artificial). Las columnas conservan los
+    índices de la forma completa (las artificiales son las últimas).
+    """
+    signos = np.array(forma["signos"], dtype=object)
+    if (signos == 'eq').any() or not ((signos == 'leq') | (signos == 'geq')).all():
+        return None
+    c = forma["c_final"]
+    if (c < -tol).any() if mode == 0 else (c > tol).any():
+        return None
+
+    n_total = forma["total_vars"] - forma["artificial_count"]
+    orientacion = np.where(signos == 'geq', -1.0, 1.0)
+    A = forma["A"][:, :n_total] * orientacion[:, None]
+    b = forma["b"] * orientacion
+
+    filas_s = np.flatnonzero(signos == 'leq')
+    filas_e = np.flatnonzero(signos == 'geq')
+    n = n_total - len(filas_s) - len(filas_e)
+    basic_idx = np.empty(len(signos), dtype=int)
+    basic_idx[filas_s] = n + np.arange(len(filas_s))
+    basic_idx[filas_e] = n + len(filas_s) + np.arange(len(filas_e))
+
+    return dict(
+        forma,
+        A=A,
+        b=b,
+        c_final=c[:n_total],
+        var_names=forma["var_names"][:n_total],
+        basic_idx=basic_idx,
+        basic_vars_init=[forma["var_names"][j] for j in basic_idx],
+        basic_costs_init=np.zeros(len(signos)),
+        artificial_indices=np.array([], dtype=int),
+        artificial_count=0,
+        total_vars=n_total,
+        orientacion=orientacion,
+    )
+
+
+# -------------------------
+# Base reutilizable (arranque en caliente)
+# -------------------------
+def firma_restricciones(A):
+    """Huella de la matriz aumentada: la base solo es válida con las mismas restricciones."""
+    A = np.ascontiguousarray(A, dtype=float)
+    h = hashlib.sha256(repr(A.shape).encode())
+    h.update(A.tobytes())
+    return h.hexdigest()[:16]
+
+
+def codificar_base(basis, A):
+    """Identificador opaco de la base final (índices de columna + huella de A)."""
+    contenido = json.dumps({"v": 1, "b": [int(j) for j in basis], "f": firma_restricciones(A)},
+                           separators=(",", ":"))
+    return base64.urlsafe_b64encode(contenido.encode()).decode().rstrip("=")
+
+
+def decodificar_base(handle, A):
+    """
+    Retorna los índices de la base, o None si las restricciones cambiaron
+    desde que se generó. Lanza ValueError si el identificador no es válido.
+    """
+    try:
+        texto = base64.urlsafe_b64decode(handle + "=" * (-len(handle) % 4))
+        contenido = json.loads(texto)
+        basis = [int(j) for j in contenido["b"]]
+        firma = contenido["f"]
+    except (TypeError, ValueError, KeyError) as e:
+        raise ValueError("Identificador de base no válido") from e
+    if firma != firma_restricciones(A):
+        return None
+    return basis
@@ -1,166 +1,187 @@
-import numpy as np
+import logging
 import math
+from collections import deque
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _log_puntos(titulo, puntos, numerar=False):
+    # Lista de puntos al log solo si DEBUG está activo
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    lineas = [titulo]
+    for i, v in enumerate(puntos):
+        prefijo = f"{i+1}." if numerar else "•"
+        lineas.append(f"  {prefijo} ({v[0]:.2f}, {v[1]:.2f})")
+    logger.debug("\n".join(lineas))
 
 # -------------------------
 # Util: eliminar duplicados con tolerancia
 # -------------------------
 def unique_points(points, tol=1e-7):
+    """
+    Puntos sin repetir en orden de aparición: (x, y) se descarta si
+    |x - ux| <= tol y |y - uy| <= tol para algún punto ya aceptado.
+    Los aceptados se guardan en una grilla de celdas de lado 2*tol, así cada
+    punto se compara solo con los de las 3x3 celdas vecinas (O(n) esperado
+    en lugar de O(n^2)). Los puntos sin celda finita (inf, nan o coordenadas
+    enormes frente a tol) se comparan entre sí uno a uno.
+    """
+    lado = 2 * tol if tol > 0 else 1.0
+    celdas = {}
     uniques = []
     for x, y in points:
-        found = False
-        for ux, uy in uniques:
-            if abs(x - ux) <= tol and abs(y - uy) <= tol:
-                found = True
-                break
+        qx, qy = x / lado, y / lado
+        if math.isfinite(qx) and math.isfinite(qy):
+            cx, cy = math.floor(qx), math.floor(qy)
+            vecinos = [(cx + dx, cy + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+        else:
+            cx = cy = None
+            vecinos = [(None, None)]
+        found = any(
+            abs(x - ux) <= tol and abs(y - uy) <= tol
+            for celda in vecinos for ux, uy in celdas.get(celda, ())
+        )
         if not found:
+            celdas.setdefault((cx, cy), []).append((x, y))
             uniques.append((x, y))
     return uniques
 
 # ============================
-#   FUNCIONES BASE
+#   VÉRTICES POR LOTES (NumPy)
 # ============================
-def intersecciones(restricciones):
-    puntos = []
-    print(f"🔍 Buscando intersecciones entre {len(restricciones)} restricciones")
-    
-    for i, (a1, b1, c1) in enumerate(restricciones):
-        for j, (a2, b2, c2) in enumerate(restricciones):
-            if i >= j:
-                continue
-                
-            A = np.array([[a1, b1], [a2, b2]], dtype=float)
-            B = np.array([c1, c2], dtype=float)
+# Factibilidad por bloques: candidatos x restricciones evaluados a la vez
+_BLOQUE_CANDIDATOS = 1 << 16
+_BLOQUE_RESTRICCIONES = 64
 
-            if abs(np.linalg.det(A)) < 1e-12:
-                continue
 
-            try:
-                p = np.linalg.solve(A, B)
-                if all(np.isfinite(p)) and p[0] >= -1e-9 and p[1] >= -1e-9:
-                    punto = (float(p[0]), float(p[1]))
-                    puntos.append(punto)
-                    print(f"  ✅ Intersección R{i+1} & R{j+1}: ({punto[0]:.2f}, {punto[1]:.2f})")
-            except:
-                continue
-                
-    return puntos
+def _como_matriz(restricciones):
+    return np.asarray(restricciones, dtype=float).reshape(-1, 3)
 
-def cortes_con_ejes(restricciones):
+
+def _intersecciones_pares(R, tol_det=1e-12):
     """
-    Calcula los cortes (interceptos) de cada restricción con los ejes.
+    Intersección de cada par de rectas i < j (en el orden del doble for)
+    por la regla de Cramer sobre arreglos: retorna (puntos (k, 2), i, j)
+    solo para los pares no paralelos.
     """
-    puntos = []
-    print("🔍 Buscando cortes con ejes:")
-    
-    for i, (a, b, c) in enumerate(restricciones):
-        # corte x si a != 0  -> (c/a, 0)
-        if abs(a) > 1e-12:
-            x = c / a
-            if x >= -1e-9:
-                punto = (float(x), 0.0)
-                puntos.append(punto)
-                print(f"  ✅ R{i+1} con eje X: ({punto[0]:.2f}, 0.00)")
-        
-        # corte y si b != 0  -> (0, c/b)
-        if abs(b) > 1e-12:
-            y = c / b
-            if y >= -1e-9:
-                punto = (0.0, float(y))
-                puntos.append(punto)
-                print(f"  ✅ R{i+1} con eje Y: (0.00, {punto[1]:.2f})")
-    return puntos
+    i, j = np.triu_indices(R.shape[0], 1)
+    a1, b1, c1 = R[i].T
+    a2, b2, c2 = R[j].T
+    det = a1 * b2 - a2 * b1
+    ok = np.abs(det) > tol_det
+    det = det[ok]
+    x = (c1[ok] * b2[ok] - c2[ok] * b1[ok]) / det
+    y = (a1[ok] * c2[ok] - a2[ok] * c1[ok]) / det
+    return np.column_stack([x, y]), i[ok], j[ok]
 
-def filtrar_factibles(puntos, restricciones):
-    factibles = []
-    print(f"🔍 Filtrando {len(puntos)} puntos por factibilidad")
-    
-    for x, y in puntos:
-        if x < -1e-9 or y < -1e-9:
-            continue
-            
-        ok = True
-        for i, (a, b, c) in enumerate(restricciones):
-            valor = a * x + b * y
-            if valor > c + 1e-9:
-                ok = False
+
+def _cortes_ejes(R, tol=1e-12):
+    """Cortes (c/a, 0) y (0, c/b) de cada recta, intercalados como en el for."""
+    a, b, c = R.T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cortes = np.stack([
+            np.column_stack([c / a, np.zeros_like(a)]),
+            np.column_stack([np.zeros_like(b), c / b])
+        ], axis=1)
+    validos = np.column_stack([np.abs(a) > tol, np.abs(b) > tol])
+    return cortes[validos]
+
+
+def _factibles(P, R, tol=1e-9):
+    """
+    Máscara de los puntos con x, y >= 0 que cumplen todas las restricciones
+    (A p <= c): un producto matricial por bloque de restricciones, y cada
+    bloque solo evalúa los candidatos que siguen siendo factibles.
+    """
+    ok = (P >= -tol).all(axis=1)
+    idx = np.flatnonzero(ok)
+    for k in range(0, idx.size, _BLOQUE_CANDIDATOS):
+        vivos = idx[k:k + _BLOQUE_CANDIDATOS]
+        ok[vivos] = False
+        for r in range(0, R.shape[0], _BLOQUE_RESTRICCIONES):
+            bloque = R[r:r + _BLOQUE_RESTRICCIONES]
+            vivos = vivos[(P[vivos] @ bloque[:, :2].T <= bloque[:, 2] + tol).all(axis=1)]
+            if not vivos.size:
                 break
-                
-        if ok:
-            factibles.append((round(float(x), 6), round(float(y), 6)))
-            print(f"  ✅ Punto factible: ({x:.2f}, {y:.2f})")
-        else:
-            print(f"  ❌ Punto NO factible: ({x:.2f}, {y:.2f})")
-            
-    return factibles
+        ok[vivos] = True
+    return ok
+
 
 # ============================
-#   ORDENAR VÉRTICES PARA POLÍGONO
+#   FUNCIONES BASE
 # ============================
-def ordenar_vertices_poligono(puntos):
+def intersecciones(restricciones):
+    R = _como_matriz(restricciones)
+    logger.debug("🔍 Buscando intersecciones entre %d restricciones", len(R))
+    P, _, _ = _intersecciones_pares(R)
+    P = P[np.isfinite(P).all(axis=1) & (P >= -1e-9).all(axis=1)]
+    _log_puntos("  ✅ Intersecciones:", P)
+    return [(float(x), float(y)) for x, y in P]
+
+def cortes_con_ejes(restricciones):
     """
-    Ordena los puntos en sentido horario para formar un polígono convexo
-    MEJORADO: Maneja mejor los puntos en los ejes para maximización
+    Calcula los cortes (interceptos) de cada restricción con los ejes.
     """
-    if len(puntos) <= 3:
-        return puntos
-    
-    # Para maximización, asegurarnos de incluir el origen y puntos en ejes
-    tiene_origen = any(abs(p[0]) < 1e-9 and abs(p[1]) < 1e-9 for p in puntos)
-    puntos_en_eje_x = [p for p in puntos if abs(p[1]) < 1e-9 and abs(p[0]) > 1e-9]
-    puntos_en_eje_y = [p for p in puntos if abs(p[0]) < 1e-9 and abs(p[1]) > 1e-9]
-    
-    # Si tenemos puntos en los ejes, usar un método más simple
-    if tiene_origen or puntos_en_eje_x or puntos_en_eje_y:
-        print("  🔄 Usando ordenamiento especial para puntos en ejes")
-        return ordenar_vertices_simple(puntos)
-    
-    # Método original para otros casos
-    punto_inicio = min(puntos, key=lambda p: (p[1], p[0]))
-    
-    def angulo(p):
-        if p == punto_inicio:
-            return -float('inf')
-        dx = p[0] - punto_inicio[0]
-        dy = p[1] - punto_inicio[1]
-        return np.arctan2(dy, dx)
-    
-    puntos_ordenados = sorted(puntos, key=angulo)
-    
-    hull = []
-    for p in puntos_ordenados:
-        while len(hull) >= 2:
-            a = hull[-2]
-            b = hull[-1]
-            c = p
-            cross = (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
-            if cross > 0:
-                break
-            hull.pop()
-        hull.append(p)
-    
-    return hull
+    P = _cortes_ejes(_como_matriz(restricciones))
+    P = P[(P >= -1e-9).all(axis=1)]
+    _log_puntos("🔍 Cortes con ejes:", P)
+    return [(float(x), float(y)) for x, y in P]
 
-def ordenar_vertices_simple(puntos):
+def filtrar_factibles(puntos, restricciones):
+    P = np.asarray(puntos, dtype=float).reshape(-1, 2)
+    logger.debug("🔍 Filtrando %d puntos por factibilidad", len(P))
+    P = np.round(P[_factibles(P, _como_matriz(restricciones))], 6)
+    _log_puntos("  ✅ Puntos factibles:", P)
+    return [(float(x), float(y)) for x, y in P]
+
+# ============================
+#   ORDENAR VÉRTICES PARA POLÍGONO (envolvente convexa)
+# ============================
+def ordenar_vertices_poligono(puntos, tol=1e-9):
     """
-    Ordenamiento simple pero efectivo para regiones con puntos en ejes
+    Envolvente convexa por cadena monótona (Andrew): vértices del polígono en
+    sentido antihorario desde el de menor (x, y), sin repetidos ni puntos
+    colineales (un punto en medio de un lado, p.ej. sobre un eje, no es
+    vértice). Con todos los puntos alineados retorna los extremos del segmento.
+
+    O(n log n): un np.lexsort y una pasada por cada cadena. Antes, con
+    productos cruz vectorizados, se descartan de una vez los puntos
+    estrictamente dentro del cuadrilátero de los puntos extremos.
     """
-    centro_x = sum(p[0] for p in puntos) / len(puntos)
-    centro_y = sum(p[1] for p in puntos) / len(puntos)
-    
-    def angulo_respecto_centro(p):
-        dx = p[0] - centro_x
-        dy = p[1] - centro_y
-        return np.arctan2(dy, dx)
-    
-    puntos_ordenados = sorted(puntos, key=angulo_respecto_centro)
-    
-    inicio = min(puntos_ordenados, key=lambda p: (p[0], p[1]))
-    
-    if inicio in puntos_ordenados:
-        idx = puntos_ordenados.index(inicio)
-        puntos_ordenados = puntos_ordenados[idx:] + puntos_ordenados[:idx]
-    
-    return puntos_ordenados
+    P = np.asarray(puntos, dtype=float).reshape(-1, 2)
+    if len(P) == 0:
+        return []
+    escala = max(1.0, float(np.abs(P).max()))
+    eps = tol * escala * escala  # producto cruz: escala de área
+
+    # Cuadrilátero de extremos (antihorario): min x+y, max x-y, max x+y, min x-y
+    suma, resta = P.sum(axis=1), P[:, 0] - P[:, 1]
+    Q = P[[np.argmin(suma), np.argmax(resta), np.argmax(suma), np.argmin(resta)]]
+    lados = np.roll(Q, -1, axis=0) - Q
+    cruz = lados[:, None, 0] * (P[None, :, 1] - Q[:, None, 1]) - lados[:, None, 1] * (P[None, :, 0] - Q[:, None, 0])
+    P = P[~(cruz > eps).all(axis=0)]
+
+    P = P[np.lexsort((P[:, 1], P[:, 0]))]
+    P = P[np.concatenate([[True], (np.diff(P, axis=0) != 0).any(axis=1)])]
+    lista = [(float(x) + 0.0, float(y) + 0.0) for x, y in P]
+    if len(lista) <= 2:
+        return lista
+
+    def cadena(pts):
+        c = []
+        for p in pts:
+            while len(c) >= 2 and ((c[-1][0] - c[-2][0]) * (p[1] - c[-2][1])
+                                   - (c[-1][1] - c[-2][1]) * (p[0] - c[-2][0])) <= eps:
+                c.pop()
+            c.append(p)
+        return c
+
+    inferior = cadena(lista)
+    superior = cadena(reversed(lista))
+    return inferior[:-1] + superior[:-1]
 
 # ============================
 #   FUNCIÓN OBJETIVO
@@ -182,7 +203,7 @@ def mejor_punto_objetivo(puntos, p, q, tipo="max"):
                 mejor_val = z
                 mejor = (x, y)
                 
-    print(f"🎯 Punto óptimo: {mejor} con Z = {mejor_val:.2f} ({tipo})")
+    logger.debug("🎯 Punto óptimo: %s con Z = %.2f (%s)", mejor, mejor_val, tipo)
     return mejor, mejor_val
 
 # ============================
@@ -221,28 +242,28 @@ def calcular_rangos_inteligentes(vertices, restricciones, es_minimizacion):
     x_max = max(xs) if xs else 10
     y_max = max(ys) if ys else 10
     
-    print(f"🔍 Valores máximos encontrados: x={x_max}, y={y_max}")
+    logger.debug("🔍 Valores máximos encontrados: x=%s, y=%s", x_max, y_max)
     
     if x_max <= 20 and y_max <= 20:
         margen_x = max(x_max * 0.4, 3)
         margen_y = max(y_max * 0.4, 3)
         x_range = (0.0, float(x_max + margen_x))
         y_range = (0.0, float(y_max + margen_y))
-        print("📏 Usando escala PEQUEÑA")
+        logger.debug("📏 Usando escala PEQUEÑA")
         
     elif x_max <= 100 and y_max <= 100:
         margen_x = max(x_max * 0.2, 10)
         margen_y = max(y_max * 0.2, 10)
         x_range = (0.0, float(x_max + margen_x))
         y_range = (0.0, float(y_max + margen_y))
-        print("📏 Usando escala MEDIANA")
+        logger.debug("📏 Usando escala MEDIANA")
         
     else:
         margen_x = max(x_max * 0.15, 50)
         margen_y = max(y_max * 0.15, 50)
         x_range = (0.0, float(x_max + margen_x))
         y_range = (0.0, float(y_max + margen_y))
-        print("📏 Usando escala GRANDE")
+        logger.debug("📏 Usando escala GRANDE")
     
     def redondear_bonito(valor):
         if valor <= 20:
@@ -255,73 +276,132 @@ def calcular_rangos_inteligentes(vertices, restricciones, es_minimizacion):
     x_range = (0.0, float(redondear_bonito(x_range[1])))
     y_range = (0.0, float(redondear_bonito(y_range[1])))
     
-    print(f"📐 Rangos finales: X{x_range}, Y{y_range}")
+    logger.debug("📐 Rangos finales: X%s, Y%s", x_range, y_range)
     return x_range, y_range
 
+# ============================
+#   INTERSECCIÓN DE SEMIPLANOS (O(n log n))
+# ============================
+def interseccion_semiplanos(restricciones, es_minimizacion=False, tol=1e-9):
+    """
+    Vértices de la región {a*x + b*y <= c, x >= 0, y >= 0} ya ordenados en
+    sentido antihorario desde el de menor (x, y): los semiplanos se ordenan
+    por ángulo y se recorren una vez con una deque, O(n log n) en total.
+
+    La región se cierra con una caja grande (x, y <= M) y después se
+    descartan los vértices sobre la caja, así en una región no acotada
+    quedan solo los vértices reales. Igual que encontrar_vertices_completos,
+    en minimización el origen no cuenta salvo que una restricción pase por él.
+
+    Retorna None si la región es vacía o degenerada (un punto o un
+    segmento); en ese caso se usa la enumeración por pares.
+    """
+    R = np.asarray(restricciones, dtype=float).reshape(-1, 3)
+    norma = np.hypot(R[:, 0], R[:, 1])
+    nulas = norma <= 1e-12
+    if (R[nulas, 2] < -tol).any():
+        return None  # 0*x + 0*y <= c con c < 0
+    originales = R[~nulas]
+    R = originales / norma[~nulas, None]
+    escala = max(1.0, float(np.abs(R[:, 2]).max(initial=0.0)))
+    eps = tol * escala
+    caja = 1e9 * escala
+
+    # Rectas normalizadas (|(a, b)| = 1): reales, ejes x >= 0 e y >= 0, y la caja
+    n_reales = R.shape[0]
+    a = np.concatenate([R[:, 0], [-1.0, 0.0, 1.0, 0.0]]) + 0.0
+    b = np.concatenate([R[:, 1], [0.0, -1.0, 0.0, 1.0]]) + 0.0
+    c = np.concatenate([R[:, 2], [0.0, 0.0, caja, caja]])
+    es_caja = np.arange(a.size) >= n_reales + 2
+
+    # Dirección de cada recta con su semiplano a la izquierda: d = (-b, a).
+    # Entre paralelas con el mismo sentido queda la más restrictiva (menor c)
+    angulo = np.arctan2(a, -b)
+    orden = np.lexsort((c, angulo))
+    orden = orden[np.concatenate([[True], np.diff(angulo[orden]) > 1e-12])].tolist()
+
+    def corte(i, j):
+        det = a[i] * b[j] - a[j] * b[i]
+        return ((c[i] * b[j] - c[j] * b[i]) / det, (a[i] * c[j] - a[j] * c[i]) / det)
+
+    def fuera(k, p):
+        return a[k] * p[0] + b[k] * p[1] > c[k] + eps
+
+    dq = deque()
+    for k in orden:
+        while len(dq) >= 2 and fuera(k, corte(dq[-1], dq[-2])):
+            dq.pop()
+        while len(dq) >= 2 and fuera(k, corte(dq[0], dq[1])):
+            dq.popleft()
+        if dq and abs(a[k] * b[dq[-1]] - a[dq[-1]] * b[k]) < 1e-12:
+            if a[k] * a[dq[-1]] + b[k] * b[dq[-1]] < 0:
+                return None  # paralelas opuestas: región vacía o de ancho 0
+            if not fuera(k, (a[dq[-1]] * c[dq[-1]], b[dq[-1]] * c[dq[-1]])):
+                continue
+            dq.pop()
+        dq.append(k)
+    while len(dq) >= 3 and fuera(dq[0], corte(dq[-1], dq[-2])):
+        dq.pop()
+    while len(dq) >= 3 and fuera(dq[-1], corte(dq[0], dq[1])):
+        dq.popleft()
+    if len(dq) < 3:
+        return None
+
+    lineas = list(dq)
+    pares = np.array([sorted(par) for par in zip(lineas, lineas[1:] + lineas[:1])])
+
+    # Vértices con los coeficientes originales (un solo solve por lotes)
+    A0 = np.vstack([originales, [[-1.0, 0.0, 0.0], [0.0, -1.0, 0.0], [1.0, 0.0, caja], [0.0, 1.0, caja]]])
+    puntos = np.linalg.solve(A0[pares][:, :, :2], A0[pares][:, :, 2:])[:, :, 0]
+    # Cortes con los ejes exactos (c / b o c / a), como en la enumeración
+    eje_x = (pares[:, 1] == n_reales) & (pares[:, 0] < n_reales)
+    eje_y = (pares[:, 1] == n_reales + 1) & (pares[:, 0] < n_reales)
+    puntos[eje_x] = np.column_stack([np.zeros(eje_x.sum()), A0[pares[eje_x, 0], 2] / A0[pares[eje_x, 0], 1]])
+    puntos[eje_y] = np.column_stack([A0[pares[eje_y, 0], 2] / A0[pares[eje_y, 0], 0], np.zeros(eje_y.sum())])
+
+    # Polígono de área ~0 (punto o segmento): lo resuelve la enumeración
+    x, y = puntos[:, 0], puntos[:, 1]
+    area = 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    if area <= eps * max(1.0, np.ptp(x) + np.ptp(y)):
+        return None
+
+    # Vértices reales: ninguna de sus dos rectas es de la caja y sin repetidos consecutivos
+    reales = ~es_caja[pares].any(axis=1)
+    if es_minimizacion and not (np.abs(c[:n_reales]) <= eps).any():
+        reales &= ~((np.abs(x) <= eps) & (np.abs(y) <= eps))
+    puntos = puntos[reales]
+    if len(puntos) > 1:
+        distintos = np.abs(puntos - np.roll(puntos, 1, axis=0)).max(axis=1) > 1e-7
+        puntos = puntos[distintos] if distintos.any() else puntos[:1]
+
+    if len(puntos):
+        inicio = int(np.lexsort((puntos[:, 1], puntos[:, 0]))[0])
+        puntos = np.roll(puntos, -inicio, axis=0)
+    return [(float(px) + 0.0, float(py) + 0.0) for px, py in puntos]
+
 # ============================
 #   ENCONTRAR TODOS LOS VÉRTICES
 # ============================
 def encontrar_vertices_completos(restricciones, es_minimizacion=False):
-    print(f"\n🔍 INICIANDO BÚSQUEDA DE VÉRTICES (Minimización: {es_minimizacion})")
-    print(f"Restricciones: {restricciones}")
-    
-    vertices = []
-    
+    logger.debug("🔍 INICIANDO BÚSQUEDA DE VÉRTICES (Minimización: %s)", es_minimizacion)
+    logger.debug("Restricciones: %s", restricciones)
+    R = _como_matriz(restricciones)
+
     # 1) Intersecciones entre todas las combinaciones de restricciones
-    for i in range(len(restricciones)):
-        for j in range(i + 1, len(restricciones)):
-            a1, b1, c1 = restricciones[i]
-            a2, b2, c2 = restricciones[j]
-            
-            A = np.array([[a1, b1], [a2, b2]], dtype=float)
-            B = np.array([c1, c2], dtype=float)
-            
-            if abs(np.linalg.det(A)) > 1e-12:
-                try:
-                    p = np.linalg.solve(A, B)
-                    if p[0] >= -1e-9 and p[1] >= -1e-9:
-                        punto = (float(p[0]), float(p[1]))
-                        factible = True
-                        for a, b, c in restricciones:
-                            if a * p[0] + b * p[1] > c + 1e-9:
-                                factible = False
-                                break
-                        if factible:
-                            vertices.append(punto)
-                            print(f"  ✅ Intersección R{i+1} & R{j+1}: ({punto[0]:.2f}, {punto[1]:.2f})")
-                except:
-                    continue
-    
     # 2) Cortes con ejes
-    for i, (a, b, c) in enumerate(restricciones):
-        if abs(a) > 1e-12:
-            x = c / a
-            if x >= -1e-9:
-                punto = (float(x), 0.0)
-                if all(a * punto[0] + b * punto[1] <= c + 1e-9 for a, b, c in restricciones):
-                    vertices.append(punto)
-                    print(f"  ✅ R{i+1} con eje X: ({punto[0]:.2f}, 0.00)")
-        
-        if abs(b) > 1e-12:
-            y = c / b
-            if y >= -1e-9:
-                punto = (0.0, float(y))
-                if all(a * punto[0] + b * punto[1] <= c + 1e-9 for a, b, c in restricciones):
-                    vertices.append(punto)
-                    print(f"  ✅ R{i+1} con eje Y: (0.00, {punto[1]:.2f})")
-    
     # 3) Origen SOLO para maximización
+    candidatos = [_intersecciones_pares(R)[0], _cortes_ejes(R)]
     if not es_minimizacion:
-        if all(a * 0.0 + b * 0.0 <= c + 1e-9 for a, b, c in restricciones):
-            vertices.append((0.0, 0.0))
-            print("  ✅ Origen (0,0) agregado (maximización)")
-    
+        candidatos.append(np.zeros((1, 2)))
+    P = np.concatenate(candidatos)
+
+    # Factibilidad de todos los candidatos en un producto matricial por bloque
+    P = P[_factibles(P, R)]
+
     # 4) Eliminar duplicados
-    vertices = unique_points(vertices, tol=1e-7)
+    vertices = unique_points([(float(x) + 0.0, float(y) + 0.0) for x, y in P], tol=1e-7)
     
-    print(f"📊 Total de vértices encontrados: {len(vertices)}")
-    for v in vertices:
-        print(f"  • ({v[0]:.2f}, {v[1]:.2f})")
+    _log_puntos(f"📊 Total de vértices encontrados: {len(vertices)}", vertices)
     
     return vertices
 
@@ -336,20 +416,20 @@ def calcular_region_factible(restricciones, funcion_objetivo):
     p, q, tipo = funcion_objetivo
     es_minimizacion = (tipo == "min")
     
-    print(f"\n" + "="*50)
-    print(f"🚀 INICIANDO CÁLCULO - {tipo.upper()} Z = {p}x + {q}y")
-    print(f"Restricciones: {restricciones}")
-    print("="*50)
+    logger.debug("🚀 INICIANDO CÁLCULO - %s Z = %sx + %sy", tipo.upper(), p, q)
+    logger.debug("Restricciones: %s", restricciones)
 
-    # 1) Encontrar todos los vértices
-    vertices = encontrar_vertices_completos(restricciones, es_minimizacion)
+    # 1) Vértices ya ordenados por intersección de semiplanos; si la región
+    #    es vacía o degenerada, enumeración por pares
+    vertices = interseccion_semiplanos(restricciones, es_minimizacion)
+    ordenados = vertices is not None
+    if not ordenados:
+        vertices = encontrar_vertices_completos(restricciones, es_minimizacion)
     
-    print("\n🔍 VÉRTICES FINALES ANTES DE ORDENAR:")
-    for i, v in enumerate(vertices):
-        print(f"  {i+1}. ({v[0]:.2f}, {v[1]:.2f})")
+    _log_puntos("🔍 VÉRTICES FINALES ANTES DE ORDENAR:", vertices, numerar=True)
     
     if not vertices:
-        print("❌ REGIÓN VACÍA - No se encontraron vértices factibles")
+        logger.debug("❌ REGIÓN VACÍA - No se encontraron vértices factibles")
         return {
             "vertices_factibles": [],
             "punto_optimo": None,
@@ -358,15 +438,14 @@ def calcular_region_factible(restricciones, funcion_objetivo):
             "rango_y": (0.0, 10.0),
             "funcion_objetivo": {"p": p, "q": q, "tipo": tipo},
             "restricciones": restricciones,
-            "problema": "region vacia"
+            "problema": "region vacia",
+            "vertices_ordenados": True
         }
 
     # 4) Ordenar vértices para el polígono
-    vertices_ordenados = ordenar_vertices_poligono(vertices)
+    vertices_ordenados = vertices if ordenados else ordenar_vertices_poligono(vertices)
     
-    print(f"\n📋 VÉRTICES ORDENADOS PARA POLÍGONO:")
-    for i, v in enumerate(vertices_ordenados):
-        print(f"  {i+1}. ({v[0]:.2f}, {v[1]:.2f})")
+    _log_puntos("📋 VÉRTICES ORDENADOS PARA POLÍGONO:", vertices_ordenados, numerar=True)
 
     # 5) Encontrar punto óptimo
     punto_opt, valor_opt = mejor_punto_objetivo(vertices, p, q, tipo)
@@ -377,9 +456,9 @@ def calcular_region_factible(restricciones, funcion_objetivo):
     # 7) Información adicional para el frontend
     region_no_acotada = es_region_no_acotada(vertices, restricciones, es_minimizacion)
     
-    print(f"📐 RANGOS FINALES: X{rx}, Y{ry}")
-    print(f"🔍 Región no acotada: {region_no_acotada}")
-    print("✅ CÁLCULO COMPLETADO\n")
+    logger.debug("📐 RANGOS FINALES: X%s, Y%s", rx, ry)
+    logger.debug("🔍 Región no acotada: %s", region_no_acotada)
+    logger.debug("✅ CÁLCULO COMPLETADO")
 
     return {
         "vertices_factibles": vertices_ordenados,
@@ -389,5 +468,7 @@ def calcular_region_factible(restricciones, funcion_objetivo):
         "rango_y": ry,
         "funcion_objetivo": {"p": p, "q": q, "tipo": tipo},
         "restricciones": restricciones,
-        "region_no_acotada": region_no_acotada
+        "region_no_acotada": region_no_acotada,
+        # Polígono ya en orden antihorario: el frontend no necesita reordenar
+        "vertices_ordenados": True
     }
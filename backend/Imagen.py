@@ -0,0 +1,137 @@
+import colorsys
+import io
+import logging
+import threading
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
+
+logger = logging.getLogger(__name__)
+
+# Formatos de /resolver/plot y su tipo MIME
+FORMATOS_IMAGEN = {"png": "image/png", "svg": "image/svg+xml"}
+
+# Mismos colores que el gráfico del frontend (app.js)
+COLORES = {
+    "region": (0.5, 0.5, 0.5, 0.3),
+    "borde": (0.0, 100 / 255, 1.0, 0.8),
+    "puntos": (0.0, 100 / 255, 1.0, 0.8),
+    "optimo": (1.0, 0.0, 0.0, 1.0),
+    "ejes": (0.0, 0.0, 0.0, 0.3)
+}
+
+_plantillas = threading.local()
+
+
+# -------------------------
+# Plantilla de la figura
+# -------------------------
+def _plantilla():
+    """
+    Figura con los ejes ya configurados (tamaño, etiquetas, grilla, ejes x=0
+    e y=0), creada una sola vez por hilo: cada render solo agrega y después
+    quita sus propios elementos. Se usa el canvas Agg directamente (sin
+    pyplot), así no hay estado global ni backend interactivo.
+    """
+    figura = getattr(_plantillas, "figura", None)
+    if figura is None:
+        figura = Figure(figsize=(8, 6), dpi=100)
+        FigureCanvasAgg(figura)
+        ejes = figura.add_subplot()
+        ejes.set_xlabel("x₁")
+        ejes.set_ylabel("x₂")
+        ejes.grid(True, color=(0.0, 0.0, 0.0, 0.1))
+        ejes.axhline(0.0, color=COLORES["ejes"], linewidth=1)
+        ejes.axvline(0.0, color=COLORES["ejes"], linewidth=1)
+        figura.subplots_adjust(left=0.09, right=0.97, bottom=0.09, top=0.93)
+        _plantillas.figura = figura
+    return figura
+
+
+def _segmento_restriccion(a, b, c, rango_x, rango_y, tol=1e-12):
+    """Extremos de la recta a*x + b*y = c dentro del rectángulo de los rangos (o None)."""
+    (x0, x1), (y0, y1) = rango_x, rango_y
+    puntos = []
+    if abs(b) > tol:
+        puntos += [(x, (c - a * x) / b) for x in (x0, x1)]
+    if abs(a) > tol:
+        puntos += [((c - b * y) / a, y) for y in (y0, y1)]
+    dentro = sorted({
+        (x, y) for x, y in puntos
+        if x0 - 1e-9 <= x <= x1 + 1e-9 and y0 - 1e-9 <= y <= y1 + 1e-9
+    })
+    if len(dentro) < 2:
+        return None
+    return dentro[0], dentro[-1]
+
+
+def _etiqueta_restriccion(a, b, c):
+    # Las >= llegan multiplicadas por -1 (ver /resolver): se muestran como el frontend
+    if a < 0 or b < 0 or c < 0:
+        return f"{-a:g}x + {-b:g}y ≥ {-c:g}"
+    return f"{a:g}x + {b:g}y ≤ {c:g}"
+
+
+# -------------------------
+# Render
+# -------------------------
+def renderizar_region(resultado, formato="png"):
+    """
+    Imagen (bytes) del resultado de calcular_region_factible: rectas de las
+    restricciones, región factible, vértices y punto óptimo, con los mismos
+    colores y rangos que el gráfico del frontend. formato: "png" o "svg".
+    """
+    if formato not in FORMATOS_IMAGEN:
+        raise ValueError(f"Formato no soportado: {formato}")
+    figura = _plantilla()
+    ejes = figura.axes[0]
+    rango_x = tuple(resultado.get("rango_x") or (0.0, 10.0))
+    rango_y = tuple(resultado.get("rango_y") or (0.0, 10.0))
+    vertices = [tuple(v) for v in resultado.get("vertices_factibles") or []]
+    artistas = []
+    try:
+        ejes.set_xlim(rango_x)
+        ejes.set_ylim(rango_y)
+
+        for k, (a, b, c) in enumerate(resultado.get("restricciones") or []):
+            segmento = _segmento_restriccion(a, b, c, rango_x, rango_y)
+            if segmento is None:
+                continue
+            (xa, ya), (xb, yb) = segmento
+            color = colorsys.hls_to_rgb((k * 60 % 360) / 360, 0.5, 0.7)
+            artistas += ejes.plot([xa, xb], [ya, yb], color=color, linewidth=2,
+                                  label=_etiqueta_restriccion(a, b, c))
+
+        if len(vertices) >= 3:
+            artistas.append(ejes.add_patch(Polygon(vertices, closed=True, facecolor=COLORES["region"],
+                                                   edgecolor=COLORES["borde"], linewidth=2.5)))
+        if vertices:
+            xs, ys = zip(*vertices)
+            artistas.append(ejes.scatter(xs, ys, s=36, color=COLORES["puntos"], edgecolors="white",
+                                         linewidths=1.5, zorder=3, label="Vértices"))
+        optimo = resultado.get("punto_optimo")
+        if optimo is not None:
+            artistas.append(ejes.scatter([optimo[0]], [optimo[1]], s=100, color=COLORES["optimo"],
+                                         edgecolors="white", linewidths=2, zorder=4, label="Óptimo"))
+
+        if resultado.get("valor_optimo") is not None:
+            titulo = f"{str(resultado.get('tipo', 'max')).upper()} Z = {resultado['valor_optimo']:.6g}"
+            if resultado.get("region_no_acotada"):
+                titulo += " (región no acotada)"
+        else:
+            titulo = "Región factible vacía"
+        artistas.append(ejes.set_title(titulo))
+        if ejes.get_legend_handles_labels()[0]:
+            artistas.append(ejes.legend(loc="upper right", fontsize=8))
+
+        buffer = io.BytesIO()
+        # Sin fecha en el SVG: la misma región da los mismos bytes
+        figura.savefig(buffer, format=formato, metadata={"Date": None} if formato == "svg" else None)
+        return buffer.getvalue()
+    finally:
+        for artista in artistas:
+            if artista is ejes.title:
+                artista.set_text("")
+            else:
+                artista.remove()
@@ -0,0 +1,279 @@
+import logging
+
+import numpy as np
+
+from backend.FormaEstandar import datos_originales, solucion_desde_x
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------
+# Presolve (antes de la forma estándar)
+# -------------------------
+def _tipo_fila(signo, a):
+    # Sentido de a x (signo) b al dividir por a: si a < 0 se invierte la desigualdad
+    if a > 0 or signo == 'eq':
+        return signo
+    return 'geq' if signo == 'leq' else 'leq'
+
+
+def presolve(A, b, signos, c, mode=0, tol=1e-9, max_pasadas=10, superiores=None):
+    """
+    Reduce el problema  opt c x  s.a.  A x (signos) b,  x >= 0  antes del
+    simplex. Reducciones (se repiten hasta que no hay cambios):
+      - filas vacías: se verifican y se eliminan
+      - filas singleton: eq fija la variable; una cota inferior x_j >= l se
+        elimina desplazando x_j = l + x_j'; una cota superior 0 fija x_j = 0
+      - filas duplicadas o paralelas: se combinan en una sola (o en un par
+        <= / >= si dan cotas distintas sobre la misma combinación)
+      - columnas vacías: x_j = 0 si su costo no mejora, si no el problema
+        no es acotado
+      - columnas dominadas: si aumentar x_j empeora el objetivo y solo
+        ajusta las restricciones, x_j = 0
+      - variables fijas: se sustituyen en el LD
+    Con superiores (cota superior de cada x, inf = sin cota, para el simplex
+    con variables acotadas) una fila singleton x_j <= u pasa a ser cota de
+    x_j y una columna vacía cuyo costo mejora se fija en su cota.
+
+    Retorna un diccionario con el problema reducido (A, b, signos, c), las
+    filas y columnas conservadas, el valor de cada variable eliminada o
+    desplazada ("valor": x = valor + x_reducido), "estado" (None,
+    "Infactible" o "No acotado"), las cotas superiores de las columnas
+    conservadas ("superiores", si se pasaron) y las estadísticas.
+    """
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    signos = np.array(signos, dtype=object)
+    c = np.array(c, dtype=float)
+    m, n = A.shape
+    signo_obj = 1.0 if mode == 0 else -1.0  # costo en sentido de minimización
+
+    filas = np.ones(m, dtype=bool)
+    columnas = np.ones(n, dtype=bool)
+    valor = np.zeros(n)
+    con_cotas = superiores is not None
+    superiores = np.array(superiores, dtype=float) if con_cotas else np.full(n, np.inf)
+    stats = {
+        "filas_vacias": 0,
+        "filas_singleton": 0,
+        "filas_duplicadas": 0,
+        "columnas_vacias": 0,
+        "columnas_dominadas": 0,
+        "variables_fijas": 0,
+        "variables_desplazadas": 0,
+        "cotas_superiores": 0,
+        "pasadas": 0
+    }
+    estado = None
+
+    def fijar(j, v, motivo):
+        b[:] -= A[:, j] * v
+        superiores[j] -= v
+        valor[j] += v
+        columnas[j] = False
+        stats[motivo] += 1
+
+    def nnz(i):
+        return np.flatnonzero(columnas & (np.abs(A[i]) > tol))
+
+    for pasada in range(max_pasadas):
+        stats["pasadas"] = pasada + 1
+        cambio = False
+
+        # Filas vacías y singleton
+        for i in np.flatnonzero(filas):
+            cols = nnz(i)
+            if cols.size == 0:
+                if (signos[i] == 'leq' and b[i] < -tol) or (signos[i] == 'geq' and b[i] > tol) \
+                        or (signos[i] == 'eq' and abs(b[i]) > tol):
+                    estado = "Infactible"
+                    break
+                filas[i] = False
+                stats["filas_vacias"] += 1
+                cambio = True
+            elif cols.size == 1:
+                j = cols[0]
+                v = b[i] / A[i, j]
+                tipo = _tipo_fila(signos[i], A[i, j])
+                if tipo == 'eq' or (tipo == 'leq' and abs(v) <= tol):
+                    if v < -tol or v > superiores[j] + tol:
+                        estado = "Infactible"
+                        break
+                    fijar(j, max(v, 0.0), "variables_fijas")
+                elif tipo == 'geq':
+                    if v > superiores[j] + tol:
+                        estado = "Infactible"
+                        break
+                    if v > tol:
+                        b[:] -= A[:, j] * v
+                        valor[j] += v
+                        superiores[j] -= v
+                        stats["variables_desplazadas"] += 1
+                elif v < -tol:
+                    estado = "Infactible"
+                    break
+                elif con_cotas:
+                    superiores[j] = min(superiores[j], v)
+                    stats["cotas_superiores"] += 1
+                else:
+                    continue  # cota superior sin simplex acotado: la fila se conserva
+                filas[i] = False
+                stats["filas_singleton"] += 1
+                cambio = True
+        if estado:
+            break
+
+        # Filas duplicadas o paralelas: misma combinación a x normalizada
+        grupos = {}
+        for i in np.flatnonzero(filas):
+            cols = nnz(i)
+            if cols.size < 2:
+                continue
+            fila = np.where(columnas, A[i], 0.0)
+            escala = fila[cols[0]]
+            clave = tuple(np.round(fila[cols] / escala, 9)) + tuple(cols)
+            grupos.setdefault(clave, []).append((i, escala))
+        for miembros in grupos.values():
+            if len(miembros) < 2:
+                continue
+            # Cotas sobre L = (a x) / escala del primer miembro de cada fila
+            inferior, superior = -np.inf, np.inf
+            igual = None
+            for i, escala in miembros:
+                v = b[i] / escala
+                tipo = _tipo_fila(signos[i], escala)
+                if tipo == 'eq':
+                    if igual is not None and abs(igual - v) > tol * max(1.0, abs(v)):
+                        estado = "Infactible"
+                    igual = v
+                elif tipo == 'leq':
+                    superior = min(superior, v)
+                else:
+                    inferior = max(inferior, v)
+            if igual is not None:
+                inferior, superior = max(inferior, igual), min(superior, igual)
+            if estado or inferior > superior + tol * max(1.0, abs(superior)):
+                estado = "Infactible"
+                break
+            # Se conservan a lo sumo dos filas del grupo (una por cota)
+            i0, e0 = miembros[0]
+            usadas = []
+            if igual is not None or inferior == superior:
+                A[i0] /= e0
+                signos[i0], b[i0] = 'eq', (igual if igual is not None else superior)
+                usadas = [i0]
+            else:
+                i1, e1 = miembros[1]
+                for (i, e), (cota, signo) in zip(((i0, e0), (i1, e1)), ((superior, 'leq'), (inferior, 'geq'))):
+                    if np.isfinite(cota):
+                        A[i] /= e
+                        signos[i], b[i] = signo, cota
+                        usadas.append(i)
+            for i, _ in miembros:
+                if i not in usadas:
+                    filas[i] = False
+                    stats["filas_duplicadas"] += 1
+                    cambio = True
+        if estado:
+            break
+
+        # Columnas vacías y dominadas (en sentido de minimización)
+        for j in np.flatnonzero(columnas):
+            col = A[filas, j]
+            costo = signo_obj * c[j]
+            activa = np.abs(col) > tol
+            if superiores[j] <= tol:
+                fijar(j, 0.0, "variables_fijas")
+                cambio = True
+                continue
+            if not activa.any():
+                if costo < -tol:
+                    if not np.isfinite(superiores[j]):
+                        estado = "No acotado"
+                        break
+                    fijar(j, superiores[j], "columnas_vacias")
+                else:
+                    fijar(j, 0.0, "columnas_vacias")
+                cambio = True
+                continue
+            sig = signos[filas]
+            empeora = np.where(sig == 'leq', col >= -tol, np.where(sig == 'geq', col <= tol, ~activa))
+            if costo >= 0 and empeora.all():
+                fijar(j, 0.0, "columnas_dominadas")
+                cambio = True
+        if estado or not cambio:
+            break
+
+    # Filas con LD negativo (p.ej. tras un desplazamiento): se multiplican por -1
+    negativas = filas & (b < 0)
+    A[negativas] *= -1.0
+    b[negativas] *= -1.0
+    signos[negativas] = [{'leq': 'geq', 'geq': 'leq'}.get(s, s) for s in signos[negativas]]
+
+    stats["filas_eliminadas"] = int(m - filas.sum())
+    stats["columnas_eliminadas"] = int(n - columnas.sum())
+    logger.debug("Presolve: %s", stats)
+    return {
+        "A": A[np.ix_(filas, columnas)],
+        "b": b[filas],
+        "signos": signos[filas].tolist(),
+        "c": c[columnas],
+        "filas": np.flatnonzero(filas),
+        "columnas": np.flatnonzero(columnas),
+        "valor": valor,
+        "superiores": superiores[columnas] if con_cotas else None,
+        "estado": estado,
+        "stats": stats
+    }
+
+
+def presolve_restricciones(restricciones_data, coeficientes, n, mode=0, tol=1e-9, superiores=None):
+    """
+    presolve sobre los datos de /resolver. Agrega al resultado las
+    "restricciones" y "coeficientes" reducidos (mismo formato, listos para
+    construir_forma_estandar), "original" (A, b, signos, c) para el postsolve
+    y "reducido" (False si no hubo ningún cambio). superiores: ver presolve.
+    """
+    A, b, signos, c = datos_originales(restricciones_data, coeficientes, n)
+    pre = presolve(A, b, signos, c, mode=mode, tol=tol, superiores=superiores)
+    pre["restricciones"] = [
+        {"coeficientes": fila.tolist(), "signo": signo, "c": float(ld)}
+        for fila, signo, ld in zip(pre["A"], pre["signos"], pre["b"])
+    ]
+    pre["coeficientes"] = pre["c"].tolist()
+    pre["original"] = (A, b, signos, c)
+    pre["reducido"] = (len(pre["filas"]) < A.shape[0] or len(pre["columnas"]) < n
+                       or bool(pre["valor"].any()) or pre["signos"] != signos
+                       or not np.array_equal(pre["A"], A) or not np.array_equal(pre["b"], b))
+    return pre
+
+
+# -------------------------
+# Postsolve
+# -------------------------
+def postsolve(pre, x_reducido):
+    """
+    Lleva la solución del problema reducido al original. Retorna (x, Z,
+    solution): valores de las variables originales, valor objetivo y
+    {nombre: valor} con x, holguras y excesos de todas las restricciones
+    originales (numerados como en la forma estándar completa).
+    """
+    A, b, signos, c = pre["original"]
+    x = pre["valor"].copy()
+    x[pre["columnas"]] += np.asarray(x_reducido, dtype=float)
+    Z, solution = solucion_desde_x(A, b, signos, c, x)
+    return x, Z, solution
+
+
+def conteo_forma(signos, n):
+    """Cantidad de holguras, excesos y artificiales de la forma estándar completa."""
+    signos = np.asarray(signos, dtype=object)
+    n_s = int((signos == 'leq').sum())
+    n_e = int((signos == 'geq').sum())
+    n_a = n_e + int((signos == 'eq').sum())
+    return {
+        "slack_count": n_s,
+        "excess_count": n_e,
+        "artificial_count": n_a,
+        "total_vars": n + n_s + n_e + n_a
+    }
@@ -0,0 +1,204 @@
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------
+# Test del cociente
+# -------------------------
+def ratio_test(col, rhs, tol=1e-12, harris=False, delta=1e-9, pivot_tol=1e-9):
+    """
+    Test del cociente mínimo vectorizado sobre la columna entrante.
+    Retorna (fila, theta), o (None, None) si ninguna entrada es > tol (no acotado).
+    En empates exactos elige la primera fila.
+
+    harris: test en dos pasadas. La primera calcula la cota
+    min((b_i + delta) / a_i) solo con pivotes a_i > pivot_tol; la segunda
+    elige, entre las filas con b_i / a_i <= cota, la de mayor a_i. Así se
+    evitan pivotes diminutos cuando varios cocientes casi empatan.
+    """
+    positivos = col > tol
+    if not positivos.any():
+        return None, None
+    if harris:
+        grandes = col > pivot_tol
+        if grandes.any():
+            cota = np.min((rhs[grandes] + delta) / col[grandes])
+            empates = grandes & (rhs <= cota * col)
+            r = int(np.argmax(np.where(empates, col, -np.inf)))
+            return r, rhs[r] / col[r]
+    ratios = np.where(positivos, rhs / np.where(positivos, col, 1.0), np.inf)
+    r = int(np.argmin(ratios))
+    return r, ratios[r]
+
+
+# -------------------------
+# Reglas de pricing para el simplex tabular
+# -------------------------
+PRICING_RULES = ("dantzig", "bland", "parcial", "devex", "steepest")
+
+
+class Pricer:
+    """
+    Elige columna y fila pivote sobre las filas B^-1 [A | b] del tableau.
+
+      dantzig  -> mayor |Zj-Cj| (misma regla que choose_pivot_custom)
+      bland    -> menor índice que mejora; en empates del cociente sale la
+                  básica de menor índice (no cicla)
+      parcial  -> Dantzig sobre bloques de columnas rotativos; solo revisa el
+                  bloque siguiente si el actual no tiene candidatas
+      devex    -> mayor (Zj-Cj)^2 / w_j con pesos de referencia aproximados
+      steepest -> mayor (Zj-Cj)^2 / gamma_j con gamma_j = 1 + ||B^-1 a_j||^2,
+                  actualizados en cada pivote (Goldfarb-Reid)
+
+    Anticiclado: tras `degenerate_limit` pivotes degenerados seguidos se pasa
+    a la regla de Bland hasta el siguiente pivote no degenerado.
+    Con cotas superiores (simplex con variables acotadas) el cociente
+    también considera que una básica llegue a su cota o que la entrante
+    llegue a la suya sin cambiar la base (ver choose_pivot).
+    harris: usa el test del cociente de Harris (ver ratio_test), salvo
+    mientras rige Bland, que necesita el cociente mínimo exacto.
+    """
+    def __init__(self, rule="dantzig", degenerate_limit=None, partial_size=None, harris=False):
+        if rule not in PRICING_RULES:
+            raise ValueError(f"Regla de pricing '{rule}' no reconocida (usar {', '.join(PRICING_RULES)}).")
+        self.rule = rule
+        self.degenerate_limit = degenerate_limit
+        self.partial_size = partial_size
+        self.harris = harris
+        self.iteraciones = 0
+        self.degenerados = 0
+        self.activaciones_bland = 0
+        self.saltos_cota = 0
+        self._seguidos = 0
+        self._bland = False
+        self._offset = 0
+        self._pesos = None
+
+    def info(self):
+        return {
+            "pricing": self.rule,
+            "harris": self.harris,
+            "pivotes_degenerados": self.degenerados,
+            "activaciones_bland": self.activaciones_bland,
+            "saltos_cota": self.saltos_cota
+        }
+
+    # -------------------------
+    # Selección de columna
+    # -------------------------
+    def _columna(self, rows, d, mejora):
+        rule = "bland" if self._bland else self.rule
+        if rule == "bland":
+            return int(np.argmax(mejora))
+        if rule == "parcial":
+            n = d.shape[0]
+            tam = self.partial_size or max(10, int(np.ceil(np.sqrt(n))))
+            for _ in range(0, n, tam):
+                inicio = self._offset
+                fin = min(inicio + tam, n)
+                self._offset = fin % n
+                if mejora[inicio:fin].any():
+                    return inicio + int(np.argmax(np.where(mejora[inicio:fin], d[inicio:fin], -np.inf)))
+            return int(np.argmax(np.where(mejora, d, -np.inf)))
+        if rule in ("devex", "steepest"):
+            pesos = self._pesos_actuales(rows)
+            return int(np.argmax(np.where(mejora, d * d / pesos, -np.inf)))
+        return int(np.argmax(np.where(mejora, d, -np.inf)))
+
+    def _pesos_actuales(self, rows):
+        n = rows.shape[1] - 1
+        if self._pesos is None or self._pesos.shape[0] != n:
+            if self.rule == "steepest":
+                self._pesos = 1.0 + np.einsum("ij,ij->j", rows[:, :-1], rows[:, :-1])
+            else:
+                self._pesos = np.ones(n)
+        return self._pesos
+
+    def _actualizar_pesos(self, rows, r, q, sale):
+        # Con las filas antes del pivote: alfa_r = fila pivote, alfa_q = columna entrante
+        if self.rule not in ("devex", "steepest"):
+            return
+        pesos = self._pesos_actuales(rows)
+        fila = rows[r, :-1]
+        a_rq = fila[q]
+        razon = fila / a_rq
+        w_q = pesos[q]
+        if self.rule == "devex":
+            np.maximum(pesos, razon * razon * w_q, out=pesos)
+        else:
+            cruzado = rows[:, :-1].T @ rows[:, q]
+            nuevos = pesos - 2.0 * razon * cruzado + razon * razon * w_q
+            np.maximum(nuevos, 1.0 + razon * razon, out=pesos)
+        pesos[sale] = max(w_q / (a_rq * a_rq), 1.0)
+        pesos[q] = 1.0
+
+    # -------------------------
+    # Pivote completo (columna + cociente)
+    # -------------------------
+    def choose_pivot(self, rows, zjc, basis, maximize=False, tol=1e-12, upper=None):
+        """
+        Igual que choose_pivot_custom: retorna (fila, columna, estado) con
+        estado 'ok' | 'optimal' | 'unbounded'. basis: índice de columna de la
+        básica de cada fila (para Bland y los pesos).
+
+        upper: cota superior de cada columna (inf = sin cota), con las no
+        básicas en 0. Agrega dos estados:
+          'cota'  -> la básica de la fila sale en su cota superior (pivotear
+                     y complementar la saliente)
+          'salto' -> la entrante llega a su cota antes que cualquier básica:
+                     no hay pivote, solo se complementa la columna (fila None)
+        """
+        d = -zjc[:-1] if maximize else zjc[:-1]
+        mejora = d > tol
+        if not mejora.any():
+            return None, None, 'optimal'
+        q = self._columna(rows, d, mejora)
+
+        col = rows[:, q]
+        bi = rows[:, -1]
+        bland = self._bland or self.rule == "bland"
+        r, theta = ratio_test(col, bi, tol, harris=self.harris and not bland)
+        if r is not None and bland:
+            positivos = col > tol
+            ratios = np.where(positivos, bi / np.where(positivos, col, 1.0), np.inf)
+            empates = np.flatnonzero(ratios <= theta)
+            r = int(empates[np.argmin(np.asarray(basis)[empates])])
+        estado = 'ok'
+        if upper is not None:
+            theta = np.inf if r is None else theta
+            # Básicas que crecen (a_iq < 0) hasta su cota superior
+            u_B = upper[basis]
+            negativos = (col < -tol) & np.isfinite(u_B)
+            if negativos.any():
+                ratios = np.where(negativos, (u_B - bi) / np.where(negativos, -col, 1.0), np.inf)
+                r2 = int(np.argmin(ratios))
+                if ratios[r2] < theta:
+                    r, theta, estado = r2, max(ratios[r2], 0.0), 'cota'
+            if np.isfinite(upper[q]) and upper[q] <= theta:
+                self.saltos_cota += 1
+                self._seguidos = 0
+                self._bland = False
+                self.iteraciones += 1
+                return None, q, 'salto'
+        if r is None:
+            return None, None, 'unbounded'
+
+        # Anticiclado por degeneración
+        if theta <= tol:
+            self.degenerados += 1
+            self._seguidos += 1
+            limite = self.degenerate_limit or max(10, rows.shape[0])
+            if not self._bland and self.rule != "bland" and self._seguidos >= limite:
+                logger.info("Pricing: %d pivotes degenerados seguidos, se aplica Bland.", self._seguidos)
+                self._bland = True
+                self.activaciones_bland += 1
+        else:
+            self._seguidos = 0
+            self._bland = False
+
+        self._actualizar_pesos(rows, r, q, basis[r])
+        self.iteraciones += 1
+        return r, q, estado
@@ -0,0 +1,256 @@
+import logging
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from backend.FormaEstandar import validar_signos
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------
+# Base factorizada (LU + actualizaciones en forma producto)
+# -------------------------
+class BasisFactor:
+    """
+    Mantiene B^-1 como LU(B0) seguido de una lista de matrices eta
+    (forma producto). Cada cambio de base agrega una eta; cada
+    `refactor_every` cambios se refactoriza la base desde cero.
+    """
+    def __init__(self, M, basis, refactor_every=50):
+        self.M = M
+        self.refactor_every = refactor_every
+        self.refactor(basis)
+
+    def refactor(self, basis):
+        B = self.M[:, basis].tocsc()
+        self.lu = splu(B)
+        self.etas = []
+
+    def ftran(self, v):
+        # x = B^-1 v
+        x = self.lu.solve(np.asarray(v, dtype=float))
+        for r, d in self.etas:
+            xr = x[r] / d[r]
+            x -= xr * d
+            x[r] = xr
+        return x
+
+    def btran(self, v):
+        # y^T = v^T B^-1
+        w = np.array(v, dtype=float)
+        for r, d in reversed(self.etas):
+            wr = w[r]
+            w[r] = (wr - (d @ w - d[r] * wr)) / d[r]
+        return self.lu.solve(w, trans='T')
+
+    def update(self, r, d, basis):
+        # d = B^-1 a_q (columna entrante ya transformada), r = fila que sale
+        self.etas.append((r, d.copy()))
+        if len(self.etas) >= self.refactor_every:
+            self.refactor(basis)
+            return True
+        return False
+
+
+# -------------------------
+# Forma estándar dispersa
+# -------------------------
+def build_sparse_standard_form(A, b, senses):
+    """
+    A: matriz (m x n) de coeficientes originales (densa o scipy.sparse)
+    senses: lista con 'leq' | 'geq' | 'eq' por fila
+
+    Retorna M = [A | S | E | I] en CSC con las filas orientadas para que
+    b >= 0, el vector b orientado, los nombres de variables (sin
+    artificiales), la base inicial y los índices de artificiales usadas.
+    La artificial de la fila i es siempre la columna n_total + i.
+    """
+    A = sp.csr_matrix(A, dtype=float)
+    b = np.asarray(b, dtype=float).copy()
+    m, n = A.shape
+    senses = list(senses)
+    validar_signos(senses)
+
+    leq_rows = [i for i, s in enumerate(senses) if s == 'leq']
+    geq_rows = [i for i, s in enumerate(senses) if s == 'geq']
+    n_s, n_e = len(leq_rows), len(geq_rows)
+    n_total = n + n_s + n_e
+
+    S = sp.csr_matrix((np.ones(n_s), (leq_rows, np.arange(n_s))), shape=(m, n_s))
+    E = sp.csr_matrix((-np.ones(n_e), (geq_rows, np.arange(n_e))), shape=(m, n_e))
+
+    # Orientar filas con b < 0
+    flip = np.where(b < 0, -1.0, 1.0)
+    D = sp.diags(flip)
+    M = sp.hstack([D @ sp.hstack([A, S, E]), sp.identity(m, format='csr')]).tocsc()
+    b = b * flip
+
+    var_names = ([f"x{j+1}" for j in range(n)] +
+                 [f"s{j+1}" for j in range(n_s)] +
+                 [f"e{j+1}" for j in range(n_e)])
+
+    # Base inicial: holgura/exceso con coeficiente +1 tras orientar, si no artificial
+    basis = [n_total + i for i in range(m)]
+    for k, i in enumerate(leq_rows):
+        if flip[i] > 0:
+            basis[i] = n + k
+    for k, i in enumerate(geq_rows):
+        if flip[i] < 0:
+            basis[i] = n + n_s + k
+    artificial_indices = [j for j in basis if j >= n_total]
+
+    return M, b, var_names, basis, artificial_indices
+
+
+# -------------------------
+# Iteraciones simplex revisado
+# -------------------------
+def _dense_column(M, q):
+    # Columna q de M (CSC) como vector denso, leyendo indptr directamente
+    col = np.zeros(M.shape[0], dtype=float)
+    start, end = M.indptr[q], M.indptr[q + 1]
+    col[M.indices[start:end]] = M.data[start:end]
+    return col
+
+
+def _simplex_loop(factor, M, MT, b, basis, x_B, cost, eligible, max_iter, tol, notify=None):
+    """
+    Minimiza cost^T x partiendo de la base factible `basis`.
+    Retorna (estado, iteraciones).
+    """
+    iters = 0
+    while True:
+        if iters >= max_iter:
+            raise RuntimeError("Máximo de iteraciones alcanzado en simplex revisado.")
+
+        y = factor.btran(cost[basis])
+        d = cost - MT @ y
+        d[~eligible] = 0.0
+        d[basis] = 0.0
+        q = int(np.argmin(d))
+        if d[q] >= -tol:
+            return 'optimal', iters
+
+        alpha = factor.ftran(_dense_column(M, q))
+        mask = alpha > tol
+        if not mask.any():
+            return 'unbounded', iters
+        ratios = np.full(alpha.shape, np.inf)
+        ratios[mask] = np.maximum(x_B[mask], 0.0) / alpha[mask]
+        r = int(np.argmin(ratios))
+
+        theta = ratios[r]
+        x_B -= theta * alpha
+        x_B[r] = theta
+        sale = basis[r]
+        basis[r] = q
+        if factor.update(r, alpha, basis):
+            logger.debug("Refactorización LU tras %d iteraciones", iters + 1)
+            x_B[:] = factor.ftran(b)
+        iters += 1
+        if notify is not None:
+            notify(iters, q, sale, cost[basis] @ x_B)
+
+
+def revised_simplex_method(A, b, senses, c, mode=0, refactor_every=50, max_iter=None, tol=1e-9,
+                           callback=None):
+    """
+    Simplex revisado de dos fases sobre A disperso.
+    mode: 0 = minimización, 1 = maximización (igual que two_phase_method_fixed)
+    callback: igual que en two_phase_method_fixed (un diccionario por pivote).
+
+    Retorna (solution, Z, info). solution es None si el problema es
+    infactible o no acotado; info["estado"] indica cuál.
+    """
+    M, b, var_names, basis, artificial_indices = build_sparse_standard_form(A, b, senses)
+    MT = M.T.tocsr()
+    m = M.shape[0]
+    n_total = len(var_names)
+    if max_iter is None:
+        max_iter = max(200, 10 * (m + n_total))
+
+    t_start = time.perf_counter()
+    sign = -1.0 if mode == 1 else 1.0
+
+    def make_notify(phase):
+        if callback is None:
+            return None
+        names = var_names + [f"A{i+1}" for i in range(m)]
+
+        def notify(iteration, entra, sale, objective):
+            callback({
+                "phase": phase,
+                "iteration": iteration,
+                "entra": names[entra],
+                "sale": names[sale],
+                "objective": float(objective if phase == 1 else sign * objective),
+                "elapsed": time.perf_counter() - t_start
+            })
+        return notify
+
+    factor = BasisFactor(M, basis, refactor_every=refactor_every)
+    x_B = factor.ftran(b)
+
+    info = {
+        "iteraciones_fase1": 0,
+        "iteraciones_fase2": 0,
+        "nnz": int(M.nnz - m),
+        "artificiales": len(artificial_indices),
+    }
+
+    # FASE 1: minimizar suma de artificiales
+    eligible = np.zeros(M.shape[1], dtype=bool)
+    eligible[:n_total] = True
+    if artificial_indices:
+        cost1 = np.zeros(M.shape[1], dtype=float)
+        cost1[artificial_indices] = 1.0
+        estado, iters = _simplex_loop(factor, M, MT, b, basis, x_B, cost1, eligible, max_iter, tol,
+                                      notify=make_notify(1))
+        info["iteraciones_fase1"] = iters
+        W = float(cost1[basis] @ x_B)
+        if estado != 'optimal' or W > 1e-8 * max(1.0, np.abs(b).max(initial=0.0)):
+            logger.info("Simplex revisado: problema infactible (W = %g).", W)
+            info["estado"] = "Infactible"
+            return None, None, info
+
+        # Sacar de la base las artificiales que queden (a nivel cero)
+        for r in range(m):
+            if basis[r] < n_total:
+                continue
+            e_r = np.zeros(m)
+            e_r[r] = 1.0
+            row = MT @ factor.btran(e_r)
+            row[~eligible] = 0.0
+            row[basis] = 0.0
+            q = int(np.argmax(np.abs(row)))
+            if abs(row[q]) <= tol:
+                continue  # fila redundante: la artificial queda básica en cero
+            alpha = factor.ftran(_dense_column(M, q))
+            theta = x_B[r] / alpha[r]
+            x_B -= theta * alpha
+            x_B[r] = theta
+            basis[r] = q
+            if factor.update(r, alpha, basis):
+                x_B[:] = factor.ftran(b)
+
+    # FASE 2
+    c_full = np.zeros(M.shape[1], dtype=float)
+    c_orig = np.asarray(c, dtype=float)
+    c_full[:len(c_orig)] = sign * c_orig
+    estado, iters = _simplex_loop(factor, M, MT, b, basis, x_B, c_full, eligible, max_iter, tol,
+                                  notify=make_notify(2))
+    info["iteraciones_fase2"] = iters
+    if estado == 'unbounded':
+        logger.info("Simplex revisado: problema no acotado.")
+        info["estado"] = "No acotado"
+        return None, None, info
+
+    x = np.zeros(M.shape[1], dtype=float)
+    x[basis] = x_B
+    solution = {name: float(x[j]) for j, name in enumerate(var_names)}
+    Z = float(c_orig @ x[:len(c_orig)])
+    info["estado"] = "Óptimo encontrado"
+    return solution, Z, info
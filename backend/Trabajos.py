@@ -0,0 +1,215 @@
+import json
+import logging
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Archivo SQLite por defecto: compartido por todos los workers de gunicorn del mismo equipo
+JOBS_PATH_DEFECTO = os.path.join(tempfile.gettempdir(), "lp_trabajos.sqlite3")
+
+
+def _json_default(valor):
+    # Escalares y arreglos de NumPy que queden en la respuesta
+    if hasattr(valor, "tolist"):
+        return valor.tolist()
+    raise TypeError(f"{type(valor).__name__} no es serializable a JSON")
+
+
+def _arranque():
+    # Identificador del arranque del sistema ("" si no se puede leer): un PID solo
+    # identifica un proceso dentro del mismo equipo y del mismo arranque
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _inicio_proceso(pid):
+    # Inicio del proceso en ticks desde el arranque (campo 22 de /proc/<pid>/stat), o None
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[19]
+    except (OSError, IndexError):
+        return None
+
+
+def _proceso_vivo(pid, inicio=None):
+    """True si el proceso local `pid` existe y, con `inicio`, si no es otro proceso con el PID reutilizado."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return inicio is None or _inicio_proceso(pid) in (None, inicio)
+
+
+# -------------------------
+# Trabajo asíncrono
+# -------------------------
+class Job:
+    def __init__(self, data=None, id=None):
+        self.id = id or uuid.uuid4().hex
+        self.data = data
+        self.estado = "pendiente"      # pendiente | en_curso | terminado
+        self.progreso = None           # último aviso del solver (phase, iteration, objective...)
+        self.creado = time.time()
+        self.terminado = None
+        self.respuesta = None          # (payload, status) igual que /resolver
+
+    @classmethod
+    def desde_fila(cls, fila):
+        job_id, estado, progreso, creado, terminado, status, respuesta = fila
+        job = cls(id=job_id)
+        job.estado = estado
+        job.progreso = json.loads(progreso) if progreso else None
+        job.creado = creado
+        job.terminado = terminado
+        if respuesta is not None:
+            job.respuesta = (json.loads(respuesta), status)
+        return job
+
+    def to_dict(self):
+        resumen = {
+            "id": self.id,
+            "estado": self.estado,
+            "progreso": self.progreso,
+            "creado": self.creado,
+            "terminado": self.terminado
+        }
+        if self.respuesta is not None:
+            resumen["status"] = self.respuesta[1]
+        return resumen
+
+
+class JobManager:
+    """
+    Ejecuta problemas en un pool local de hilos y guarda estado, progreso y
+    respuesta de cada trabajo en un archivo SQLite (`path`) que comparten
+    todos los procesos: con varios workers de gunicorn, GET /jobs/<id> puede
+    llegar a cualquiera de ellos. Los trabajos terminados se eliminan `ttl`
+    segundos después de terminar (al consultar o crear trabajos); como
+    máximo hay `max_pendientes` trabajos sin terminar entre todos los
+    procesos. Un trabajo sin terminar cuyo proceso ya no existe (worker
+    reiniciado o equipo rearrancado) se marca como terminado con status 500.
+    Cada trabajo guarda equipo, arranque, PID e inicio del proceso que lo
+    ejecuta: solo se revisan los procesos del propio equipo, así con
+    JOBS_PATH en un volumen compartido no se tocan los de otros equipos.
+
+    solve_fn(data, progress) debe retornar la respuesta de /resolver como
+    (payload, status). El progreso se escribe como máximo cada
+    `intervalo_progreso` segundos.
+    """
+    def __init__(self, solve_fn, workers=2, ttl=600.0, max_pendientes=32, path=None, intervalo_progreso=0.5):
+        self.solve_fn = solve_fn
+        self.ttl = ttl
+        self.max_pendientes = max_pendientes
+        self.path = path or JOBS_PATH_DEFECTO
+        self.intervalo_progreso = intervalo_progreso
+        self._workers = workers
+        self._pool = None
+        self._db = None
+        self._pid = None
+        self._proceso = None
+        self._lock = threading.Lock()
+
+    def _conexion(self):
+        # Llamar con el lock tomado. Una conexión (y un pool de hilos) por proceso
+        if self._pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS trabajos ("
+                "id TEXT PRIMARY KEY, estado TEXT, progreso TEXT, creado REAL, terminado REAL, "
+                "status INTEGER, respuesta TEXT, pid INTEGER, equipo TEXT, arranque TEXT, inicio TEXT)"
+            )
+            # Archivos creados antes de guardar equipo, arranque e inicio del proceso
+            columnas = {fila[1] for fila in self._db.execute("PRAGMA table_info(trabajos)")}
+            for columna in ("equipo", "arranque", "inicio"):
+                if columna not in columnas:
+                    self._db.execute(f"ALTER TABLE trabajos ADD COLUMN {columna} TEXT")
+            self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="job")
+            self._pid = os.getpid()
+            self._proceso = (socket.gethostname(), _arranque(), _inicio_proceso(self._pid))
+        return self._db
+
+    def _evict(self, db):
+        # Llamar con el lock tomado
+        db.execute("DELETE FROM trabajos WHERE terminado IS NOT NULL AND terminado < ?", (time.time() - self.ttl,))
+        equipo, arranque, _ = self._proceso
+        procesos = db.execute("SELECT DISTINCT arranque, pid, inicio FROM trabajos "
+                              "WHERE terminado IS NULL AND equipo = ?", (equipo,)).fetchall()
+        for arranque_job, pid, inicio in procesos:
+            # De un arranque anterior del equipo ningún proceso sigue vivo
+            if arranque_job == arranque and _proceso_vivo(pid, inicio):
+                continue
+            logger.warning("Trabajos del proceso %d interrumpidos (el proceso ya no existe)", pid)
+            respuesta = {"error": "El trabajo se interrumpió", "estado": "Error del servidor"}
+            db.execute("UPDATE trabajos SET estado = 'terminado', terminado = ?, status = 500, respuesta = ? "
+                       "WHERE terminado IS NULL AND equipo = ? AND arranque IS ? AND pid = ? AND inicio IS ?",
+                       (time.time(), json.dumps(respuesta), equipo, arranque_job, pid, inicio))
+
+    def submit(self, data):
+        """Registra el trabajo y retorna su Job, o None si hay demasiados pendientes."""
+        with self._lock:
+            db = self._conexion()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                self._evict(db)
+                pendientes = db.execute("SELECT COUNT(*) FROM trabajos WHERE terminado IS NULL").fetchone()[0]
+                if pendientes >= self.max_pendientes:
+                    db.execute("COMMIT")
+                    return None
+                job = Job(data)
+                db.execute("INSERT INTO trabajos (id, estado, creado, pid, equipo, arranque, inicio) "
+                           "VALUES (?, ?, ?, ?, ?, ?, ?)", (job.id, job.estado, job.creado, self._pid, *self._proceso))
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            self._pool.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            db = self._conexion()
+            self._evict(db)
+            fila = db.execute("SELECT id, estado, progreso, creado, terminado, status, respuesta "
+                              "FROM trabajos WHERE id = ?", (job_id,)).fetchone()
+        return Job.desde_fila(fila) if fila is not None else None
+
+    def _actualizar(self, job_id, **campos):
+        columnas = ", ".join(f"{k} = ?" for k in campos)
+        with self._lock:
+            self._conexion().execute(f"UPDATE trabajos SET {columnas} WHERE id = ?", (*campos.values(), job_id))
+
+    def _run(self, job):
+        self._actualizar(job.id, estado="en_curso")
+        ultimo = 0.0
+
+        def progress(info):
+            nonlocal ultimo
+            ahora = time.monotonic()
+            if ahora - ultimo >= self.intervalo_progreso:
+                ultimo = ahora
+                try:
+                    self._actualizar(job.id, progreso=json.dumps(info, default=_json_default))
+                except sqlite3.Error as e:
+                    logger.warning("No se pudo guardar el progreso del trabajo %s: %s", job.id, e)
+
+        try:
+            payload, status = self.solve_fn(job.data, progress)
+            respuesta = json.dumps(payload, default=_json_default)
+        except Exception as e:
+            logger.exception("Error en trabajo %s", job.id)
+            payload, status = {"error": str(e), "estado": "Error en cálculo"}, 500
+            respuesta = json.dumps(payload)
+        self._actualizar(job.id, estado="terminado", terminado=time.time(), status=status, respuesta=respuesta)
@@ -0,0 +1,89 @@
+"""
+Benchmark: cotas simples l <= x <= u como filas de restricción frente al
+simplex con variables acotadas ("cotas" de /resolver).
+
+Uso:  python benchmarks/bench_cotas.py [--tamanos 20 50 100] [--problemas 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from backend.Doblefase import two_phase_method_fixed
+from backend.FormaEstandar import construir_forma_estandar, desplazar_inferiores
+
+
+def problema_aleatorio(tamano, semilla):
+    # tamano restricciones densas + una cota inferior y una superior por variable
+    rng = np.random.default_rng(semilla)
+    restricciones = [
+        {
+            "coeficientes": rng.integers(0, 10, size=tamano).tolist(),
+            "signo": "leq",
+            "c": float(rng.integers(100 * tamano, 300 * tamano))
+        }
+        for _ in range(tamano)
+    ]
+    inferiores = rng.integers(0, 3, size=tamano).astype(float)
+    superiores = inferiores + rng.integers(5, 40, size=tamano)
+    return restricciones, rng.integers(1, 10, size=tamano).tolist(), inferiores, superiores
+
+
+def resolver(forma, upper=None):
+    t0 = time.perf_counter()
+    _, Z, _, info = two_phase_method_fixed(
+        forma["A"], forma["b"], forma["c_final"], forma["var_names"], forma["basic_vars_init"],
+        forma["basic_costs_init"], forma["artificial_indices"], mode=1, trace="none",
+        return_info=True, upper=upper
+    )
+    return Z, info["iteraciones_fase1"] + info["iteraciones_fase2"], time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[20, 50, 100])
+    parser.add_argument("--problemas", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'tamaño':>7} {'modelo':>8} {'filas':>6} {'iteraciones':>12} {'ms':>9}")
+    for tamano in args.tamanos:
+        resultados = {"filas": [0, 0, 0.0], "cotas": [0, 0, 0.0]}
+        for semilla in range(args.problemas):
+            restricciones, coeficientes, inferiores, superiores = problema_aleatorio(tamano, semilla)
+
+            # Cada cota como una fila más
+            filas_cota = []
+            for j in range(tamano):
+                e_j = np.eye(tamano)[j].tolist()
+                filas_cota.append({"coeficientes": e_j, "signo": "geq", "c": inferiores[j]})
+                filas_cota.append({"coeficientes": e_j, "signo": "leq", "c": superiores[j]})
+            forma = construir_forma_estandar(restricciones + filas_cota, coeficientes, tamano, mode=1)
+            Z_filas, iteraciones, t = resolver(forma)
+            resultados["filas"][0] = forma["A"].shape[0]
+            resultados["filas"][1] += iteraciones
+            resultados["filas"][2] += t
+
+            # Cotas nativas: x = l + x', 0 <= x' <= u - l
+            forma = construir_forma_estandar(desplazar_inferiores(restricciones, tamano, inferiores),
+                                             coeficientes, tamano, mode=1)
+            upper = np.full(forma["total_vars"], np.inf)
+            upper[:tamano] = superiores - inferiores
+            Z_cotas, iteraciones, t = resolver(forma, upper)
+            resultados["cotas"][0] = forma["A"].shape[0]
+            resultados["cotas"][1] += iteraciones
+            resultados["cotas"][2] += t
+
+            Z_cotas += float(np.dot(coeficientes, inferiores))
+            if not np.isclose(Z_filas, Z_cotas):
+                print(f"  aviso: Z distinto con semilla {semilla}: {Z_filas} vs {Z_cotas}")
+
+        for modelo, (filas, iteraciones, t) in resultados.items():
+            print(f"{tamano:>7} {modelo:>8} {filas:>6} {iteraciones / args.problemas:>12.1f} "
+                  f"{t * 1e3 / args.problemas:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
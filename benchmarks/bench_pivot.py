@@ -0,0 +1,68 @@
+"""
+Benchmark: tiempo por pivote del PivotEngine (in-place, rango 1) frente a la
+versión anterior de pivot_transform (copia + bucle por filas).
+
+Uso:  python benchmarks/bench_pivot.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from backend.Doblefase import PivotEngine
+
+
+def pivot_copia_bucle(tableau, pivot_row, pivot_col, tol=1e-12):
+    # Implementación original: copia el tableau y actualiza fila por fila
+    A = tableau.copy()
+    pivot_val = A[pivot_row, pivot_col]
+    if abs(pivot_val) < tol:
+        raise ValueError("Pivote ~ 0, abortando para evitar NaN.")
+    A[pivot_row, :] = A[pivot_row, :] / pivot_val
+    for i in range(A.shape[0]):
+        if i == pivot_row:
+            continue
+        A[i, :] = A[i, :] - A[i, pivot_col] * A[pivot_row, :]
+    return A
+
+
+def medir(fn, repeticiones):
+    t0 = time.perf_counter()
+    for _ in range(repeticiones):
+        fn()
+    return (time.perf_counter() - t0) / repeticiones
+
+
+def main():
+    rng = np.random.default_rng(0)
+    tamanos = [10, 50, 100, 200, 500, 1000, 2000]
+    print(f"{'m':>6} {'n':>6} {'copia+bucle (ms)':>18} {'in-place (ms)':>15} {'speedup':>9}")
+    for m in tamanos:
+        n = m
+        base = rng.uniform(1.0, 10.0, size=(m, n + 1))
+        reps = min(m, max(3, int(2000 / m)))
+        # Filas y columnas distintas en cada pivote para no caer en pivotes nulos
+        pivotes = list(zip(rng.permutation(m)[:reps].tolist(), rng.permutation(n)[:reps].tolist()))
+
+        T = base.copy()
+        it = iter(pivotes)
+        def viejo():
+            nonlocal T
+            r, c = next(it)
+            T = pivot_copia_bucle(T, r, c)
+        t_viejo = medir(viejo, reps)
+
+        engine = PivotEngine(base.copy())
+        it2 = iter(pivotes)
+        def nuevo():
+            r, c = next(it2)
+            engine.pivot(r, c)
+        t_nuevo = medir(nuevo, reps)
+
+        print(f"{m:>6} {n:>6} {t_viejo * 1e3:>18.4f} {t_nuevo * 1e3:>15.4f} {t_viejo / t_nuevo:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: iteraciones y tiempo de two_phase_method_fixed con cada regla de
+pricing sobre problemas aleatorios.
+
+Uso:  python benchmarks/bench_pricing.py [--tamanos 20 50 100] [--problemas 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from backend.Doblefase import two_phase_method_fixed
+from backend.FormaEstandar import construir_forma_estandar
+from backend.Pricing import PRICING_RULES
+
+
+def problema_aleatorio(tamano, semilla):
+    rng = np.random.default_rng(semilla)
+    restricciones = [
+        {
+            "coeficientes": rng.integers(0, 10, size=tamano).tolist(),
+            "signo": "leq",
+            "c": float(rng.integers(100, 300))
+        }
+        for _ in range(tamano)
+    ]
+    return restricciones, rng.integers(1, 10, size=tamano).tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[20, 50, 100])
+    parser.add_argument("--problemas", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'tamaño':>7} {'regla':>9} {'iteraciones':>12} {'degenerados':>12} {'ms':>9}")
+    for tamano in args.tamanos:
+        formas = []
+        for semilla in range(args.problemas):
+            restricciones, coeficientes = problema_aleatorio(tamano, semilla)
+            formas.append(construir_forma_estandar(restricciones, coeficientes, tamano, mode=1))
+        for regla in PRICING_RULES:
+            iteraciones = degenerados = 0
+            t0 = time.perf_counter()
+            for f in formas:
+                _, _, _, info = two_phase_method_fixed(
+                    f["A"], f["b"], f["c_final"], f["var_names"], f["basic_vars_init"],
+                    f["basic_costs_init"], f["artificial_indices"], mode=1, trace="none",
+                    return_info=True, pricing=regla
+                )
+                iteraciones += info["iteraciones_fase1"] + info["iteraciones_fase2"]
+                degenerados += info["pivotes_degenerados"]
+            ms = (time.perf_counter() - t0) * 1e3 / len(formas)
+            print(f"{tamano:>7} {regla:>9} {iteraciones / len(formas):>12.1f} "
+                  f"{degenerados / len(formas):>12.1f} {ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: eliminación de puntos duplicados con tolerancia, comparación uno
+a uno (la versión cuadrática anterior) frente a unique_points con grilla.
+Que ambas den la misma salida lo verifica tests/test_grafico.py.
+
+Uso:  python benchmarks/bench_unicos.py [--tamanos 100 1000 5000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from backend.Grafico import unique_points
+
+
+def unique_points_cuadratico(points, tol=1e-7):
+    # Versión anterior (cada punto contra todos los aceptados); tests/test_grafico.py
+    # la usa como referencia de unique_points
+    uniques = []
+    for x, y in points:
+        found = False
+        for ux, uy in uniques:
+            if abs(x - ux) <= tol and abs(y - uy) <= tol:
+                found = True
+                break
+        if not found:
+            uniques.append((x, y))
+    return uniques
+
+
+def puntos_aleatorios(rng, cantidad, tol):
+    # Pocos vértices "reales" y muchas copias con ruido del orden de tol,
+    # como cuando varias restricciones pasan por el mismo vértice degenerado
+    base = rng.integers(-5, 20, size=(max(1, cantidad // 10), 2)) * rng.choice([1.0, 0.5, 1 / 3])
+    puntos = base[rng.integers(0, len(base), size=cantidad)]
+    puntos = puntos + rng.choice([0.0, tol, -tol, 0.5 * tol, 1.5 * tol, 2 * tol], size=puntos.shape)
+    puntos = puntos + rng.uniform(-1.2 * tol, 1.2 * tol, size=puntos.shape) * (rng.random(puntos.shape) < 0.3)
+    return [tuple(map(float, p)) for p in puntos]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--tol", type=float, default=1e-7)
+    args = parser.parse_args()
+
+    print(f"{'puntos':>7} {'únicos':>7} {'cuadrático ms':>14} {'grilla ms':>10}")
+    for tamano in args.tamanos:
+        puntos = puntos_aleatorios(np.random.default_rng(tamano), tamano, args.tol)
+        t0 = time.perf_counter()
+        unicos = unique_points_cuadratico(puntos, args.tol)
+        t_cuadratico = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        unique_points(puntos, args.tol)
+        t_grilla = time.perf_counter() - t0
+        print(f"{tamano:>7} {len(unicos):>7} {t_cuadratico * 1e3:>14.2f} {t_grilla * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: enumeración de vértices del método gráfico por pares en Python
+(un np.linalg.solve por par) frente a la versión por lotes de Grafico.py
+(regla de Cramer + factibilidad en un producto matricial + claves redondeadas).
+
+Uso:  python benchmarks/bench_vertices.py [--tamanos 2 10 50 200 1000 2000]
+                                          [--repeticiones 5] [--max-por-pares 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from backend.Grafico import encontrar_vertices_completos, unique_points
+
+
+def restricciones_aleatorias(tamano, semilla):
+    # Rectas tangentes a un círculo: región acotada con muchos vértices reales
+    rng = np.random.default_rng(semilla)
+    angulos = rng.uniform(0, np.pi / 2, size=tamano)
+    a, b = np.cos(angulos), np.sin(angulos)
+    c = 10 * (a + b) + 5
+    return [tuple(map(float, fila)) for fila in zip(a, b, c)]
+
+
+def vertices_por_pares(restricciones, es_minimizacion=False):
+    # Enumeración anterior: un solve y un recorrido de factibilidad por par
+    vertices = []
+    for i in range(len(restricciones)):
+        for j in range(i + 1, len(restricciones)):
+            a1, b1, c1 = restricciones[i]
+            a2, b2, c2 = restricciones[j]
+            A = np.array([[a1, b1], [a2, b2]], dtype=float)
+            if abs(np.linalg.det(A)) > 1e-12:
+                p = np.linalg.solve(A, np.array([c1, c2], dtype=float))
+                if p[0] >= -1e-9 and p[1] >= -1e-9 and \
+                        all(a * p[0] + b * p[1] <= c + 1e-9 for a, b, c in restricciones):
+                    vertices.append((float(p[0]), float(p[1])))
+    for a, b, c in restricciones:
+        for punto in ((c / a, 0.0) if abs(a) > 1e-12 else None, (0.0, c / b) if abs(b) > 1e-12 else None):
+            if punto and min(punto) >= -1e-9 and \
+                    all(a2 * punto[0] + b2 * punto[1] <= c2 + 1e-9 for a2, b2, c2 in restricciones):
+                vertices.append(punto)
+    if not es_minimizacion and all(c >= -1e-9 for _, _, c in restricciones):
+        vertices.append((0.0, 0.0))
+    return unique_points(vertices, tol=1e-7)
+
+
+def medir(funcion, restricciones, repeticiones):
+    mejor = np.inf
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        vertices = funcion(restricciones)
+        mejor = min(mejor, time.perf_counter() - t0)
+    return vertices, mejor
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[2, 10, 50, 200, 1000, 2000])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--max-por-pares", type=int, default=200,
+                        help="tamaño máximo para la enumeración por pares (es cuadrática en Python)")
+    args = parser.parse_args()
+
+    print(f"{'tamaño':>7} {'vértices':>9} {'pares ms':>10} {'lotes ms':>10} {'aceleración':>12}")
+    for tamano in args.tamanos:
+        restricciones = restricciones_aleatorias(tamano, tamano)
+        lotes, t_lotes = medir(encontrar_vertices_completos, restricciones, args.repeticiones)
+        if tamano <= args.max_por_pares:
+            pares, t_pares = medir(vertices_por_pares, restricciones, max(1, args.repeticiones // 2))
+            if not np.allclose(sorted(pares), sorted(lotes)):
+                print(f"  aviso: vértices distintos con {tamano} restricciones")
+            columnas = f"{t_pares * 1e3:>10.2f} {t_lotes * 1e3:>10.2f} {t_pares / t_lotes:>11.1f}x"
+        else:
+            columnas = f"{'-':>10} {t_lotes * 1e3:>10.2f} {'-':>12}"
+        print(f"{tamano:>7} {len(lotes):>9} {columnas}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Prueba de carga local: levanta gunicorn con 1, 2, 4 y 8 workers y mide
+el throughput de /resolver con clientes concurrentes (con la caché de
+resultados desactivada, para medir el solver).
+
+Uso:  python benchmarks/load_test.py [--segundos 10] [--clientes 16] [--tamano 40]
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+RAIZ = os.path.join(os.path.dirname(__file__), "..")
+
+
+def problema_aleatorio(tamano, semilla=0):
+    rng = np.random.default_rng(semilla)
+    restricciones = [
+        {
+            "coeficientes": rng.integers(1, 10, size=tamano).tolist(),
+            "signo": "leq",
+            "c": float(rng.integers(50, 200))
+        }
+        for _ in range(tamano)
+    ]
+    return {
+        "metodo": "doblefase",
+        "variables": tamano,
+        "coeficientes": rng.integers(1, 10, size=tamano).tolist(),
+        "tipo": "max",
+        "restricciones": restricciones,
+        "traza": "none"
+    }
+
+
+def puerto_libre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def esperar_servidor(url, limite=30.0):
+    t0 = time.time()
+    while time.time() - t0 < limite:
+        try:
+            urllib.request.urlopen(url, timeout=1)
+            return
+        except Exception:
+            time.sleep(0.2)
+    raise RuntimeError("El servidor no respondió a tiempo")
+
+
+def medir(url, cuerpo, segundos, clientes):
+    fin = time.time() + segundos
+
+    def cliente():
+        ok = errores = 0
+        while time.time() < fin:
+            req = urllib.request.Request(url, data=cuerpo, headers={"Content-Type": "application/json"})
+            try:
+                with urllib.request.urlopen(req, timeout=60) as resp:
+                    resp.read()
+                ok += 1
+            except Exception:
+                errores += 1
+        return ok, errores
+
+    with ThreadPoolExecutor(max_workers=clientes) as pool:
+        resultados = list(pool.map(lambda _: cliente(), range(clientes)))
+    ok = sum(r[0] for r in resultados)
+    errores = sum(r[1] for r in resultados)
+    return ok / segundos, errores
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--segundos", type=float, default=10.0)
+    parser.add_argument("--clientes", type=int, default=16)
+    parser.add_argument("--tamano", type=int, default=40)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    cuerpo = json.dumps(problema_aleatorio(args.tamano)).encode()
+    print(f"{'workers':>8} {'req/s':>10} {'errores':>8}")
+    for w in args.workers:
+        puerto = puerto_libre()
+        # Sin caché de resultados: el cuerpo es siempre el mismo y se mediría solo la caché
+        env = dict(os.environ, PORT=str(puerto), WEB_CONCURRENCY=str(w), LOG_LEVEL="warning",
+                   RESULT_CACHE_ENTRIES="0", RESULT_CACHE_PATH="")
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app:app"],
+            cwd=RAIZ, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            base = f"http://127.0.0.1:{puerto}"
+            esperar_servidor(base + "/")
+            rps, errores = medir(base + "/resolver", cuerpo, args.segundos, args.clientes)
+            print(f"{w:>8} {rps:>10.1f} {errores:>8}")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
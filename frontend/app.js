@@ -488,7 +488,8 @@ function visualizarResultadosGrafico(data) {
 
     // --- ALMACENAR DATOS DE LA REGIÓN PARA EL PLUGIN ---
     if (vet.length >= 3) {
-        const verticesOrdenados = ordenarVerticesPoligono(vet);
+        // El backend ya los envía ordenados (envolvente convexa)
+        const verticesOrdenados = data.vertices_ordenados ? vet : ordenarVerticesPoligono(vet);
         regionData = {
             vertices: verticesOrdenados,
             color: colores.region,
@@ -690,6 +691,14 @@ function mostrarResultadosDobleFase(data) {
             Total variables: ${data.problema_info.total_variables}<br>
             Restricciones: ${data.problema_info.restricciones}
         `;
+        if (data.problema_info.escalado) {
+            const escalado = data.problema_info.escalado;
+            document.getElementById('puntosResultados').innerHTML += `<br>
+            ⚖️ Escalado aplicado: rango de coeficientes ${Number(escalado.rango_antes).toPrecision(3)} →
+            ${Number(escalado.rango_despues).toPrecision(3)}<br>
+            <em>Las tablas están en unidades escaladas; la solución y Z, en las del modelo original.</em>
+            `;
+        }
     }
     
     // Mostrar valores de variables
@@ -761,70 +770,77 @@ function crearTablaHTML(tabla) {
         </div>`;
     }
     
-    html += `<div class="table-scroll">
-        <table class="simplex-table">`;
-    
-    // Encabezados
-    html += '<tr>';
-    tabla.headers.forEach(header => {
-        html += `<th>${header}</th>`;
-    });
-    html += '</tr>';
+    // Con traza 'summary' o 'delta' la tabla no trae el tableau
+    if (tabla.data) {
+        html += `<div class="table-scroll">
+            <table class="simplex-table">`;
     
-    // Datos
-    tabla.data.forEach((fila, filaIndex) => {
-        const esFilaZjCj = fila[0] === 'Zj-Cj';
+        // Encabezados
         html += '<tr>';
+        tabla.headers.forEach(header => {
+            html += `<th>${header}</th>`;
+        });
+        html += '</tr>';
+    
+        // Datos
+        tabla.data.forEach((fila, filaIndex) => {
+            const esFilaZjCj = fila[0] === 'Zj-Cj';
+            html += '<tr>';
         
-        fila.forEach((celda, colIndex) => {
-            let clase = '';
-            let contenido = celda;
+            fila.forEach((celda, colIndex) => {
+                let clase = '';
+                let contenido = celda;
             
-            // Formatear números
-            if (typeof celda === 'number') {
-                contenido = Math.abs(celda) < 0.0001 ? '0' : celda.toFixed(4);
+                // Formatear números
+                if (typeof celda === 'number') {
+                    contenido = Math.abs(celda) < 0.0001 ? '0' : celda.toFixed(4);
                 
-                // Resaltar valores importantes
-                if (Math.abs(celda) < 0.0001 && celda !== 0) {
-                    contenido = '~0';
+                    // Resaltar valores importantes
+                    if (Math.abs(celda) < 0.0001 && celda !== 0) {
+                        contenido = '~0';
+                    }
                 }
-            }
             
-            // Estilos especiales
-            if (esFilaZjCj) {
-                clase = 'zj-cj-row';
-                // Resaltar valores positivos/negativos según optimización
-                if (typeof celda === 'number' && colIndex > 0 && colIndex < fila.length - 1) {
-                    if (celda > 0.0001) clase += ' positive';
-                    else if (celda < -0.0001) clase += ' negative';
+                // Estilos especiales
+                if (esFilaZjCj) {
+                    clase = 'zj-cj-row';
+                    // Resaltar valores positivos/negativos según optimización
+                    if (typeof celda === 'number' && colIndex > 0 && colIndex < fila.length - 1) {
+                        if (celda > 0.0001) clase += ' positive';
+                        else if (celda < -0.0001) clase += ' negative';
+                    }
                 }
-            }
             
-            // Resaltar celda pivote
-            if (tabla.pivot_info && 
-                !esFilaZjCj && 
-                filaIndex === tabla.pivot_info.row && 
-                colIndex === tabla.pivot_info.col + 1) {
-                clase += ' pivot-cell';
-            }
+                // Resaltar celda pivote
+                if (tabla.pivot_info && 
+                    !esFilaZjCj && 
+                    filaIndex === tabla.pivot_info.row && 
+                    colIndex === tabla.pivot_info.col + 1) {
+                    clase += ' pivot-cell';
+                }
             
-            // Primera columna (nombres de variables)
-            if (colIndex === 0) {
-                clase += ' variable-cell';
-            }
+                // Primera columna (nombres de variables)
+                if (colIndex === 0) {
+                    clase += ' variable-cell';
+                }
             
-            // Última columna (LD)
-            if (colIndex === fila.length - 1) {
-                clase += ' ld-cell';
-            }
+                // Última columna (LD)
+                if (colIndex === fila.length - 1) {
+                    clase += ' ld-cell';
+                }
             
-            html += `<td class="${clase}">${contenido}</td>`;
-        });
+                html += `<td class="${clase}">${contenido}</td>`;
+            });
         
-        html += '</tr>';
-    });
+            html += '</tr>';
+        });
     
-    html += '</table></div>';
+        html += '</table></div>';
+    } else if (tabla.objective !== undefined) {
+        html += `<div class="table-info">
+            Valor objetivo: <strong>${tabla.objective.toFixed(4)}</strong>
+        </div>`;
+    }
     
     // Información adicional
     if (tabla.W_value !== undefined) {
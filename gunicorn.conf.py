@@ -0,0 +1,54 @@
+# Configuración de gunicorn para producción:  gunicorn -c gunicorn.conf.py app:app
+#
+# El solver es NumPy ligado a CPU y corre en procesos aparte (SolveExecutor):
+# cada worker web tiene su propio pool de SOLVER_WORKERS procesos, más uno
+# de /jobs (JOBS_WORKERS, se inicia con el primer trabajo). Para no tener
+# más procesos de cálculo que núcleos, por defecto
+#   SOLVER_WORKERS = max(1, núcleos // WEB_CONCURRENCY)
+# (uno por worker web con WEB_CONCURRENCY = núcleos) y los hilos BLAS se
+# reparten entre todos esos procesos. Todo es ajustable por variables de
+# entorno; un valor explícito de SOLVER_WORKERS o de los hilos BLAS se respeta.
+#
+# Los trabajos de /jobs se ejecutan en el worker que recibió el POST, pero su
+# estado y su resultado se guardan en un archivo SQLite (JOBS_PATH, por defecto
+# en el directorio temporal) que comparten todos los workers, así cualquier
+# worker puede responder GET /jobs/<id>. Con varios equipos o contenedores
+# JOBS_PATH debe apuntar a un volumen común; cada equipo solo da por
+# interrumpidos los trabajos de sus propios procesos que ya no existen.
+import multiprocessing
+import os
+
+cores = multiprocessing.cpu_count()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", cores))
+threads = int(os.environ.get("GUNICORN_THREADS", 2))
+worker_class = "gthread"
+
+# Procesos solver por worker web (lo lee SolveExecutor.from_env al cargar la app)
+os.environ.setdefault("SOLVER_WORKERS", str(max(1, cores // max(1, workers))))
+solver_workers = max(1, int(os.environ["SOLVER_WORKERS"]))
+
+# Cargar la app (y NumPy) una sola vez en el master antes del fork
+preload_app = True
+
+# Reciclar workers periódicamente (fragmentación de memoria de NumPy)
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info").lower()
+
+# Hilos BLAS/OpenMP por proceso solver: sin esto cada proceso abre un hilo
+# por núcleo y se pisan. Debe fijarse antes de importar NumPy, por eso va
+# aquí (el config se carga antes que la app con preload_app; los procesos
+# solver heredan el entorno).
+blas_threads = str(max(1, cores // max(1, workers * solver_workers)))
+for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS",
+            "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS"):
+    os.environ.setdefault(var, blas_threads)
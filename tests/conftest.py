@@ -0,0 +1,20 @@
+import os
+import sys
+import tempfile
+
+# Solvers en línea (sin procesos) y sin caché de resultados, antes de importar app
+os.environ.setdefault("SOLVER_WORKERS", "0")
+os.environ.setdefault("JOBS_WORKERS", "0")
+os.environ.setdefault("RESULT_CACHE_ENTRIES", "0")
+os.environ.setdefault("PLOT_CACHE_ENTRIES", "0")
+os.environ.setdefault("JOBS_PATH", os.path.join(tempfile.mkdtemp(), "trabajos.sqlite3"))
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def cliente():
+    from app import app
+    return app.test_client()
@@ -0,0 +1,40 @@
+import app as aplicacion
+import pytest
+from backend.Cache import ResultCache
+
+PROBLEMA = {
+    "metodo": "doblefase",
+    "variables": 2,
+    "tipo": "max",
+    "coeficientes": [3, 5],
+    "restricciones": [{"coeficientes": [1, 1], "signo": "leq", "c": 4}]
+}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResultCache(max_entries=16)
+    monkeypatch.setattr(aplicacion, "cache", cache)
+    return cache
+
+
+def test_error_transitorio_no_se_cachea(cliente, cache, monkeypatch):
+    def sin_memoria(*args, **kwargs):
+        raise MemoryError()
+
+    with monkeypatch.context() as m:
+        m.setattr(aplicacion, "two_phase_method_fixed", sin_memoria)
+        fallida = cliente.post('/resolver', json=PROBLEMA)
+    assert fallida.status_code == 400 and fallida.get_json()["estado"] == aplicacion.ESTADO_ERROR_CALCULO
+
+    respuesta = cliente.post('/resolver', json=PROBLEMA)
+    assert respuesta.status_code == 200 and respuesta.headers["X-Cache"] == "MISS"
+    assert cliente.post('/resolver', json=PROBLEMA).headers["X-Cache"] == "HIT"
+
+
+def test_infactible_se_cachea(cliente, cache):
+    infactible = dict(PROBLEMA, restricciones=PROBLEMA["restricciones"] + [
+        {"coeficientes": [1, 1], "signo": "geq", "c": 5}])
+    assert cliente.post('/resolver', json=infactible).status_code == 400
+    repetida = cliente.post('/resolver', json=infactible)
+    assert repetida.status_code == 400 and repetida.headers["X-Cache"] == "HIT"
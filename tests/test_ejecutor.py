@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from backend.Ejecutor import SolveExecutor, SolveTimeout, WorkerCrashed
+
+
+def _con_progreso(valor, espera=0.2, callback=None):
+    if callback is not None:
+        callback({"phase": 1, "iteration": 1})
+    time.sleep(espera)
+    return valor
+
+
+@pytest.fixture
+def pool():
+    ejecutor = SolveExecutor(workers=1, max_queue=2, timeout=10.0)
+    yield ejecutor
+    ejecutor.shutdown()
+
+
+def test_error_en_progress_no_reencola_el_worker(pool):
+    def progress(info):
+        raise ValueError("falla del callback")
+
+    with pytest.raises(ValueError):
+        pool.run(_con_progreso, 1, progress=progress)
+    # Con el worker reencolado se leería el resultado (1) de la tarea anterior
+    assert pool.run(_con_progreso, 2, espera=0.0) == 2
+
+
+def test_reemplazo_fallido_achica_el_pool(pool, monkeypatch):
+    assert pool.run(_con_progreso, 0, espera=0.0) == 0
+    nuevo_worker = pool._nuevo_worker
+
+    def sin_procesos():
+        raise WorkerCrashed("sin procesos")
+
+    monkeypatch.setattr(pool, "_nuevo_worker", sin_procesos)
+    with pytest.raises(SolveTimeout):
+        pool.run(_con_progreso, 1, espera=5.0, timeout=0.2)
+    # El worker terminado no vuelve a la cola
+    assert pool._idle.qsize() == 0 and pool._faltantes == 1
+
+    monkeypatch.setattr(pool, "_nuevo_worker", nuevo_worker)
+    assert pool.run(_con_progreso, 3, espera=0.0) == 3
+    assert pool._faltantes == 0
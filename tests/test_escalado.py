@@ -0,0 +1,43 @@
+import pytest
+
+# Coeficientes en varios órdenes de magnitud: escalado="auto" lo aplicaría
+PROBLEMA = {
+    "metodo": "doblefase",
+    "variables": 2,
+    "tipo": "max",
+    "coeficientes": [3, 5e-4],
+    "restricciones": [
+        {"coeficientes": [1, 0], "signo": "leq", "c": 4},
+        {"coeficientes": [0, 2e-4], "signo": "leq", "c": 12e-4},
+        {"coeficientes": [3e2, 2e-2], "signo": "leq", "c": 18e2}
+    ]
+}
+
+
+def _tabla_final(respuesta):
+    return respuesta["tablas"][-1]
+
+
+def test_por_defecto_sin_escalado_con_traza(cliente):
+    respuesta = cliente.post('/resolver', json=PROBLEMA).get_json()
+    assert respuesta["problema_info"]["traza"] == "full"
+    assert "escalado" not in respuesta["problema_info"]
+    # La columna LD de la tabla final coincide con la solución del modelo
+    final = _tabla_final(respuesta)
+    ld = {fila[0]: fila[-1] for fila in final["data"] if fila[0] != "Zj-Cj"}
+    for variable in respuesta["solucion"]:
+        if variable["variable"] in ld:
+            assert ld[variable["variable"]] == pytest.approx(variable["valor"])
+
+
+def test_por_defecto_escalado_sin_traza(cliente):
+    respuesta = cliente.post('/resolver', json=dict(PROBLEMA, traza="none")).get_json()
+    assert "escalado" in respuesta["problema_info"]
+    sin_escalar = cliente.post('/resolver', json=dict(PROBLEMA, traza="none", escalado=False)).get_json()
+    assert respuesta["valor_optimo"] == pytest.approx(sin_escalar["valor_optimo"])
+
+
+def test_escalado_explicito_con_traza(cliente):
+    respuesta = cliente.post('/resolver', json=dict(PROBLEMA, escalado=True)).get_json()
+    assert respuesta["problema_info"]["escalado"]["rango_despues"] < respuesta["problema_info"]["escalado"]["rango_antes"]
+    assert respuesta["tablas"]
@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+import pytest
+
+from backend.Grafico import unique_points
+# Referencia: la versión cuadrática anterior, la misma que mide el benchmark
+from benchmarks.bench_unicos import unique_points_cuadratico
+
+
+def nube_aleatoria(rng, cantidad, tol):
+    # Pocos vértices "reales" y muchas copias a distancias alrededor de tol
+    # (justo en el límite, apenas dentro y apenas fuera), en bordes de celda
+    # de la grilla (múltiplos de 2*tol) y con coordenadas negativas
+    base = rng.integers(-5, 20, size=(max(1, cantidad // 10), 2)) * rng.choice([1.0, 0.5, 1 / 3, 2 * tol])
+    puntos = base[rng.integers(0, len(base), size=cantidad)]
+    desvios = tol * np.array([0.0, 1.0, -1.0, 0.5, 1.5, 2.0, 1 - 1e-9, 1 + 1e-9, -(1 - 1e-9), -(1 + 1e-9)])
+    puntos = puntos + rng.choice(desvios, size=puntos.shape)
+    puntos = puntos + rng.uniform(-1.2 * tol, 1.2 * tol, size=puntos.shape) * (rng.random(puntos.shape) < 0.3)
+    return [tuple(map(float, p)) for p in puntos]
+
+
+@pytest.mark.parametrize("tol", [1e-7, 1e-3, 0.5])
+def test_unique_points_igual_a_cuadratico(tol):
+    rng = np.random.default_rng(12345)
+    for _ in range(300):
+        puntos = nube_aleatoria(rng, int(rng.integers(1, 150)), tol)
+        assert unique_points(puntos, tol) == unique_points_cuadratico(puntos, tol)
+
+
+def test_unique_points_limite_de_tolerancia():
+    tol = 1e-7
+    puntos = [(0.0, 0.0), (tol, -tol), (2 * tol, 0.0), (-tol * (1 + 1e-6), 0.0), (1.0, 1.0), (1.0 + tol, 1.0)]
+    assert unique_points(puntos, tol) == unique_points_cuadratico(puntos, tol)
+
+
+def test_unique_points_no_finitos():
+    puntos = [(math.inf, 0.0), (math.nan, 1.0), (1e300, 1e300), (-0.0, 0.0), (0.0, 0.0), (math.inf, 0.0),
+              (1e300, 1e300 + 1e285)]
+    obtenidos = unique_points(puntos)
+    esperados = unique_points_cuadratico(puntos)
+    assert len(obtenidos) == len(esperados)
+    for (x1, y1), (x2, y2) in zip(obtenidos, esperados):
+        assert (x1 == x2 or (math.isnan(x1) and math.isnan(x2))) and y1 == y2
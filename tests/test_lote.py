@@ -0,0 +1,93 @@
+import numpy as np
+
+# Ejemplo de ciclado de Beale: Dantzig con el primer índice en empates cicla
+BEALE = {
+    "metodo": "doblefase",
+    "variables": 4,
+    "tipo": "min",
+    "coeficientes": [-0.75, 20, -0.5, 6],
+    "restricciones": [
+        {"coeficientes": [0.25, -8, -1, 9], "signo": "leq", "c": 0},
+        {"coeficientes": [0.5, -12, -0.5, 3], "signo": "leq", "c": 0},
+        {"coeficientes": [0, 0, 1, 0], "signo": "leq", "c": 1}
+    ],
+    "traza": "none",
+    "sensibilidad": False
+}
+
+
+def test_lote_apilado_no_cicla(cliente):
+    individual = cliente.post('/resolver', json=BEALE).get_json()
+    lote = cliente.post('/resolver/batch', json={"problemas": [BEALE, BEALE]}).get_json()
+    assert lote["resumen"]["apilados"] == 2
+    for item in lote["resultados"]:
+        assert item["status"] == 200
+        assert abs(item["respuesta"]["valor_optimo"] - individual["valor_optimo"]) < 1e-9
+
+
+def test_lote_apilado_tolerancia_relativa(cliente):
+    # Tras entrar x1, x2 mejora Z en 1e-7 (ruido frente a costos de 1e6): con
+    # la tolerancia relativa el óptimo se declara igual que en /resolver
+    problema = {
+        "metodo": "doblefase",
+        "variables": 2,
+        "tipo": "max",
+        "coeficientes": [2e6, 1e6 + 1e-7],
+        "restricciones": [{"coeficientes": [2, 1], "signo": "leq", "c": 1}],
+        "traza": "none",
+        "sensibilidad": False
+    }
+    individual = cliente.post('/resolver', json=problema).get_json()
+    lote = cliente.post('/resolver/batch', json={"problemas": [problema, problema]}).get_json()
+    for item in lote["resultados"]:
+        assert item["respuesta"]["variables"] == individual["variables"]
+
+
+def _problemas_aleatorios(cantidad, semilla=0):
+    # Misma estructura (leq, geq, leq, eq); algunos escalados, infactibles o con costos que
+    # hacen dual factible la base de holguras (en /resolver van por el simplex dual)
+    rng = np.random.default_rng(semilla)
+    problemas = []
+    for k in range(cantidad):
+        A = rng.integers(1, 10, size=(4, 3)).astype(float)
+        if k % 3 == 2:
+            A[0] *= 1e5  # fuerza el escalado automático
+        x = rng.uniform(0.5, 2.0, size=3)
+        b = A @ x + np.array([5.0, -2.0, 5.0, 0.0])
+        if k % 5 == 4:
+            b[1] = 1e3 * A[1].sum()
+        restricciones = [{"coeficientes": fila.tolist(), "signo": signo, "c": float(ld)}
+                         for fila, signo, ld in zip(A, ("leq", "geq", "leq", "eq"), b)]
+        problemas.append({
+            "metodo": "doblefase",
+            "variables": 3,
+            "tipo": "max",
+            "coeficientes": (-rng.integers(1, 10, size=3) if k % 4 == 3 else rng.integers(-5, 10, size=3)).tolist(),
+            "restricciones": restricciones[:3] if k % 2 else restricciones,
+            "traza": "none",
+            "sensibilidad": False
+        })
+    return problemas
+
+
+def test_lote_apilado_igual_a_resolver(cliente):
+    problemas = _problemas_aleatorios(20)
+    lote = cliente.post('/resolver/batch', json={"problemas": problemas}).get_json()
+    assert lote["resumen"]["apilados"] == len(problemas)
+    for problema, item in zip(problemas, lote["resultados"]):
+        individual = cliente.post('/resolver', json=problema)
+        assert item["status"] == individual.status_code
+        esperado, obtenido = individual.get_json(), item["respuesta"]
+        assert obtenido.keys() == esperado.keys()
+        assert obtenido.get("problema_info") == esperado.get("problema_info")
+        assert obtenido.get("base") == esperado.get("base")
+        for clave in ("valor_optimo", "variables"):
+            assert np.allclose(obtenido.get(clave, 0.0), esperado.get(clave, 0.0))
+
+
+def test_lote_con_sensibilidad_no_se_apila(cliente):
+    problema = dict(BEALE, sensibilidad=True)
+    lote = cliente.post('/resolver/batch', json={"problemas": [problema, problema]}).get_json()
+    assert lote["resumen"]["apilados"] == 0
+    individual = cliente.post('/resolver', json=problema).get_json()
+    assert lote["resultados"][0]["respuesta"]["sensibilidad"] == individual["sensibilidad"]
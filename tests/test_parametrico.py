@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+
+def _highs(problema, b):
+    # Valor óptimo de referencia con HiGHS (None si es infactible)
+    A = np.array([r["coeficientes"] for r in problema["restricciones"]], dtype=float)
+    signos = np.array([r["signo"] for r in problema["restricciones"]])
+    signo_z = -1.0 if problema["tipo"] == "max" else 1.0
+    A_ub = np.vstack([A[signos == "leq"], -A[signos == "geq"]])
+    b_ub = np.concatenate([b[signos == "leq"], -b[signos == "geq"]])
+    res = linprog(signo_z * np.asarray(problema["coeficientes"], dtype=float), A_ub=A_ub, b_ub=b_ub,
+                  A_eq=A[signos == "eq"] if (signos == "eq").any() else None,
+                  b_eq=b[signos == "eq"] if (signos == "eq").any() else None, method="highs")
+    return signo_z * res.fun if res.status == 0 else None
+
+
+@pytest.mark.parametrize("restricciones, direccion", [
+    # LD negativo desde t0: x1 + x2 >= 2 + t escrito como <=
+    ([{"coeficientes": [-1, -1], "signo": "leq", "c": -2},
+      {"coeficientes": [1, 0], "signo": "leq", "c": 3},
+      {"coeficientes": [0, 1], "signo": "leq", "c": 3}], [-1, 0, 0]),
+    # LD que cruza a negativo durante el barrido: x1 + x2 >= 1 - t
+    ([{"coeficientes": [1, 1], "signo": "geq", "c": 1},
+      {"coeficientes": [1, 0], "signo": "leq", "c": 3},
+      {"coeficientes": [1, 2], "signo": "geq", "c": 0.5}], [-1, 0, 0]),
+])
+def test_parametrico_ld_negativo(cliente, restricciones, direccion):
+    problema = {"metodo": "doblefase", "variables": 2, "tipo": "min", "coeficientes": [1, 1.5],
+                "restricciones": restricciones}
+    d = np.array(direccion, dtype=float)
+    b = np.array([r["c"] for r in restricciones], dtype=float)
+    respuesta = cliente.post('/resolver/parametrico', json=dict(
+        problema, parametrico={"objetivo": "ld", "direccion": direccion, "desde": 0, "hasta": 3})).get_json()
+
+    assert respuesta["estado"] == "Óptimo encontrado"
+    assert respuesta["limite"] is None
+    for tramo in respuesta["tramos"]:
+        assert min(tramo["x_desde"]) >= -1e-9
+        for t, valor in ((tramo["desde"], tramo["valor_desde"]), (tramo["hasta"], tramo["valor_hasta"])):
+            assert valor == pytest.approx(_highs(problema, b + t * d), abs=1e-8)
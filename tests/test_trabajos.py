@@ -0,0 +1,117 @@
+import os
+import threading
+import time
+
+from backend.Trabajos import JobManager
+
+
+def _esperar(manager, job_id, limite=5.0):
+    fin = time.time() + limite
+    while time.time() < fin:
+        job = manager.get(job_id)
+        if job is not None and job.respuesta is not None:
+            return job
+        time.sleep(0.01)
+    raise AssertionError("El trabajo no terminó")
+
+
+def test_trabajo_visible_desde_otro_manager(tmp_path):
+    # Dos JobManager sobre el mismo archivo equivalen a dos workers de gunicorn
+    path = str(tmp_path / "trabajos.sqlite3")
+    liberar = threading.Event()
+
+    def resolver(data, progress):
+        progress({"phase": 1, "iteration": 3})
+        liberar.wait(5)
+        return {"valor_optimo": data["x"] * 2}, 200
+
+    worker_a = JobManager(resolver, path=path, intervalo_progreso=0.0)
+    worker_b = JobManager(resolver, path=path)
+    job = worker_a.submit({"x": 21})
+
+    en_curso = worker_b.get(job.id)
+    assert en_curso is not None and en_curso.respuesta is None
+    liberar.set()
+    terminado = _esperar(worker_b, job.id)
+    assert terminado.respuesta == ({"valor_optimo": 42}, 200)
+    assert terminado.to_dict()["estado"] == "terminado"
+    assert terminado.progreso == {"phase": 1, "iteration": 3}
+
+
+def test_pendientes_y_ttl_compartidos(tmp_path):
+    path = str(tmp_path / "trabajos.sqlite3")
+    liberar = threading.Event()
+
+    def resolver(data, progress):
+        liberar.wait(5)
+        return {}, 200
+
+    worker_a = JobManager(resolver, path=path, ttl=0.0, max_pendientes=1)
+    worker_b = JobManager(resolver, path=path, ttl=0.0, max_pendientes=1)
+    job = worker_a.submit({})
+    assert worker_b.submit({}) is None
+    liberar.set()
+    worker_a._pool.shutdown(wait=True)
+    # Con ttl 0 el trabajo terminado se elimina en la siguiente consulta
+    assert worker_b.get(job.id) is None
+    assert worker_b.submit({}) is not None
+
+
+def _insertar_en_curso(manager, job_id, pid, equipo=None, arranque=None, inicio=None):
+    # Trabajo sin terminar de otro proceso; por defecto del mismo equipo y arranque
+    propio_equipo, propio_arranque, _ = manager._proceso
+    with manager._lock:
+        manager._conexion().execute(
+            "INSERT INTO trabajos (id, estado, creado, pid, equipo, arranque, inicio) "
+            "VALUES (?, 'en_curso', 0, ?, ?, ?, ?)",
+            (job_id, pid, equipo or propio_equipo, propio_arranque if arranque is None else arranque, inicio))
+
+
+def test_trabajo_de_proceso_terminado(tmp_path):
+    manager = JobManager(lambda data, progress: ({}, 200), path=str(tmp_path / "trabajos.sqlite3"))
+    manager.get("x")  # crea la tabla
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0)
+    os.waitpid(pid, 0)
+    _insertar_en_curso(manager, "huerfano", pid)
+    job = manager.get("huerfano")
+    assert job.estado == "terminado" and job.respuesta[1] == 500
+
+
+def test_pid_reutilizado_y_arranque_anterior(tmp_path):
+    manager = JobManager(lambda data, progress: ({}, 200), path=str(tmp_path / "trabajos.sqlite3"))
+    manager.get("x")
+    # Mismo PID que un proceso vivo pero con otro inicio: el PID se reutilizó
+    _insertar_en_curso(manager, "reutilizado", os.getpid(), inicio="-1")
+    # PID vivo en este equipo, pero de un arranque anterior
+    _insertar_en_curso(manager, "rearranque", os.getpid(), arranque="arranque-anterior", inicio=manager._proceso[2])
+    _insertar_en_curso(manager, "vivo", os.getpid(), inicio=manager._proceso[2])
+    assert manager.get("reutilizado").respuesta[1] == 500
+    assert manager.get("rearranque").respuesta[1] == 500
+    assert manager.get("vivo").estado == "en_curso"
+
+
+def test_trabajos_de_otro_equipo_no_se_tocan(tmp_path):
+    manager = JobManager(lambda data, progress: ({}, 200), path=str(tmp_path / "trabajos.sqlite3"))
+    manager.get("x")
+    # El PID no existe aquí, pero el trabajo corre en otro equipo con el mismo volumen
+    _insertar_en_curso(manager, "remoto", 2 ** 22 + 1, equipo="otro-equipo", arranque="otro", inicio="1")
+    assert manager.get("remoto").estado == "en_curso"
+
+
+def test_api_jobs(cliente):
+    problema = {"metodo": "doblefase", "variables": 2, "tipo": "max", "coeficientes": [3, 5],
+                "restricciones": [{"coeficientes": [1, 0], "signo": "leq", "c": 4},
+                                  {"coeficientes": [0, 2], "signo": "leq", "c": 12},
+                                  {"coeficientes": [3, 2], "signo": "leq", "c": 18}]}
+    creado = cliente.post('/jobs', json=problema)
+    assert creado.status_code == 202
+    fin = time.time() + 10
+    while True:
+        resultado = cliente.get(f"/jobs/{creado.get_json()['id']}/result")
+        if resultado.status_code != 202 or time.time() > fin:
+            break
+        time.sleep(0.02)
+    assert resultado.status_code == 200
+    assert resultado.get_json()["valor_optimo"] == cliente.post('/resolver', json=problema).get_json()["valor_optimo"]